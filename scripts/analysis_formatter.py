@@ -14,6 +14,9 @@ Usage:
 import argparse
 import re
 import sys
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
@@ -27,6 +30,9 @@ import yaml
 BARE_CLAIM_ID_RE = re.compile(r"^([A-Z]+-\d{4}-\d{3})$")
 LINKED_CLAIM_ID_RE = re.compile(r"^\[([A-Z]+-\d{4}-\d{3})\]\(([^)]+)\)$")
 MARKDOWN_WRAPPER_MARKERS = ("**", "__", "`", "*", "_")
+WHITESPACE_RUN_RE = re.compile(r"\s+")
+# A table row made only of pipes, dashes, colons and whitespace (same rows as _is_table_separator_row)
+TABLE_SEPARATOR_RE = re.compile(r"\|[\s|:-]*")
 
 
 def _strip_simple_markdown_wrappers(text: str) -> str:
@@ -86,49 +92,54 @@ def is_linked_claim_id(cell_text: str) -> bool:
 
 def _normalize_column_name(name: str) -> str:
     cleaned = _strip_simple_markdown_wrappers(name)
-    return re.sub(r"\s+", " ", cleaned.strip().lower())
+    return WHITESPACE_RUN_RE.sub(" ", cleaned.strip().lower())
+
+
+KEY_CLAIMS_COLUMNS = frozenset({"#", "claim", "claim id", "type", "domain"})
+CLAIM_SUMMARY_BASE_COLUMNS = frozenset({"id", "type", "domain"})
+CLAIM_SUMMARY_EVIDENCE_COLUMNS = frozenset({"evidence", "evid"})
+CLAIM_SUMMARY_CREDENCE_COLUMNS = frozenset({"credence", "conf"})
+
+
+def _is_key_claims_header(columns: set[str]) -> bool:
+    return KEY_CLAIMS_COLUMNS.issubset(columns)
+
+
+def _is_claim_summary_header(columns: set[str]) -> bool:
+    return (
+        CLAIM_SUMMARY_BASE_COLUMNS.issubset(columns)
+        and bool(columns & CLAIM_SUMMARY_EVIDENCE_COLUMNS)
+        and bool(columns & CLAIM_SUMMARY_CREDENCE_COLUMNS)
+    )
+
+
+def _table_header_columns(line: str, next_line: str) -> set[str] | None:
+    """Normalized column names if `line` is a table row directly followed by a separator row.
+
+    Only header rows are split into cells; the separator test is a single pattern match.
+    """
+    if not line.lstrip().startswith("|") or not TABLE_SEPARATOR_RE.fullmatch(next_line.strip()):
+        return None
+    return {_normalize_column_name(cell) for cell in _split_md_table_row(line)}
+
+
+def _iter_table_headers(content: str) -> Iterator[set[str]]:
+    """Yield the normalized column names of every table header row (a row followed by a separator)."""
+    lines = content.splitlines()
+    for line, next_line in zip(lines, lines[1:]):
+        columns = _table_header_columns(line, next_line)
+        if columns is not None:
+            yield columns
 
 
 def has_key_claims_table(content: str) -> bool:
     """Return True if content contains a Key Claims table with required columns."""
-    required = {"#", "claim", "claim id", "type", "domain"}
-    lines = content.splitlines()
-    for idx in range(len(lines) - 1):
-        header_cells = _split_md_table_row(lines[idx])
-        if not header_cells:
-            continue
-        sep_cells = _split_md_table_row(lines[idx + 1])
-        if not _is_table_separator_row(sep_cells):
-            continue
-        normalized = {_normalize_column_name(cell) for cell in header_cells}
-        if required.issubset(normalized):
-            return True
-    return False
+    return any(_is_key_claims_header(columns) for columns in _iter_table_headers(content))
 
 
 def has_claim_summary_table(content: str) -> bool:
     """Return True if content contains a Claim Summary table with required columns."""
-    required_base = {"id", "type", "domain"}
-    evidence_candidates = {"evidence", "evid"}
-    credence_candidates = {"credence", "conf"}
-
-    lines = content.splitlines()
-    for idx in range(len(lines) - 1):
-        header_cells = _split_md_table_row(lines[idx])
-        if not header_cells:
-            continue
-        sep_cells = _split_md_table_row(lines[idx + 1])
-        if not _is_table_separator_row(sep_cells):
-            continue
-        normalized = {_normalize_column_name(cell) for cell in header_cells}
-        if not required_base.issubset(normalized):
-            continue
-        if not (normalized & evidence_candidates):
-            continue
-        if not (normalized & credence_candidates):
-            continue
-        return True
-    return False
+    return any(_is_claim_summary_header(columns) for columns in _iter_table_headers(content))
 
 
 # =============================================================================
@@ -274,6 +285,28 @@ FULL_SECTIONS = {
 """,
 }
 
+METADATA_SECTION = "\n## Metadata\n\n| Field | Value |\n|-------|-------|\n| **Source ID** | [id] |\n| **Title** | [title] |\n\n"
+SUMMARY_SECTION = "\n## Summary\n\n[Brief summary of the source]\n"
+
+# Template inserted by `insert_missing_sections` for each section it knows; table sections
+# start empty and are filled in by their own inserters
+SECTION_TEMPLATES = {
+    **FULL_SECTIONS,
+    "## Metadata": METADATA_SECTION,
+    "## Summary": SUMMARY_SECTION,
+    **{section: f"\n{section}\n\n" for section in ("### Key Claims", "### Claim Summary", "### Claims to Register")},
+}
+
+# Bodies inserted under an existing header when no claims are available
+KEY_CLAIMS_TABLE_ROWS = """
+| # | Claim | Claim ID | Layer | Actor | Scope | Quantifier | Type | Domain | Evid | Credence | Verified? | Falsifiable By |
+|---|-------|----------|-------|-------|-------|------------|------|--------|------|----------|-----------|----------------|
+| 1 | [claim text] | DOMAIN-YYYY-NNN | ASSERTED/LAWFUL/PRACTICED/EFFECT | ICE/CBP/DHS/DOJ/COURT/OTHER | who=...; where=...; when=... | none/some/often/most/always/OTHER:<...> | [F/T/H/P/A/C/S/X] | DOMAIN | E1-E6 | 0.00-1.00 | [source or ?] | [what would refute] |
+
+"""
+CLAIM_SUMMARY_TABLE_ROWS = CLAIM_SUMMARY_TABLE.replace("### Claim Summary\n\n", "", 1)
+CLAIMS_YAML_PLACEHOLDER = CLAIMS_YAML_BLOCK.split("```yaml\n", 1)[-1].rsplit("\n```", 1)[0] + "\n"
+
 # Section order for full profile (for proper insertion)
 FULL_SECTION_ORDER = [
     "## Metadata",
@@ -304,6 +337,28 @@ QUICK_SECTION_ORDER = [
     "### Claims to Register",
 ]
 
+# Every header the formatter looks for; `scan_content` records which of these are present
+TRACKED_SECTIONS = tuple(dict.fromkeys([
+    *FULL_SECTION_ORDER,
+    *QUICK_SECTION_ORDER,
+    "### Corrections & Updates",
+    "### Disconfirming Evidence Search",
+    "## Stage 3",
+]))
+TRACKED_SECTION_KEYS = tuple((section, section.lower()) for section in TRACKED_SECTIONS)
+
+# Every tracked header starts with "##"; its first SECTION_PREFIX_LEN characters pick the
+# few headers worth comparing at each "##" in a line
+SECTION_PREFIX_LEN = 6
+SECTION_KEYS_BY_PREFIX = {
+    prefix: tuple(item for item in TRACKED_SECTION_KEYS if item[1].startswith(prefix))
+    for prefix in {key[:SECTION_PREFIX_LEN] for _, key in TRACKED_SECTION_KEYS}
+}
+
+# Sections `format_text` adds when missing, per profile
+REQUIRED_QUICK_SECTIONS = frozenset(QUICK_SECTION_ORDER)
+REQUIRED_FULL_SECTIONS = frozenset((*FULL_SECTION_ORDER, "### Corrections & Updates"))
+
 LEGACY_HEADING_REWRITES: list[tuple[re.Pattern[str], str]] = [
     # Stage headings (legacy variants)
     (re.compile(r"^##\s*Stage\s*1:\s*Descriptive\s*Summary\s*$", re.IGNORECASE | re.MULTILINE),
@@ -324,34 +379,152 @@ LEGACY_HEADING_REWRITES: list[tuple[re.Pattern[str], str]] = [
      "### Claim Summary"),
 ]
 
+# Detection patterns, compiled once at import
+QUICK_PROFILE_RE = re.compile(r"\*\*Analysis Depth\*\*.*quick", re.IGNORECASE)
+LEGENDS_RE = re.compile(r">\s*\*\*Claim types\*\*:")
+CLAIMS_YAML_FENCE = "```yaml"
+# What must follow the fence for it to open a claims block
+CLAIMS_YAML_TAIL_RE = re.compile(r"\s*\nclaims:")
+# Support both old "Confidence" and new "Credence" terminology
+CREDENCE_MARKERS = ("**Credence in Analysis**:", "**Confidence in Analysis**:")
+TITLE_LINE_RE = re.compile(r"^# .+\n", re.MULTILINE)
+NEXT_HEADER_RE = re.compile(r"\n##")
+NEXT_SUBSECTION_RE = re.compile(r"\n###\s+")
+YAML_CLAIMS_KEY_RE = re.compile(r"^claims:\s*$", re.MULTILINE)
+EXCESS_BLANK_LINES_RE = re.compile(r"\n{4,}")
+# Characters re.IGNORECASE equates with ASCII "i"/"s" that str.lower() leaves distinct
+CASE_FOLD_EXCEPTIONS = ("\u0130", "\u0131", "\u017f")
+
+
+@lru_cache(maxsize=None)
+def _section_pattern(section: str) -> re.Pattern[str]:
+    """Case-insensitive pattern matching a section header anywhere in the content."""
+    return re.compile(re.escape(section), re.IGNORECASE)
+
+
+@lru_cache(maxsize=None)
+def _section_line_pattern(section: str) -> re.Pattern[str]:
+    """Case-insensitive pattern matching a section header through the end of its line."""
+    return re.compile(re.escape(section) + r"\s*\n", re.IGNORECASE)
+
 
 def detect_profile(content: str) -> str:
     """Detect the analysis profile from the content."""
-    if re.search(r"\*\*Analysis Depth\*\*.*quick", content, re.IGNORECASE):
+    if QUICK_PROFILE_RE.search(content):
         return "quick"
     return "full"
 
 
 def has_legends(content: str) -> bool:
     """Check if the content has the legends block."""
-    return bool(re.search(r">\s*\*\*Claim types\*\*:", content))
+    return bool(LEGENDS_RE.search(content))
+
+
+def _contains_section(text: str, lowered: str, section: str) -> bool:
+    """Case-insensitive substring test of `section` in `text`, given `lowered = text.lower()`.
+
+    Matches exactly what the IGNORECASE section pattern finds; the pattern only runs when
+    `text` holds one of the few characters that lowercasing cannot equate.
+    """
+    if section.lower() in lowered:
+        return True
+    return any(ch in text for ch in CASE_FOLD_EXCEPTIONS) and bool(_section_pattern(section).search(text))
 
 
 def has_section(content: str, section: str) -> bool:
-    """Check if a section header exists."""
-    pattern = re.escape(section)
-    return bool(re.search(pattern, content, re.IGNORECASE))
+    """Check if a section header exists (case-insensitive)."""
+    return _contains_section(content, content.lower(), section)
+
+
+def _line_sections(line: str) -> Iterator[str]:
+    """Yield the tracked sections that `has_section` would find within a single line.
+
+    Each tracked header is compared with `startswith` only at the offsets where "##"
+    occurs, against the headers sharing its prefix.
+    """
+    lowered = line.lower()
+    pos = lowered.find("##")
+    while pos != -1:
+        for section, key in SECTION_KEYS_BY_PREFIX.get(lowered[pos:pos + SECTION_PREFIX_LEN], ()):
+            if lowered.startswith(key, pos):
+                yield section
+        pos = lowered.find("##", pos + 1)
+    if any(ch in line for ch in CASE_FOLD_EXCEPTIONS):
+        yield from (section for section in TRACKED_SECTIONS if _section_pattern(section).search(line))
 
 
 def has_claims_yaml(content: str) -> bool:
-    """Check if the claims YAML block exists."""
-    return bool(re.search(r"```yaml\s*\nclaims:", content))
+    """Check if the claims YAML block exists.
+
+    Fences are located with `str.find`; only the text right after each ```yaml fence is
+    matched against a pattern, so the content is never scanned by the regex engine.
+    """
+    pos = content.find(CLAIMS_YAML_FENCE)
+    while pos != -1:
+        if CLAIMS_YAML_TAIL_RE.match(content, pos + len(CLAIMS_YAML_FENCE)):
+            return True
+        pos = content.find(CLAIMS_YAML_FENCE, pos + 1)
+    return False
 
 
 def has_credence(content: str) -> bool:
-    """Check if the credence score exists."""
-    # Support both old "Confidence" and new "Credence" terminology
-    return bool(re.search(r"\*\*(Confidence|Credence) in Analysis\*\*:", content))
+    """Check if the credence score exists (plain substring checks, no regex)."""
+    return any(marker in content for marker in CREDENCE_MARKERS)
+
+
+@dataclass(frozen=True)
+class ScanResult:
+    """Everything the formatter checks for in one version of the content (see `scan_content`)."""
+
+    profile: str
+    has_legends: bool
+    has_claims_yaml: bool
+    has_credence: bool
+    has_key_claims_table: bool
+    has_claim_summary_table: bool
+    # Start of the first line containing each tracked section that is present
+    section_offsets: dict[str, int]
+
+    @property
+    def sections(self) -> frozenset[str]:
+        return frozenset(self.section_offsets)
+
+    def has_section(self, section: str) -> bool:
+        """Same answer as `has_section(content, section)` for any section in TRACKED_SECTIONS."""
+        return section in self.section_offsets
+
+
+def scan_content(content: str) -> ScanResult:
+    """Collect every marker the formatter needs in one walk over the content's lines.
+
+    Section headers are only looked for on lines containing "##", and only table header
+    rows are split into cells, once for both table checks. The legends, YAML and credence
+    markers may span a line break, so each is found with its compiled pattern instead.
+    Lines keep their line breaks so header offsets can be counted; every check strips them.
+    """
+    section_offsets: dict[str, int] = {}
+    has_key_claims = has_claim_summary = False
+    lines = content.splitlines(keepends=True)
+    offset = 0
+    for idx, line in enumerate(lines):
+        if "##" in line:
+            for section in _line_sections(line):
+                section_offsets.setdefault(section, offset)
+        offset += len(line)
+        if idx + 1 < len(lines):
+            columns = _table_header_columns(line, lines[idx + 1])
+            if columns is not None:
+                has_key_claims = has_key_claims or _is_key_claims_header(columns)
+                has_claim_summary = has_claim_summary or _is_claim_summary_header(columns)
+    return ScanResult(
+        profile=detect_profile(content),
+        has_legends=has_legends(content),
+        has_claims_yaml=has_claims_yaml(content),
+        has_credence=has_credence(content),
+        has_key_claims_table=has_key_claims,
+        has_claim_summary_table=has_claim_summary,
+        section_offsets=section_offsets,
+    )
 
 
 def normalize_legacy_headings(content: str) -> tuple[str, list[str]]:
@@ -489,7 +662,7 @@ def extract_claims_from_key_claims_table(content: str) -> list[dict]:
 
 
 def _collapse_ws(text: str) -> str:
-    return re.sub(r"\s+", " ", text).strip()
+    return WHITESPACE_RUN_RE.sub(" ", text).strip()
 
 
 def build_claim_summary_table(claims: list[dict]) -> str:
@@ -531,7 +704,7 @@ def _extract_claims_block_from_yaml_file(yaml_path: Path) -> str | None:
     except Exception:
         return None
 
-    match = re.search(r"^claims:\s*$", text, re.MULTILINE)
+    match = YAML_CLAIMS_KEY_RE.search(text)
     if not match:
         return None
     return text[match.start():].rstrip() + "\n"
@@ -605,19 +778,43 @@ def build_claims_yaml_block(claims: list[dict], source_id: str) -> str:
     return "### Claims to Register\n\n```yaml\n" + yaml_text.rstrip() + "\n```\n\n"
 
 
-def find_section_position(content: str, section: str, section_order: list[str]) -> int:
+def _splice(content: str, pos: int, *parts: str) -> str:
+    """Return content with parts inserted at pos, built in a single join."""
+    return "".join((content[:pos], *parts, content[pos:]))
+
+
+def _search_section(
+    pattern: re.Pattern[str], content: str, section: str, section_offsets: Mapping[str, int]
+) -> re.Match[str] | None:
+    """Search for a pattern that only matches where `section` occurs, from the section's offset.
+
+    A section missing from `section_offsets` is absent, so the content is not searched at all.
+    """
+    offset = section_offsets.get(section)
+    return None if offset is None else pattern.search(content, offset)
+
+
+def find_section_position(
+    content: str,
+    section: str,
+    section_order: list[str],
+    section_offsets: Mapping[str, int] | None = None,
+) -> int:
     """Find the position where a section should be inserted.
 
     Returns the character position where the section should be inserted,
-    based on the order of sections in section_order.
+    based on the order of sections in section_order. `section_offsets` (as in
+    `ScanResult`) limits the searches to the sections present, starting where each occurs.
     """
     section_idx = section_order.index(section) if section in section_order else -1
     if section_idx == -1:
         return len(content)
+    if section_offsets is None:
+        section_offsets = dict.fromkeys(section_order, 0)
 
     # Find the next existing section after this one
     for next_section in section_order[section_idx + 1:]:
-        match = re.search(re.escape(next_section), content, re.IGNORECASE)
+        match = _search_section(_section_pattern(next_section), content, next_section, section_offsets)
         if match:
             # Insert before the next section (find the start of its line)
             pos = match.start()
@@ -631,45 +828,47 @@ def find_section_position(content: str, section: str, section_order: list[str])
 
     # If no next section found, find the previous section and insert after it
     for prev_section in reversed(section_order[:section_idx]):
-        match = re.search(re.escape(prev_section), content, re.IGNORECASE)
+        match = _search_section(_section_pattern(prev_section), content, prev_section, section_offsets)
         if match:
             # Find the end of this section (next ## or ### or end of file)
             section_start = match.end()
-            next_header = re.search(r'\n##', content[section_start:])
+            next_header = NEXT_HEADER_RE.search(content, section_start)
             if next_header:
-                return section_start + next_header.start()
+                return next_header.start()
             return len(content)
 
     return len(content)
 
 
-def insert_legends(content: str) -> str:
+def insert_legends(content: str, scan: ScanResult | None = None) -> str:
     """Insert legends block after the title."""
-    if has_legends(content):
+    scan = scan or scan_content(content)
+    if scan.has_legends:
         return content
 
     # Find the first # heading (title)
-    match = re.search(r'^# .+\n', content, re.MULTILINE)
+    match = TITLE_LINE_RE.search(content)
     if match:
         insert_pos = match.end()
-        return content[:insert_pos] + "\n" + LEGENDS + "\n" + content[insert_pos:]
+        return _splice(content, insert_pos, "\n", LEGENDS, "\n")
 
     # No title found, prepend
-    return LEGENDS + "\n" + content
+    return "".join((LEGENDS, "\n", content))
 
 
-def insert_key_claims_table(content: str) -> str:
+def insert_key_claims_table(content: str, scan: ScanResult | None = None) -> str:
     """Insert Key Claims table if missing (full profile only).
 
     Uses rigor-v1 format with Layer/Actor/Scope/Quantifier columns.
     """
-    if has_key_claims_table(content):
+    scan = scan or scan_content(content)
+    if scan.has_key_claims_table:
         return content
 
     # Insert after ### Key Claims header, or create the section
-    if has_section(content, "### Key Claims"):
+    if scan.has_section("### Key Claims"):
         # Find the header and insert table after it
-        match = re.search(r"### Key Claims\s*\n", content, re.IGNORECASE)
+        match = _search_section(_section_line_pattern("### Key Claims"), content, "### Key Claims", scan.section_offsets)
         if match:
             insert_pos = match.end()
             # Check if there's already content (skip if so, but allow insertion before next section)
@@ -685,21 +884,14 @@ def insert_key_claims_table(content: str) -> str:
                 todo_end = content.find('\n', insert_pos)
                 if todo_end != -1:
                     content = content[:insert_pos] + content[todo_end + 1:]
-                    match = re.search(r"### Key Claims\s*\n", content, re.IGNORECASE)
+                    match = _search_section(_section_line_pattern("### Key Claims"), content, "### Key Claims", scan.section_offsets)
                     if match:
                         insert_pos = match.end()
-            # Rigor-v1 table format
-            table_content = """
-| # | Claim | Claim ID | Layer | Actor | Scope | Quantifier | Type | Domain | Evid | Credence | Verified? | Falsifiable By |
-|---|-------|----------|-------|-------|-------|------------|------|--------|------|----------|-----------|----------------|
-| 1 | [claim text] | DOMAIN-YYYY-NNN | ASSERTED/LAWFUL/PRACTICED/EFFECT | ICE/CBP/DHS/DOJ/COURT/OTHER | who=...; where=...; when=... | none/some/often/most/always/OTHER:<...> | [F/T/H/P/A/C/S/X] | DOMAIN | E1-E6 | 0.00-1.00 | [source or ?] | [what would refute] |
-
-"""
-            return content[:insert_pos] + table_content + content[insert_pos:]
+            return _splice(content, insert_pos, KEY_CLAIMS_TABLE_ROWS)
 
     # Need to create the section - find position
-    pos = find_section_position(content, "### Key Claims", FULL_SECTION_ORDER)
-    return content[:pos] + "\n" + KEY_CLAIMS_TABLE + content[pos:]
+    pos = find_section_position(content, "### Key Claims", FULL_SECTION_ORDER, scan.section_offsets)
+    return _splice(content, pos, "\n", KEY_CLAIMS_TABLE)
 
 
 def has_corrections_updates(content: str) -> bool:
@@ -707,55 +899,60 @@ def has_corrections_updates(content: str) -> bool:
     return has_section(content, "### Corrections & Updates")
 
 
-def insert_corrections_updates_table(content: str) -> str:
+def insert_corrections_updates_table(content: str, scan: ScanResult | None = None) -> str:
     """Insert Corrections & Updates table if missing (full profile only)."""
-    if has_corrections_updates(content):
+    scan = scan or scan_content(content)
+    if scan.has_section("### Corrections & Updates"):
         return content
 
     # Insert after Disconfirming Evidence Search section (in Stage 2)
-    if has_section(content, "### Disconfirming Evidence Search"):
+    if scan.has_section("### Disconfirming Evidence Search"):
         # Find the section and look for the next ### header
-        match = re.search(r"### Disconfirming Evidence Search", content, re.IGNORECASE)
+        match = _search_section(_section_pattern("### Disconfirming Evidence Search"), content, "### Disconfirming Evidence Search", scan.section_offsets)
         if match:
             # Find the next ### section after this one
-            remaining_content = content[match.end():]
-            next_section = re.search(r"\n###\s+", remaining_content)
+            next_section = NEXT_SUBSECTION_RE.search(content, match.end())
             if next_section:
-                insert_pos = match.end() + next_section.start()
+                insert_pos = next_section.start()
                 # Insert before the next section
-                return content[:insert_pos] + "\n" + CORRECTIONS_UPDATES_TABLE + content[insert_pos:]
+                return _splice(content, insert_pos, "\n", CORRECTIONS_UPDATES_TABLE)
 
     # Fallback: insert at end of Stage 2 section or before Stage 3
-    if has_section(content, "## Stage 3"):
-        match = re.search(r"## Stage 3", content, re.IGNORECASE)
+    if scan.has_section("## Stage 3"):
+        match = _search_section(_section_pattern("## Stage 3"), content, "## Stage 3", scan.section_offsets)
         if match:
             # Insert before Stage 3
             insert_pos = match.start()
             while insert_pos > 0 and content[insert_pos - 1] == '\n':
                 insert_pos -= 1
-            return content[:insert_pos] + "\n\n" + CORRECTIONS_UPDATES_TABLE + "\n" + content[insert_pos:]
+            return _splice(content, insert_pos, "\n\n", CORRECTIONS_UPDATES_TABLE, "\n")
 
     # Last resort: append before Claim Summary
-    if has_section(content, "### Claim Summary"):
-        match = re.search(r"### Claim Summary", content, re.IGNORECASE)
+    if scan.has_section("### Claim Summary"):
+        match = _search_section(_section_pattern("### Claim Summary"), content, "### Claim Summary", scan.section_offsets)
         if match:
             insert_pos = match.start()
             while insert_pos > 0 and content[insert_pos - 1] == '\n':
                 insert_pos -= 1
-            return content[:insert_pos] + "\n\n" + CORRECTIONS_UPDATES_TABLE + "\n" + content[insert_pos:]
+            return _splice(content, insert_pos, "\n\n", CORRECTIONS_UPDATES_TABLE, "\n")
 
     # No suitable location found, return unchanged
     return content
 
 
-def insert_claim_summary_table(content: str, claims: list[dict] | None = None) -> str:
+def insert_claim_summary_table(
+    content: str,
+    claims: list[dict] | None = None,
+    scan: ScanResult | None = None,
+) -> str:
     """Insert Claim Summary table if missing."""
-    if has_claim_summary_table(content):
+    scan = scan or scan_content(content)
+    if scan.has_claim_summary_table:
         return content
 
     # Insert after ### Claim Summary header, or create the section
-    if has_section(content, "### Claim Summary"):
-        match = re.search(r"### Claim Summary\s*\n", content, re.IGNORECASE)
+    if scan.has_section("### Claim Summary"):
+        match = _search_section(_section_line_pattern("### Claim Summary"), content, "### Claim Summary", scan.section_offsets)
         if match:
             insert_pos = match.end()
             remaining = content[insert_pos:insert_pos + 50]
@@ -772,17 +969,19 @@ def insert_claim_summary_table(content: str, claims: list[dict] | None = None) -
                 if todo_end != -1:
                     content = content[:insert_pos] + content[todo_end + 1:]
                     # Recompute insert position after modifying content
-                    match = re.search(r"### Claim Summary\s*\n", content, re.IGNORECASE)
+                    match = _search_section(_section_line_pattern("### Claim Summary"), content, "### Claim Summary", scan.section_offsets)
                     if match:
                         insert_pos = match.end()
-            table_content = "\n" + build_claim_summary_table(claims or []).replace("### Claim Summary\n\n", "", 1)
-            return content[:insert_pos] + table_content + content[insert_pos:]
+            if claims:
+                rows = build_claim_summary_table(claims).replace("### Claim Summary\n\n", "", 1)
+            else:
+                rows = CLAIM_SUMMARY_TABLE_ROWS
+            return _splice(content, insert_pos, "\n", rows)
 
     # Need to create the section
-    profile = detect_profile(content)
-    section_order = QUICK_SECTION_ORDER if profile == "quick" else FULL_SECTION_ORDER
-    pos = find_section_position(content, "### Claim Summary", section_order)
-    return content[:pos] + "\n" + build_claim_summary_table(claims or []) + content[pos:]
+    section_order = QUICK_SECTION_ORDER if scan.profile == "quick" else FULL_SECTION_ORDER
+    pos = find_section_position(content, "### Claim Summary", section_order, scan.section_offsets)
+    return _splice(content, pos, "\n", build_claim_summary_table(claims or []))
 
 
 def insert_claims_yaml(
@@ -790,145 +989,194 @@ def insert_claims_yaml(
     claims_yaml: str | None = None,
     claims: list[dict] | None = None,
     source_id: str | None = None,
+    scan: ScanResult | None = None,
 ) -> str:
     """Insert Claims YAML block if missing."""
-    if has_claims_yaml(content):
+    scan = scan or scan_content(content)
+    if scan.has_claims_yaml:
         return content
 
     yaml_body = claims_yaml
-    if yaml_body is None:
-        yaml_body = build_claims_yaml_block(claims or [], source_id or "[source-id]").split("```yaml\n", 1)[-1].rsplit("\n```", 1)[0] + "\n"
+    if yaml_body is None and not claims:
+        yaml_body = CLAIMS_YAML_PLACEHOLDER
+    elif yaml_body is None:
+        yaml_body = build_claims_yaml_block(claims, source_id or "[source-id]").split("```yaml\n", 1)[-1].rsplit("\n```", 1)[0] + "\n"
 
-    if has_section(content, "### Claims to Register"):
-        match = re.search(r"### Claims to Register\s*\n", content, re.IGNORECASE)
+    if scan.has_section("### Claims to Register"):
+        match = _search_section(_section_line_pattern("### Claims to Register"), content, "### Claims to Register", scan.section_offsets)
         if match:
             insert_pos = match.end()
-            yaml_content = "\n```yaml\n" + yaml_body.rstrip() + "\n```\n\n"
-            return content[:insert_pos] + yaml_content + content[insert_pos:]
+            return _splice(content, insert_pos, "\n```yaml\n", yaml_body.rstrip(), "\n```\n\n")
 
     # Need to create the section - append at end before confidence
-    profile = detect_profile(content)
-    section_order = QUICK_SECTION_ORDER if profile == "quick" else FULL_SECTION_ORDER
-    pos = find_section_position(content, "### Claims to Register", section_order)
-    block = "### Claims to Register\n\n```yaml\n" + yaml_body.rstrip() + "\n```\n\n"
-    return content[:pos] + "\n" + block + content[pos:]
+    section_order = QUICK_SECTION_ORDER if scan.profile == "quick" else FULL_SECTION_ORDER
+    pos = find_section_position(content, "### Claims to Register", section_order, scan.section_offsets)
+    return _splice(content, pos, "\n### Claims to Register\n\n```yaml\n", yaml_body.rstrip(), "\n```\n\n")
 
 
-def insert_confidence(content: str) -> str:
+def insert_confidence(content: str, scan: ScanResult | None = None) -> str:
     """Insert confidence section if missing (full profile only)."""
-    if has_credence(content):
+    scan = scan or scan_content(content)
+    if scan.has_credence:
         return content
 
     # Append at the end
-    if not content.endswith('\n'):
-        content += '\n'
-    return content + CREDENCE_SECTION
+    separator = "" if content.endswith('\n') else '\n'
+    return "".join((content, separator, CREDENCE_SECTION))
+
 
+def insert_missing_sections(content: str, profile: str, scan: ScanResult | None = None) -> str:
+    """Insert any missing required sections.
 
-def insert_missing_sections(content: str, profile: str) -> str:
-    """Insert any missing required sections."""
+    Section templates never contain another tracked header, so which sections are missing
+    is decided from the content as passed in.
+    """
+    scan = scan or scan_content(content)
     if profile == "quick":
-        required = ["## Metadata", "## Summary", "### Claim Summary", "### Claims to Register"]
+        required = QUICK_SECTION_ORDER
         section_order = QUICK_SECTION_ORDER
     else:
         required = FULL_SECTION_ORDER
         section_order = FULL_SECTION_ORDER
 
+    # Section offsets move with each insertion instead of being rescanned
+    section_offsets = dict(scan.section_offsets)
     for section in required:
-        if not has_section(content, section):
-            if section in FULL_SECTIONS:
-                template = FULL_SECTIONS[section]
-            elif section == "## Metadata":
-                template = "\n## Metadata\n\n| Field | Value |\n|-------|-------|\n| **Source ID** | [id] |\n| **Title** | [title] |\n\n"
-            elif section == "## Summary":
-                template = "\n## Summary\n\n[Brief summary of the source]\n"
-            elif section in {"### Key Claims", "### Claim Summary", "### Claims to Register"}:
-                template = f"\n{section}\n\n"
-            else:
+        if not scan.has_section(section):
+            template = SECTION_TEMPLATES.get(section)
+            if template is None:
                 template = f"\n{section}\n\n[TODO: Complete this section]\n"
 
-            pos = find_section_position(content, section, section_order)
-            content = content[:pos] + template + content[pos:]
+            pos = find_section_position(content, section, section_order, section_offsets)
+            content = _splice(content, pos, template)
+            section_offsets = {
+                name: offset + len(template) if offset >= pos else offset
+                for name, offset in section_offsets.items()
+            }
+            section_offsets[section] = pos
 
     return content
 
 
-def format_file(path: Path, profile: str | None = None, dry_run: bool = False) -> tuple[str, list[str]]:
-    """Format a single analysis file.
+def _is_complete(scan: ScanResult, profile: str) -> bool:
+    """Whether `format_text` would find nothing to insert into the scanned content."""
+    if not (scan.has_legends and scan.has_claim_summary_table and scan.has_claims_yaml):
+        return False
+    if profile == "quick":
+        return REQUIRED_QUICK_SECTIONS <= scan.sections
+    if profile == "full":
+        return scan.has_key_claims_table and scan.has_credence and REQUIRED_FULL_SECTIONS <= scan.sections
+    return frozenset(FULL_SECTION_ORDER) <= scan.sections
+
+
+def format_text(content: str, profile: str | None = None, path: Path | None = None) -> tuple[str, list[str]]:
+    """Format analysis markdown held in memory.
+
+    `path` is the file the content belongs to, if any: its stem becomes the source ID and a
+    sibling `.yaml` file supplies the claims block. Without it, claims come from the Key
+    Claims table only.
 
     Returns:
         Tuple of (formatted_content, list_of_changes_made)
     """
     changes = []
 
-    try:
-        content = path.read_text()
-    except Exception as e:
-        return "", [f"Error reading file: {e}"]
-
-    original = content
-
     # Step 0: Normalize legacy headings to reduce duplication and meet the contract.
     content, normalized_changes = normalize_legacy_headings(content)
     changes.extend(normalized_changes)
 
+    # One scan per version of the content; each step that changes the content rescans it
+    scan = scan_content(content)
+
     # Detect or use specified profile
-    detected_profile = detect_profile(content)
-    actual_profile = profile or detected_profile
-    source_id = path.stem
-    derived_claims, claims_yaml = derive_claims(path, content)
+    actual_profile = profile or scan.profile
+
+    # Already compliant: skip claim derivation and every insertion step
+    if _is_complete(scan, actual_profile):
+        return EXCESS_BLANK_LINES_RE.sub('\n\n\n', content), changes
+
+    if path is not None:
+        source_id = path.stem
+        derived_claims, claims_yaml = derive_claims(path, content)
+    else:
+        source_id = None
+        derived_claims, claims_yaml = extract_claims_from_key_claims_table(content), None
 
     # Step 1: Insert legends if missing
-    if not has_legends(content):
-        content = insert_legends(content)
+    if not scan.has_legends:
+        content = insert_legends(content, scan=scan)
+        scan = scan_content(content)
         changes.append("Added claim types and evidence legends")
 
     # Step 2: Insert missing sections based on profile
     sections_needed = QUICK_SECTION_ORDER if actual_profile == "quick" else FULL_SECTION_ORDER
-    missing_sections = [s for s in sections_needed if not has_section(content, s)]
+    missing_sections = [s for s in sections_needed if not scan.has_section(s)]
     if missing_sections:
-        content = insert_missing_sections(content, actual_profile)
+        content = insert_missing_sections(content, actual_profile, scan=scan)
+        scan = scan_content(content)
         for section in missing_sections:
-            if has_section(content, section):
+            if scan.has_section(section):
                 changes.append(f"Added missing section: {section}")
 
     # Step 3: Insert Key Claims table (full profile only)
     if actual_profile == "full":
-        if not has_key_claims_table(content):
-            content = insert_key_claims_table(content)
+        if not scan.has_key_claims_table:
+            content = insert_key_claims_table(content, scan=scan)
+            scan = scan_content(content)
             changes.append("Added Key Claims table")
 
     # Step 3.5: Insert Corrections & Updates table (full profile only, rigor-v1)
     if actual_profile == "full":
-        if not has_corrections_updates(content):
-            content = insert_corrections_updates_table(content)
-            if has_corrections_updates(content):
+        if not scan.has_section("### Corrections & Updates"):
+            content = insert_corrections_updates_table(content, scan=scan)
+            scan = scan_content(content)
+            if scan.has_section("### Corrections & Updates"):
                 changes.append("Added Corrections & Updates section")
 
     # Step 4: Insert Claim Summary table
-    if not has_claim_summary_table(content):
-        content = insert_claim_summary_table(content, derived_claims)
+    if not scan.has_claim_summary_table:
+        content = insert_claim_summary_table(content, derived_claims, scan=scan)
+        scan = scan_content(content)
         changes.append("Added Claim Summary table")
 
     # Step 5: Insert Claims YAML block
-    if not has_claims_yaml(content):
-        content = insert_claims_yaml(content, claims_yaml=claims_yaml, claims=derived_claims, source_id=source_id)
+    if not scan.has_claims_yaml:
+        content = insert_claims_yaml(
+            content, claims_yaml=claims_yaml, claims=derived_claims, source_id=source_id, scan=scan
+        )
+        scan = scan_content(content)
         changes.append("Added Claims YAML block")
 
     # Step 6: Insert confidence section (full profile only)
-    if actual_profile == "full" and not has_credence(content):
-        content = insert_confidence(content)
+    if actual_profile == "full" and not scan.has_credence:
+        content = insert_confidence(content, scan=scan)
         changes.append("Added Credence in Analysis section")
 
     # Clean up multiple consecutive blank lines
-    content = re.sub(r'\n{4,}', '\n\n\n', content)
-
-    if content != original and not dry_run:
-        path.write_text(content)
+    content = EXCESS_BLANK_LINES_RE.sub('\n\n\n', content)
 
     return content, changes
 
 
+def format_file(path: Path, profile: str | None = None, dry_run: bool = False) -> tuple[str, list[str]]:
+    """Format a single analysis file (see `format_text`), writing it back unless `dry_run`.
+
+    Returns:
+        Tuple of (formatted_content, list_of_changes_made)
+    """
+    try:
+        content = path.read_text()
+    except Exception as e:
+        return "", [f"Error reading file: {e}"]
+
+    formatted, changes = format_text(content, profile, path=path)
+
+    if formatted != content and not dry_run:
+        path.write_text(formatted)
+
+    return formatted, changes
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Format Reality Check analysis files to match Output Contract"
@@ -1494,7 +1494,7 @@ def list_analysis_logs(
     source_id: Optional[str] = None,
     tool: Optional[str] = None,
     status: Optional[str] = None,
-    limit: int = 100,
+    limit: Optional[int] = 100,
     db: Optional[lancedb.DBConnection] = None,
 ) -> list[dict]:
     """List analysis logs with optional filters."""
@@ -1779,7 +1779,7 @@ def list_evidence_links(
     source_id: Optional[str] = None,
     direction: Optional[str] = None,
     include_superseded: bool = False,
-    limit: int = 100,
+    limit: Optional[int] = 100,
     db: Optional[lancedb.DBConnection] = None,
 ) -> list[dict]:
     """List evidence links with optional filters.
@@ -1789,7 +1789,7 @@ def list_evidence_links(
         source_id: Filter by source
         direction: Filter by direction (supports/contradicts/etc.)
         include_superseded: Include superseded/retracted links
-        limit: Maximum results to return
+        limit: Maximum results to return (None for no limit)
         db: Database connection (optional, uses default if not provided)
 
     Returns:
@@ -2076,7 +2076,7 @@ def get_reasoning_trail(
 def list_reasoning_trails(
     claim_id: Optional[str] = None,
     include_superseded: bool = False,
-    limit: int = 100,
+    limit: Optional[int] = 100,
     db: Optional[lancedb.DBConnection] = None,
 ) -> list[dict]:
     """List reasoning trails with optional filters.
@@ -2084,7 +2084,7 @@ def list_reasoning_trails(
     Args:
         claim_id: Filter by claim
         include_superseded: Include superseded trails
-        limit: Maximum results to return
+        limit: Maximum results to return (None for no limit)
         db: Database connection (optional, uses default if not provided)
 
     Returns:
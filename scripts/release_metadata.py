@@ -32,6 +32,9 @@ except ImportError:  # pragma: no cover
     tomllib = None  # type: ignore[assignment]
 
 
+_CHANGELOG_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
 class ReleaseMetadataError(RuntimeError):
     pass
 
@@ -103,10 +106,25 @@ def load_pyproject_metadata(pyproject_path: Path) -> ProjectMetadata:
 
 
 def find_changelog_release_date(changelog_text: str, version: str) -> str | None:
-    m = re.search(rf"^##\s+{re.escape(version)}\s+-\s+(\d{{4}}-\d{{2}}-\d{{2}})\s*$", changelog_text, re.MULTILINE)
-    if not m:
-        return None
-    return m.group(1)
+    # Changelogs are newest-first, so hop between `\n##` header offsets with str.find and stop at
+    # the first hit; nothing past the matching header is scanned or split into lines.
+    pos = -1  # index of the newline before the current line; -1 for the first line
+    while True:
+        start = pos + 1
+        if changelog_text.startswith("##", start):
+            end = changelog_text.find("\n", start)
+            parts = changelog_text[start : end if end != -1 else None].split()
+            if (
+                len(parts) == 4
+                and parts[0] == "##"
+                and parts[1] == version
+                and parts[2] == "-"
+                and _CHANGELOG_DATE_RE.fullmatch(parts[3])
+            ):
+                return parts[3]
+        pos = changelog_text.find("\n##", start)
+        if pos == -1:
+            return None
 
 
 def collect_pytest_item_count(repo_root: Path) -> int:
@@ -5,22 +5,75 @@ from __future__ import annotations
 
 import argparse
 import ast
+import heapq
+import io
 import json
+import mmap
+import os
+import pickle
 import re
 import shutil
+import sqlite3
 import subprocess
+import sys
+import tarfile
 import tempfile
-from bisect import bisect_right
+import threading
+from bisect import bisect_left, bisect_right
 from collections import Counter
-from dataclasses import dataclass
-from datetime import UTC, datetime
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import suppress
+from dataclasses import dataclass, fields
+from datetime import UTC, datetime, timedelta
+from functools import cached_property, lru_cache, partial
+from itertools import accumulate, chain, compress
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 try:
-    from tabulate import tabulate
+    import fcntl
 except ImportError:  # pragma: no cover
-    tabulate = None
+    fcntl = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# Session JSONL is read as bytes; orjson decodes bytes directly, stdlib json accepts them too.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError (a ValueError), so callers catch ValueError.
+json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def json_dumps(obj: Any, *, sort_keys: bool = False) -> bytes:
+    """Serialize as indented UTF-8 JSON with a trailing newline.
+
+    The report is built in a fixed key order, so keys are only sorted when a canonical,
+    layout-independent form is asked for (`--canonicalize`).
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, option=option)
+    return (json.dumps(obj, indent=2, sort_keys=sort_keys, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def write_json(obj: Any, stream: BinaryIO, *, sort_keys: bool = False) -> None:
+    """Write `json_dumps(obj, sort_keys=...)` to a binary stream without building the stdlib text in memory.
+
+    orjson already returns the final bytes; the stdlib fallback streams encoder chunks through a
+    UTF-8 text wrapper instead of joining one str and then encoding a second full copy.
+    """
+    if orjson is not None:
+        stream.write(json_dumps(obj, sort_keys=sort_keys))
+        return
+    text = io.TextIOWrapper(stream, encoding="utf-8", newline="\n")
+    try:
+        json.dump(obj, text, indent=2, sort_keys=sort_keys, ensure_ascii=False)
+        text.write("\n")
+        text.flush()
+    finally:
+        text.detach()
 
 
 @dataclass(frozen=True)
@@ -51,6 +104,72 @@ class CodexSession:
     event_timestamps: list[datetime]
     coding_timestamps: list[datetime]
 
+    @cached_property
+    def snapshot_times(self) -> list[datetime]:
+        """Sorted snapshot timestamps, built once and bisected by every window lookup."""
+        return [row.timestamp_utc for row in self.snapshots]
+
+    @cached_property
+    def event_micros(self) -> list[int]:
+        """Sorted epoch-microsecond event times, converted once and sliced per window."""
+        return sorted(epoch_micros(ts) for ts in self.event_timestamps)
+
+    @cached_property
+    def coding_micros(self) -> list[int]:
+        """Sorted epoch-microsecond function-call times, converted once and sliced per window."""
+        return sorted(epoch_micros(ts) for ts in self.coding_timestamps)
+
+    @cached_property
+    def span_micros(self) -> tuple[int, int] | None:
+        """`(first, last)` epoch micros over snapshots and events; None for an empty session.
+
+        A window `(start, end]` that does not overlap this span gets no tokens or timing
+        points from the session, so aggregation can skip it without any bisecting.
+        """
+        points = [*self.event_micros[:1], *self.event_micros[-1:]]
+        points.extend(epoch_micros(row.timestamp_utc) for row in (self.snapshots[:1] + self.snapshots[-1:]))
+        return (min(points), max(points)) if points else None
+
+
+@dataclass(frozen=True)
+class CodexSessionIndex:
+    """Codex sessions ordered by span start, so a window only visits sessions that can overlap it.
+
+    Sessions starting after the window end are cut off with one bisect; sessions ending before
+    its start are skipped by starting no earlier than `start - longest_span`.
+    """
+
+    sessions: list[CodexSession]
+    starts: list[int]
+    ends: list[int]
+    longest_span: int
+    considered: int
+
+    @classmethod
+    def from_sessions(cls, sessions: list[CodexSession]) -> CodexSessionIndex:
+        spans = sorted(
+            ((span, session) for session in sessions if (span := session.span_micros) is not None),
+            key=lambda row: row[0][0],
+        )
+        return cls(
+            sessions=[session for _, session in spans],
+            starts=[span[0] for span, _ in spans],
+            ends=[span[1] for span, _ in spans],
+            longest_span=max((span[1] - span[0] for span, _ in spans), default=0),
+            considered=len(sessions),
+        )
+
+    def __len__(self) -> int:
+        return self.considered
+
+    def overlapping(self, *, start_exclusive: int | None, end_inclusive: int) -> list[CodexSession]:
+        """Sessions whose span overlaps the `(start, end]` window, given in epoch micros."""
+        hi = bisect_right(self.starts, end_inclusive)
+        if start_exclusive is None:
+            return self.sessions[:hi]
+        lo = bisect_right(self.starts, start_exclusive - self.longest_span)
+        return [self.sessions[idx] for idx in range(lo, hi) if self.ends[idx] > start_exclusive]
+
 
 @dataclass(frozen=True)
 class ClaudeUsageEvent:
@@ -66,6 +185,72 @@ class ClaudeUsageEvent:
     is_tool_use: bool
 
 
+@dataclass(frozen=True)
+class ClaudeEventColumns:
+    """Structure-of-arrays view of timestamp-sorted Claude usage events.
+
+    Window aggregation slices each column with one bisect and sums it with the C-level
+    `sum()`, instead of reading ~10 attributes off one event object at a time.
+    """
+
+    timestamps: list[datetime]
+    micros: list[int]
+    input_tokens: list[int]
+    cache_creation_input_tokens: list[int]
+    cache_read_input_tokens: list[int]
+    tokens_in: list[int]
+    tokens_out: list[int]
+    total_tokens: list[int]
+    is_tool_use: list[bool]
+    paths: list[str]
+    models: list[str]
+
+    @classmethod
+    def from_events(cls, events: list[ClaudeUsageEvent]) -> ClaudeEventColumns:
+        ordered = sorted(events, key=lambda row: row.timestamp_utc)
+        return cls(
+            timestamps=[event.timestamp_utc for event in ordered],
+            micros=[epoch_micros(event.timestamp_utc) for event in ordered],
+            input_tokens=[event.input_tokens for event in ordered],
+            cache_creation_input_tokens=[event.cache_creation_input_tokens for event in ordered],
+            cache_read_input_tokens=[event.cache_read_input_tokens for event in ordered],
+            tokens_in=[event.tokens_in for event in ordered],
+            tokens_out=[event.tokens_out for event in ordered],
+            total_tokens=[event.total_tokens for event in ordered],
+            is_tool_use=[event.is_tool_use for event in ordered],
+            paths=[str(event.path) for event in ordered],
+            models=[event.model or "unknown" for event in ordered],
+        )
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @cached_property
+    def prefix_sums(self) -> dict[str, list[int]]:
+        """Cumulative token columns (`cum[i]` = sum of rows `< i`); window sum is `cum[hi] - cum[lo]`."""
+        return {
+            name: list(accumulate(getattr(self, name), initial=0))
+            for name in (
+                "input_tokens",
+                "cache_creation_input_tokens",
+                "cache_read_input_tokens",
+                "tokens_in",
+                "tokens_out",
+                "total_tokens",
+            )
+        }
+
+    def window_sum(self, column: str, lo: int, hi: int) -> int:
+        cumulative = self.prefix_sums[column]
+        return cumulative[hi] - cumulative[lo]
+
+    def window_bounds(self, *, start_exclusive: datetime | None, end_inclusive: datetime) -> tuple[int, int]:
+        """Return the `[lo, hi)` column slice inside the window."""
+        lo = 0 if start_exclusive is None else bisect_right(self.timestamps, start_exclusive)
+        hi = bisect_right(self.timestamps, end_inclusive)
+        return lo, max(lo, hi)
+
+
 DEFAULT_GPT5_INPUT_USD_PER_1M = 1.25
 DEFAULT_GPT5_CACHED_INPUT_USD_PER_1M = 0.125
 DEFAULT_GPT5_OUTPUT_USD_PER_1M = 10.00
@@ -75,10 +260,64 @@ DEFAULT_OPUS4_CACHE_READ_USD_PER_1M = 1.50
 DEFAULT_OPUS4_OUTPUT_USD_PER_1M = 75.00
 
 
-def run_command(cmd: list[str], *, cwd: Path | None = None) -> str:
+@dataclass(frozen=True)
+class PriceTable:
+    """Token prices in USD per 1M tokens; field names match the `--price-*` flags."""
+
+    gpt5_input_per_1m: float = DEFAULT_GPT5_INPUT_USD_PER_1M
+    gpt5_cached_input_per_1m: float = DEFAULT_GPT5_CACHED_INPUT_USD_PER_1M
+    gpt5_output_per_1m: float = DEFAULT_GPT5_OUTPUT_USD_PER_1M
+    opus4_input_per_1m: float = DEFAULT_OPUS4_INPUT_USD_PER_1M
+    opus4_cache_write_per_1m: float = DEFAULT_OPUS4_CACHE_WRITE_USD_PER_1M
+    opus4_cache_read_per_1m: float = DEFAULT_OPUS4_CACHE_READ_USD_PER_1M
+    opus4_output_per_1m: float = DEFAULT_OPUS4_OUTPUT_USD_PER_1M
+
+    @classmethod
+    def from_args(cls, args: argparse.Namespace) -> PriceTable:
+        """Prices from the `--price-*` flags, then any `--prices` overrides on top."""
+        prices = {field.name: getattr(args, f"price_{field.name}") for field in fields(cls)}
+        prices.update(args.prices or {})
+        return cls(**prices)
+
+    def cost_assumptions(self) -> dict[str, dict[str, float]]:
+        return {
+            "codex_gpt5x": {
+                "input_uncached": self.gpt5_input_per_1m,
+                "input_cached": self.gpt5_cached_input_per_1m,
+                "output": self.gpt5_output_per_1m,
+            },
+            "claude_opus4x": {
+                "input_base": self.opus4_input_per_1m,
+                "input_cache_write": self.opus4_cache_write_per_1m,
+                "input_cache_read": self.opus4_cache_read_per_1m,
+                "output": self.opus4_output_per_1m,
+            },
+        }
+
+
+def parse_price_overrides(raw: str) -> dict[str, float]:
+    """Parse `--prices name=value,...`; names are `PriceTable` fields, dashes allowed."""
+    names = {field.name for field in fields(PriceTable)}
+    overrides: dict[str, float] = {}
+    for item in raw.split(","):
+        if not item.strip():
+            continue
+        name, sep, value = item.partition("=")
+        name = name.strip().replace("-", "_")
+        if not sep or name not in names:
+            raise argparse.ArgumentTypeError(f"expected name=value with name in {', '.join(sorted(names))}: {item!r}")
+        try:
+            overrides[name] = float(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid price for {name}: {value!r}") from None
+    return overrides
+
+
+def run_command(cmd: list[str], *, cwd: Path | None = None, env: dict[str, str] | None = None) -> str:
     result = subprocess.run(
         cmd,
         cwd=str(cwd) if cwd is not None else None,
+        env=env,
         check=True,
         capture_output=True,
         text=True,
@@ -86,22 +325,68 @@ def run_command(cmd: list[str], *, cwd: Path | None = None) -> str:
     return result.stdout
 
 
-def parse_timestamp_utc(raw: str) -> datetime:
-    return datetime.fromisoformat(raw.replace("Z", "+00:00")).astimezone(UTC)
+def run_command_stream(cmd: list[str], *, cwd: Path | None = None) -> Iterator[str]:
+    """Yield stdout lines (without trailing newline) as the command produces them.
+
+    Unlike `run_command`, output is never buffered in full, so large `git log` ranges
+    are parsed in O(1) memory per line. Raises CalledProcessError on non-zero exit.
+    stderr goes to a temporary file rather than a second pipe: a pipe nobody drains while
+    stdout is being read would block the command once its stderr filled the pipe buffer.
+    """
+    with tempfile.TemporaryFile(mode="w+") as stderr_file, subprocess.Popen(
+        cmd,
+        cwd=str(cwd) if cwd is not None else None,
+        stdout=subprocess.PIPE,
+        stderr=stderr_file,
+        text=True,
+    ) as proc:
+        assert proc.stdout is not None
+        for line in proc.stdout:
+            yield line.rstrip("\n")
+        returncode = proc.wait()
+        stderr_file.seek(0)
+        stderr = stderr_file.read()
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd, stderr=stderr)
 
 
-def parse_numstat(output: str) -> tuple[int, int]:
+def parse_timestamp_utc(raw: str) -> datetime:
+    # Python 3.11+ parses a trailing "Z" natively and returns the `UTC` singleton for zero
+    # offsets, so the common case skips the string rewrite and the astimezone() copy.
+    parsed = datetime.fromisoformat(raw)
+    if parsed.tzinfo is UTC:
+        return parsed
+    return parsed.astimezone(UTC)
+
+
+NUMSTAT_RE = re.compile(r"\s*(\d+)\s*\t\s*(\d+)\s*(?:\t|$)")
+SCC_COST_RE = re.compile(r"Estimated Cost to Develop \(organic\)\s+\$([0-9,]+)")
+SCC_SCHEDULE_RE = re.compile(r"Estimated Schedule Effort \(organic\)\s+([0-9.]+)\s+months")
+SCC_PEOPLE_RE = re.compile(r"Estimated People Required \(organic\)\s+([0-9.]+)")
+# (snapshot key, scc JSON field) for the per-language rows of `scc --format json`.
+SCC_FIELDS = (
+    ("files", "Count"),
+    ("lines", "Lines"),
+    ("code", "Code"),
+    ("comments", "Comment"),
+    ("blanks", "Blank"),
+    ("complexity", "Complexity"),
+)
+SCC_KEYS = tuple(key for key, _ in SCC_FIELDS)
+SCC_SOURCE_FIELDS = tuple(source for _, source in SCC_FIELDS)
+
+
+def parse_numstat(output: str | Iterable[str]) -> tuple[int, int]:
+    lines = output.splitlines() if isinstance(output, str) else output
     insertions = 0
     deletions = 0
-    for line in output.splitlines():
-        parts = line.split("\t")
-        if len(parts) < 2:
-            continue
-        added, removed = parts[0].strip(), parts[1].strip()
-        if not added.isdigit() or not removed.isdigit():
+    match_numstat = NUMSTAT_RE.match
+    for line in lines:
+        match = match_numstat(line)
+        if match is None:
             continue
-        insertions += int(added)
-        deletions += int(removed)
+        insertions += int(match.group(1))
+        deletions += int(match.group(2))
     return insertions, deletions
 
 
@@ -123,28 +408,200 @@ def path_matches_repo(cwd: str | None, repo_root: Path) -> bool:
     return cwd_path == repo_resolved or repo_resolved in cwd_path.parents
 
 
+LIST_TAGS_FORMAT = "%00".join(
+    [
+        "%(refname:strip=2)",
+        "%(objectname)",
+        "%(*objectname)",
+        "%(objectname:short)",
+        "%(*objectname:short)",
+        "%(committerdate:iso8601-strict)",
+        "%(*committerdate:iso8601-strict)",
+        "%(creatordate:iso8601-strict)",
+    ]
+)
+
+
+class GitBatch:
+    """Long-lived `git cat-file` workers for resolving/reading many objects over one pipe.
+
+    `info()` uses `--batch-check` and `read()` uses `--batch`; each process is spawned on
+    first use and reused for every later lookup instead of re-execing git per object.
+    """
+
+    def __init__(self, repo_root: Path) -> None:
+        self.repo_root = repo_root
+        self._procs: dict[str, subprocess.Popen[bytes]] = {}
+
+    def __enter__(self) -> GitBatch:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _proc(self, mode: str) -> subprocess.Popen[bytes]:
+        proc = self._procs.get(mode)
+        if proc is None:
+            proc = subprocess.Popen(
+                ["git", "cat-file", mode],
+                cwd=str(self.repo_root),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+            self._procs[mode] = proc
+        return proc
+
+    def _discard(self, mode: str) -> None:
+        """Kill and forget the `mode` worker after a failed exchange left its pipes out of sync."""
+        proc = self._procs.pop(mode, None)
+        if proc is None:
+            return
+        proc.kill()
+        proc.wait()
+        for stream in (proc.stdin, proc.stdout):
+            if stream is not None:
+                with suppress(OSError):
+                    stream.close()
+
+    @staticmethod
+    def _read_header(proc: subprocess.Popen[bytes]) -> tuple[str, str, int] | None:
+        assert proc.stdout is not None
+        line = proc.stdout.readline()
+        if not line:
+            raise RuntimeError("git cat-file exited unexpectedly")
+        header = line.decode("utf-8", errors="replace").split()
+        if len(header) != 3 or not header[2].isdigit():
+            # `<ref> missing` / `<ref> ambiguous`
+            return None
+        return header[0], header[1], int(header[2])
+
+    @classmethod
+    def _read_object(cls, proc: subprocess.Popen[bytes]) -> tuple[str, str, bytes] | None:
+        header = cls._read_header(proc)
+        if header is None:
+            return None
+        assert proc.stdout is not None
+        sha, obj_type, size = header
+        content = proc.stdout.read(size)
+        if len(content) != size or proc.stdout.read(1) != b"\n":  # trailing LF after each object
+            raise RuntimeError(f"git cat-file exited while reading {sha}")
+        return sha, obj_type, content
+
+    def _query(self, mode: str, ref: str) -> subprocess.Popen[bytes]:
+        proc = self._proc(mode)
+        assert proc.stdin is not None
+        proc.stdin.write(ref.encode("utf-8") + b"\n")
+        proc.stdin.flush()
+        return proc
+
+    def info(self, ref: str) -> tuple[str, str, int] | None:
+        """Return `(sha, type, size)` for `ref`, or None when it does not resolve."""
+        return self._read_header(self._query("--batch-check", ref))
+
+    def read(self, ref: str) -> tuple[str, str, bytes] | None:
+        """Return `(sha, type, content)` for `ref`, or None when it does not resolve."""
+        return self._read_object(self._query("--batch", ref))
+
+    def read_many(self, refs: Sequence[str]) -> list[tuple[str, str, bytes] | None]:
+        """`read()` for every ref, pipelined: all requests are written up front.
+
+        A writer thread feeds stdin while this thread drains stdout, so git never blocks on a
+        full output pipe and there is no per-object flush/readline round-trip.
+        """
+        if len(refs) <= 1:
+            return [self.read(ref) for ref in refs]
+        proc = self._proc("--batch")
+        assert proc.stdin is not None
+        stdin = proc.stdin
+        payload = b"".join(ref.encode("utf-8") + b"\n" for ref in refs)
+
+        write_errors: list[OSError] = []
+
+        def feed() -> None:
+            try:
+                stdin.write(payload)
+                stdin.flush()
+            except OSError as exc:  # BrokenPipeError once git has exited
+                write_errors.append(exc)
+
+        writer = threading.Thread(target=feed, daemon=True)
+        writer.start()
+        try:
+            objects = [self._read_object(proc) for _ in refs]
+        except BaseException:
+            # Killing git unblocks a writer stuck on a full stdin pipe; then the worker is dropped
+            # so the next lookup starts from a fresh, correctly framed process.
+            self._discard("--batch")
+            writer.join()
+            raise
+        writer.join()
+        if write_errors:
+            self._discard("--batch")
+            raise RuntimeError("git cat-file --batch input failed") from write_errors[0]
+        return objects
+
+    def close(self) -> None:
+        for proc in self._procs.values():
+            if proc.stdin is not None:
+                proc.stdin.close()
+            if proc.stdout is not None:
+                proc.stdout.close()
+            proc.wait()
+        self._procs.clear()
+
+
+def parse_commit_committer_time(content: bytes) -> datetime | None:
+    """Parse the committer timestamp from a raw commit object (`committer ... <epoch> <tz>`)."""
+    for line in content.split(b"\n"):
+        if not line:
+            break  # end of headers
+        if line.startswith(b"committer "):
+            parts = line.rsplit(b" ", 2)
+            if len(parts) == 3 and parts[1].isdigit():
+                return datetime.fromtimestamp(int(parts[1]), UTC)
+    return None
+
+
 def list_tags(repo_root: Path) -> list[TagInfo]:
-    names = [line.strip() for line in run_command(["git", "tag", "--sort=creatordate"], cwd=repo_root).splitlines() if line.strip()]
+    # One for-each-ref call instead of several git invocations per tag. The `*` fields are
+    # the peeled commit for annotated tags and empty for lightweight tags.
+    output = run_command(
+        ["git", "for-each-ref", "--sort=creatordate", f"--format={LIST_TAGS_FORMAT}", "refs/tags/"],
+        cwd=repo_root,
+    )
     tags: list[TagInfo] = []
-    for name in names:
-        commit = run_command(["git", "rev-parse", f"{name}^{{commit}}"], cwd=repo_root).strip()
-        commit_short = run_command(["git", "rev-parse", "--short", f"{name}^{{commit}}"], cwd=repo_root).strip()
-        commit_time_raw = run_command(["git", "show", "-s", "--format=%cI", f"{name}^{{commit}}"], cwd=repo_root).strip()
-        tag_time_raw = run_command(
-            ["git", "for-each-ref", f"refs/tags/{name}", "--format=%(creatordate:iso8601-strict)"],
-            cwd=repo_root,
-        ).strip()
-        commit_time = parse_timestamp_utc(commit_time_raw)
-        tag_time = parse_timestamp_utc(tag_time_raw) if tag_time_raw else commit_time
-        tags.append(
-            TagInfo(
-                name=name,
-                commit=commit,
-                commit_short=commit_short,
-                commit_time_utc=commit_time,
-                tag_time_utc=tag_time,
+    with GitBatch(repo_root) as batch:
+        for line in output.splitlines():
+            fields = line.split("\x00")
+            if len(fields) != 8 or not fields[0]:
+                continue
+            name, obj, peeled, obj_short, peeled_short, obj_time_raw, peeled_time_raw, tag_time_raw = fields
+            commit = peeled or obj
+            commit_short = peeled_short or obj_short
+            commit_time_raw = peeled_time_raw or obj_time_raw
+            if commit_time_raw:
+                commit_time = parse_timestamp_utc(commit_time_raw)
+            else:
+                # Tag of a tag: for-each-ref only peels one level, so resolve the commit
+                # over the shared cat-file pipe rather than spawning rev-parse/show.
+                resolved = batch.read(f"refs/tags/{name}^{{commit}}")
+                parsed_time = parse_commit_committer_time(resolved[2]) if resolved else None
+                if resolved is None or parsed_time is None:
+                    continue
+                commit = resolved[0]
+                commit_short = commit[: len(obj_short)]
+                commit_time = parsed_time
+            tag_time = parse_timestamp_utc(tag_time_raw) if tag_time_raw else commit_time
+            tags.append(
+                TagInfo(
+                    name=name,
+                    commit=commit,
+                    commit_short=commit_short,
+                    commit_time_utc=commit_time,
+                    tag_time_utc=tag_time,
+                )
             )
-        )
     return tags
 
 
@@ -152,25 +609,104 @@ def git_range_arg(previous_tag: str | None, current_tag: str) -> str:
     return f"{previous_tag}..{current_tag}" if previous_tag else current_tag
 
 
-def collect_git_range_stats(repo_root: Path, previous_tag: str | None, current_tag: str) -> dict[str, Any]:
+RANGE_LOG_COMMIT_MARKER = "\x00"
+RENAME_BRACE_RE = re.compile(r"^(?P<prefix>.*)\{(?P<old>.*) => (?P<new>.*)\}(?P<suffix>.*)$")
+
+
+def numstat_path(raw: str) -> str:
+    """Return the post-image path for a numstat path column (same as `--name-only`)."""
+    match = RENAME_BRACE_RE.match(raw)
+    if match:
+        path = f"{match.group('prefix')}{match.group('new')}{match.group('suffix')}"
+        return path.replace("//", "/").lstrip("/")
+    if " => " in raw:
+        return raw.split(" => ", 1)[1]
+    return raw
+
+
+def collect_git_range_stats(
+    repo_root: Path,
+    previous_tag: str | None,
+    current_tag: str,
+    *,
+    net_diff_churn: bool = False,
+) -> dict[str, Any]:
+    """Commit cadence and churn for `previous_tag..current_tag`.
+
+    By default churn is summed per commit from `git log --numstat`. With `net_diff_churn`,
+    ranges that have a previous tag take insertions/deletions/files from a single endpoint
+    `git diff --numstat` instead, skipping the per-commit diffs; this reports net change,
+    so lines or files touched and later reverted inside the range are not counted.
+    """
     range_arg = git_range_arg(previous_tag, current_tag)
-    commits_in_range = int(run_command(["git", "rev-list", "--count", range_arg], cwd=repo_root).strip() or "0")
     commits_to_tag = int(run_command(["git", "rev-list", "--count", current_tag], cwd=repo_root).strip() or "0")
+    use_endpoint_diff = net_diff_churn and previous_tag is not None
+
+    # One history walk yields commit headers (NUL, %cI, NUL, short date) followed by numstat rows.
+    log_cmd = ["git", "log", "--reverse", "--date=short", "--format=%x00%cI%x00%cd", range_arg]
+    if not use_endpoint_diff:
+        log_cmd.insert(3, "--numstat")
+    commit_times: list[datetime] = []
+    day_counter: Counter[str] = Counter()
+    unique_files: set[str] = set()
+    insertions = 0
+    deletions = 0
+    for line in run_command_stream(log_cmd, cwd=repo_root):
+        if line.startswith(RANGE_LOG_COMMIT_MARKER):
+            _, commit_time_raw, commit_date = line.split("\x00", 2)
+            commit_times.append(parse_timestamp_utc(commit_time_raw))
+            day_counter[commit_date] += 1
+            continue
+        parts = line.split("\t", 2)
+        if len(parts) < 3:
+            continue
+        added, removed, path = parts
+        unique_files.add(numstat_path(path))
+        if added.isdigit() and removed.isdigit():
+            insertions += int(added)
+            deletions += int(removed)
+
+    if use_endpoint_diff:
+        assert previous_tag is not None
+        insertions, deletions, unique_files = endpoint_diff_churn(repo_root, previous_tag, current_tag)
+
+    return range_stats_row(
+        range_arg,
+        "net_diff" if use_endpoint_diff else "commit_log",
+        commits_to_tag=commits_to_tag,
+        commit_times=commit_times,
+        day_counter=day_counter,
+        unique_files=unique_files,
+        insertions=insertions,
+        deletions=deletions,
+    )
+
 
-    files_output = run_command(["git", "log", "--name-only", "--pretty=format:", range_arg], cwd=repo_root)
-    unique_files = {line.strip() for line in files_output.splitlines() if line.strip()}
+def endpoint_diff_churn(repo_root: Path, previous_tag: str, current_tag: str) -> tuple[int, int, set[str]]:
+    """Net `(insertions, deletions, files)` between two refs from one `git diff --numstat`."""
+    diff_lines = list(run_command_stream(["git", "diff", "--numstat", previous_tag, current_tag, "--"], cwd=repo_root))
+    insertions, deletions = parse_numstat(diff_lines)
+    diff_rows = (line.split("\t", 2) for line in diff_lines)
+    return insertions, deletions, {numstat_path(parts[2]) for parts in diff_rows if len(parts) == 3}
 
-    numstat_output = run_command(["git", "log", "--pretty=tformat:", "--numstat", range_arg], cwd=repo_root)
-    insertions, deletions = parse_numstat(numstat_output)
 
-    commit_times_output = run_command(["git", "log", "--reverse", "--format=%cI", range_arg], cwd=repo_root)
-    commit_times = [parse_timestamp_utc(line.strip()) for line in commit_times_output.splitlines() if line.strip()]
+def range_stats_row(
+    range_arg: str,
+    churn_method: str,
+    *,
+    commits_to_tag: int,
+    commit_times: list[datetime],
+    day_counter: Counter[str],
+    unique_files: set[str],
+    insertions: int,
+    deletions: int,
+) -> dict[str, Any]:
+    """The `git` section of a release row; `commit_times` are oldest-first in walk order."""
+    commits_in_range = len(commit_times)
     first_commit = commit_times[0] if commit_times else None
     last_commit = commit_times[-1] if commit_times else None
     span_days = (last_commit.date() - first_commit.date()).days + 1 if first_commit and last_commit else 0
     work_duration_seconds = duration_seconds(first_commit, last_commit)
-    commit_dates_output = run_command(["git", "log", "--date=short", "--format=%cd", range_arg], cwd=repo_root)
-    day_counter = Counter(line.strip() for line in commit_dates_output.splitlines() if line.strip())
     commits_by_day = dict(sorted(day_counter.items(), key=lambda row: row[0]))
     peak_day = max(commits_by_day.items(), key=lambda row: row[1]) if commits_by_day else None
     commits_per_day_avg = (commits_in_range / span_days) if span_days > 0 else None
@@ -182,6 +718,7 @@ def collect_git_range_stats(repo_root: Path, previous_tag: str | None, current_t
 
     return {
         "range": range_arg,
+        "churn_method": churn_method,
         "commits_in_range": commits_in_range,
         "commits_to_tag": commits_to_tag,
         "unique_files_touched": len(unique_files),
@@ -202,6 +739,228 @@ def collect_git_range_stats(repo_root: Path, previous_tag: str | None, current_t
     }
 
 
+@dataclass
+class WalkedCommit:
+    parents: list[str]
+    time: datetime
+    date: str
+    files: list[str]
+    insertions: int = 0
+    deletions: int = 0
+
+
+def window_log_order(commits: dict[str, WalkedCommit], tip: str, window: set[str]) -> list[WalkedCommit]:
+    """The window's commits oldest-first, in the order `git log --reverse prev..tip` lists them.
+
+    git's default walk pops the newest queued commit by committer date (ties first-in, first-out)
+    and queues its parents; only commits inside the window ever enter that queue, so replaying
+    it per window matches a per-range walk even when committer clocks are skewed.
+    """
+    if tip not in window:
+        return []
+    order: list[WalkedCommit] = []
+    queued = {tip}
+    heap = [(-commits[tip].time.timestamp(), 0, tip)]
+    pushes = 0
+    while heap:
+        sha = heapq.heappop(heap)[2]
+        commit = commits[sha]
+        order.append(commit)
+        for parent in commit.parents:
+            if parent in window and parent not in queued:
+                queued.add(parent)
+                pushes += 1
+                heapq.heappush(heap, (-commits[parent].time.timestamp(), pushes, parent))
+    order.reverse()
+    return order
+
+
+def reachable(commits: dict[str, WalkedCommit], tip: str, stop: set[str] | None = None) -> set[str]:
+    """Walked commits reachable from `tip`, not descending into `stop` (an ancestor-closed set)."""
+    found: set[str] = set()
+    stack = [tip]
+    while stack:
+        sha = stack.pop()
+        if sha in found or (stop is not None and sha in stop):
+            continue
+        commit = commits.get(sha)
+        if commit is None:
+            continue
+        found.add(sha)
+        stack.extend(commit.parents)
+    return found
+
+
+def release_windows(
+    commits: dict[str, WalkedCommit],
+    tips: Sequence[str],
+    base: str | None,
+) -> list[tuple[set[str], int]]:
+    """Split a fully walked history into consecutive `previous..tip` windows, in-process.
+
+    The first window's previous tip is `base` (None for "everything"). Returns, per window,
+    its commits and how many commits its tip reaches. Each window stops at the previous tip's
+    reach set, so a linear tag history is walked once in total; only a tag that does not
+    descend from its predecessor re-walks its own ancestry.
+    """
+    results: list[tuple[set[str], int]] = []
+    reach = reachable(commits, base) if base is not None else set()
+    previous_tip = base
+    for tip in tips:
+        window = reachable(commits, tip, reach)
+        if previous_tip is None or previous_tip == tip or any(
+            previous_tip in commits[sha].parents for sha in window
+        ):
+            reach |= window
+        else:
+            reach = reachable(commits, tip)
+        previous_tip = tip
+        results.append((window, len(reach)))
+    return results
+
+
+def collect_all_range_stats(
+    repo_root: Path,
+    tags: Sequence[TagInfo],
+    start_idx: int,
+    end_idx: int,
+    *,
+    net_diff_churn: bool = False,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Git stats and documentation churn for every `tags[idx-1]..tags[idx]` window.
+
+    Equivalent to calling `collect_git_range_stats` and `collect_documentation_churn` per tag,
+    but from at most three history walks in total instead of three processes per tag: one
+    `git log` that prints every commit's parents, so windows and `commits_to_tag` are worked
+    out in-process by reachability; a `--numstat` walk (the same one when the report starts at
+    the first tag); and one path-limited walk for the documentation paths. `--net-diff-churn`
+    still takes one endpoint `git diff` per window that has a previous tag.
+    """
+    selected = tags[start_idx : end_idx + 1]
+    base = tags[start_idx - 1] if start_idx > 0 else None
+    tips = [tag.commit for tag in selected]
+    # Reachability needs the whole graph, but numstat is only needed above the first selected tag's
+    # predecessor, so a report that starts later pairs a parents-only full walk with a ranged one.
+    ranged = [*tips, f"^{base.commit}"] if base is not None else tips
+    graph_cmd = ["git", "log", "--date=short", "--format=%x00%H%x00%P%x00%cI%x00%cd", *tips, "--"]
+    numstat_cmd: list[str] | None = None
+    if base is not None:
+        graph_cmd.insert(-1, base.commit)
+        if not net_diff_churn:
+            numstat_cmd = ["git", "log", "--numstat", "--format=%x00%H", *ranged, "--"]
+    else:
+        graph_cmd.insert(2, "--numstat")
+
+    commits: dict[str, WalkedCommit] = {}
+    current: WalkedCommit | None = None
+    for cmd in (graph_cmd, numstat_cmd):
+        if cmd is None:
+            continue
+        for line in run_command_stream(cmd, cwd=repo_root):
+            if line.startswith(RANGE_LOG_COMMIT_MARKER):
+                fields = line.split("\x00", 4)
+                if len(fields) == 2:
+                    current = commits.get(fields[1])
+                    continue
+                _, sha, parents, commit_time_raw, commit_date = fields
+                current = WalkedCommit(parents.split(), parse_timestamp_utc(commit_time_raw), commit_date, [])
+                commits[sha] = current
+                continue
+            parts = line.split("\t", 2)
+            if current is None or len(parts) < 3:
+                continue
+            added, removed, path = parts
+            current.files.append(numstat_path(path))
+            if added.isdigit() and removed.isdigit():
+                current.insertions += int(added)
+                current.deletions += int(removed)
+
+    windows = release_windows(commits, tips, base.commit if base is not None else None)
+    doc_commits = parse_numstat_z_log(
+        run_command(["git", "log", "-z", "--numstat", "--format=%H", *ranged, "--", *DOC_CHURN_PATHS], cwd=repo_root)
+    )
+
+    # A tag that does not descend from its predecessor can open a window below `base`, outside
+    # both ranged walks; such a window is collected on its own.
+    below_base = reachable(commits, base.commit) if base is not None else set()
+    rows: list[dict[str, Any]] = []
+    doc_rows: list[dict[str, Any]] = []
+    for offset, tag in enumerate(selected):
+        previous = tags[start_idx + offset - 1] if start_idx + offset > 0 else None
+        window, commits_to_tag = windows[offset]
+        if not below_base.isdisjoint(window):
+            previous_name = previous.name if previous else None
+            rows.append(collect_git_range_stats(repo_root, previous_name, tag.name, net_diff_churn=net_diff_churn))
+            doc_rows.append(collect_documentation_churn(repo_root, previous_name, tag.name))
+            continue
+        doc_rows.append(summarize_doc_churn(doc_commits[sha] for sha in window if sha in doc_commits))
+        ordered = window_log_order(commits, tag.commit, window)
+        use_endpoint_diff = net_diff_churn and previous is not None
+        if use_endpoint_diff:
+            assert previous is not None
+            insertions, deletions, unique_files = endpoint_diff_churn(repo_root, previous.name, tag.name)
+        else:
+            insertions = sum(commit.insertions for commit in ordered)
+            deletions = sum(commit.deletions for commit in ordered)
+            unique_files = {path for commit in ordered for path in commit.files}
+        rows.append(
+            range_stats_row(
+                git_range_arg(previous.name if previous else None, tag.name),
+                "net_diff" if use_endpoint_diff else "commit_log",
+                commits_to_tag=commits_to_tag,
+                commit_times=[commit.time for commit in ordered],
+                day_counter=Counter(commit.date for commit in ordered),
+                unique_files=unique_files,
+                insertions=insertions,
+                deletions=deletions,
+            )
+        )
+    return rows, doc_rows
+
+
+JSONL_READ_BUFFER = 1 << 16
+
+
+def iter_jsonl_objects(path: Path) -> Iterator[dict[str, Any]]:
+    """Decoded objects from a JSONL file, skipping blank, malformed and non-object lines.
+
+    The file is memory-mapped so each line is sliced out of the page cache instead of going
+    through a second userspace buffer; empty files (which cannot be mapped) and filesystems
+    that refuse mmap fall back to a 64 KiB buffered read. Open/read failures raise OSError.
+    """
+    with path.open("rb", buffering=JSONL_READ_BUFFER) as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            mapped = None
+        lines: Iterable[bytes] = f if mapped is None else iter_mapped_lines(mapped)
+        try:
+            for line in lines:
+                if not line or line.isspace():
+                    continue
+                try:
+                    obj = json_loads(line)
+                except ValueError:
+                    continue
+                if isinstance(obj, dict):
+                    yield obj
+        finally:
+            if mapped is not None:
+                mapped.close()
+
+
+def iter_mapped_lines(mapped: mmap.mmap) -> Iterator[bytes]:
+    size = len(mapped)
+    find = mapped.find
+    pos = 0
+    while pos < size:
+        end = find(b"\n", pos)
+        if end == -1:
+            end = size
+        yield mapped[pos:end]
+        pos = end + 1
+
+
 def parse_codex_session(path: Path) -> CodexSession | None:
     cwd: str | None = None
     session_id: str | None = None
@@ -211,65 +970,56 @@ def parse_codex_session(path: Path) -> CodexSession | None:
     coding_timestamps: list[datetime] = []
 
     try:
-        with path.open("r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    obj = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-
-                obj_type = obj.get("type")
-                payload = obj.get("payload")
-                payload_dict = payload if isinstance(payload, dict) else {}
-                ts_raw = obj.get("timestamp")
-                ts: datetime | None = None
-                if isinstance(ts_raw, str):
-                    ts = parse_timestamp_utc(ts_raw)
-                    event_timestamps.append(ts)
-
-                if obj_type == "session_meta":
-                    if session_id is None and isinstance(payload_dict.get("id"), str):
-                        session_id = payload_dict.get("id")
-                    if cwd is None and isinstance(payload_dict.get("cwd"), str):
-                        cwd = payload_dict.get("cwd")
-
-                if obj_type == "turn_context":
-                    if cwd is None and isinstance(payload_dict.get("cwd"), str):
-                        cwd = payload_dict.get("cwd")
-                    if model is None and isinstance(payload_dict.get("model"), str):
-                        model = payload_dict.get("model")
-
-                if obj_type == "response_item" and ts is not None:
-                    if payload_dict.get("type") == "function_call":
-                        coding_timestamps.append(ts)
-
-                if obj_type != "event_msg":
-                    continue
-                if payload_dict.get("type") != "token_count":
-                    continue
-                info = payload_dict.get("info")
-                info_dict = info if isinstance(info, dict) else {}
-                usage = info_dict.get("total_token_usage")
-                usage_dict = usage if isinstance(usage, dict) else {}
+        for obj in iter_jsonl_objects(path):
+            obj_type = obj.get("type")
+            payload = obj.get("payload")
+            payload_dict = payload if isinstance(payload, dict) else {}
+            ts_raw = obj.get("timestamp")
+            ts: datetime | None = None
+            if isinstance(ts_raw, str):
+                ts = parse_timestamp_utc(ts_raw)
+                event_timestamps.append(ts)
+
+            if obj_type == "session_meta":
+                if session_id is None and isinstance(payload_dict.get("id"), str):
+                    session_id = payload_dict.get("id")
+                if cwd is None and isinstance(payload_dict.get("cwd"), str):
+                    cwd = payload_dict.get("cwd")
+
+            if obj_type == "turn_context":
+                if cwd is None and isinstance(payload_dict.get("cwd"), str):
+                    cwd = payload_dict.get("cwd")
+                if model is None and isinstance(payload_dict.get("model"), str):
+                    model = payload_dict.get("model")
+
+            if obj_type == "response_item" and ts is not None:
+                if payload_dict.get("type") == "function_call":
+                    coding_timestamps.append(ts)
+
+            if obj_type != "event_msg":
+                continue
+            if payload_dict.get("type") != "token_count":
+                continue
+            info = payload_dict.get("info")
+            info_dict = info if isinstance(info, dict) else {}
+            usage = info_dict.get("total_token_usage")
+            usage_dict = usage if isinstance(usage, dict) else {}
 
-                if ts is None:
-                    continue
-                input_tokens = safe_int(usage_dict.get("input_tokens"))
-                cached_input_tokens = safe_int(usage_dict.get("cached_input_tokens"))
-                output_tokens = safe_int(usage_dict.get("output_tokens"))
-                total_tokens = safe_int(usage_dict.get("total_tokens")) or (input_tokens + output_tokens)
-                snapshots.append(
-                    TokenSnapshot(
-                        timestamp_utc=ts,
-                        input_tokens=input_tokens,
-                        cached_input_tokens=cached_input_tokens,
-                        output_tokens=output_tokens,
-                        total_tokens=total_tokens,
-                    )
+            if ts is None:
+                continue
+            input_tokens = safe_int(usage_dict.get("input_tokens"))
+            cached_input_tokens = safe_int(usage_dict.get("cached_input_tokens"))
+            output_tokens = safe_int(usage_dict.get("output_tokens"))
+            total_tokens = safe_int(usage_dict.get("total_tokens")) or (input_tokens + output_tokens)
+            snapshots.append(
+                TokenSnapshot(
+                    timestamp_utc=ts,
+                    input_tokens=input_tokens,
+                    cached_input_tokens=cached_input_tokens,
+                    output_tokens=output_tokens,
+                    total_tokens=total_tokens,
                 )
+            )
     except OSError:
         return None
 
@@ -303,7 +1053,7 @@ def codex_tokens_in_window(
             "total_tokens": 0,
         }
 
-    timestamps = [row.timestamp_utc for row in snapshots]
+    timestamps = session.snapshot_times
     end_idx = bisect_right(timestamps, end_inclusive) - 1
     if end_idx < 0:
         return {
@@ -352,10 +1102,186 @@ def codex_tokens_in_window(
     }
 
 
-def load_codex_sessions(codex_root: Path, repo_root: Path) -> list[CodexSession]:
+def walk_files(root: Path, keep: Callable[[str], bool]) -> list[Path]:
+    """Sorted files under `root` whose name passes `keep`, walked with `os.scandir`.
+
+    `DirEntry` caches the file type from the directory read, so large trees are walked
+    without the per-entry `stat()` that `Path.rglob` performs. Symlinked directories are
+    not followed.
+    """
+    found: list[str] = []
+    stack = [str(root)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif keep(name) and entry.is_file():
+                        found.append(entry.path)
+        except OSError:
+            continue
+    return sorted(Path(path) for path in found)
+
+
+def scan_jsonl_files(root: Path, *, prefix: str = "") -> list[Path]:
+    """Sorted `**/{prefix}*.jsonl` files under `root`."""
+    return walk_files(root, lambda name: name.endswith(".jsonl") and name.startswith(prefix))
+
+
+PARALLEL_PARSE_MIN_FILES = 8
+PARALLEL_PARSE_CHUNKSIZE = 8
+SESSION_CACHE_VERSION = 1
+DEFAULT_SESSION_CACHE_PATH = "~/.cache/realitycheck/session-parse-cache.sqlite3"
+
+
+class SessionParseCache:
+    """On-disk cache of parsed session files keyed by (path, mtime_ns, size).
+
+    Rollout/session JSONL files are append-only until closed, so an unchanged size and
+    mtime means the previously parsed result is still valid. One row is kept per
+    (kind, path, variant); a changed file simply overwrites its row.
+
+    The cache is best-effort, like `SnapshotCache`: if the database cannot be opened
+    (unwritable cache dir, locked by a concurrent run) or a later read/write fails, the
+    cache disables itself and every file is parsed uncached.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        self._conn: sqlite3.Connection | None = None
+        try:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(db_path))
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS parsed ("
+                "kind TEXT NOT NULL, path TEXT NOT NULL, variant TEXT NOT NULL, "
+                "mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL, payload BLOB NOT NULL, "
+                "PRIMARY KEY (kind, path, variant))"
+            )
+        except (OSError, sqlite3.Error):
+            self._disable()
+
+    def __enter__(self) -> SessionParseCache:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _disable(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+
+    def get(self, kind: str, path: Path, variant: str, mtime_ns: int, size: int) -> tuple[bool, Any]:
+        if self._conn is None:
+            return False, None
+        try:
+            row = self._conn.execute(
+                "SELECT mtime_ns, size, payload FROM parsed WHERE kind = ? AND path = ? AND variant = ?",
+                (kind, str(path), variant),
+            ).fetchone()
+        except sqlite3.Error:
+            self._disable()
+            return False, None
+        if row is None or row[0] != mtime_ns or row[1] != size:
+            return False, None
+        try:
+            return True, pickle.loads(row[2])
+        except Exception:
+            return False, None
+
+    def put(self, kind: str, path: Path, variant: str, mtime_ns: int, size: int, value: Any) -> None:
+        if self._conn is None:
+            return
+        try:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO parsed (kind, path, variant, mtime_ns, size, payload) VALUES (?, ?, ?, ?, ?, ?)",
+                (kind, str(path), variant, mtime_ns, size, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)),
+            )
+        except sqlite3.Error:
+            self._disable()
+
+    def close(self) -> None:
+        if self._conn is None:
+            return
+        try:
+            self._conn.commit()
+        except sqlite3.Error:
+            pass
+        self._disable()
+
+
+def map_session_files(
+    fn: Callable[..., Any],
+    paths: list[Path],
+    *extra_args: list[Any],
+    max_workers: int | None = None,
+    cache: SessionParseCache | None = None,
+    cache_kind: str = "",
+) -> list[Any]:
+    """Apply a picklable per-file parser to `paths`, in a process pool when it pays off.
+
+    Session files are independent and parsing is CPU-bound JSON decoding, so large sets
+    are spread across processes (sidestepping the GIL). Small sets, or `max_workers=1`,
+    run inline to avoid pool startup cost. With a `cache`, only files whose
+    (mtime, size) changed since the last run are parsed; entries are namespaced by
+    `cache_kind`. Result order always matches `paths`.
+    """
+    results: list[Any] = [None] * len(paths)
+    pending: list[int] = []
+    stats: dict[int, tuple[str, int, int]] = {}
+    kind = f"{cache_kind}:v{SESSION_CACHE_VERSION}"
+    for idx, path in enumerate(paths):
+        if cache is not None:
+            try:
+                st = path.stat()
+            except OSError:
+                pending.append(idx)
+                continue
+            variant = repr(tuple(extra[idx] for extra in extra_args))
+            stats[idx] = (variant, st.st_mtime_ns, st.st_size)
+            hit, value = cache.get(kind, path, *stats[idx])
+            if hit:
+                results[idx] = value
+                continue
+        pending.append(idx)
+
+    pending_paths = [paths[idx] for idx in pending]
+    pending_extra = [[extra[idx] for idx in pending] for extra in extra_args]
+    if max_workers == 1 or len(pending_paths) < PARALLEL_PARSE_MIN_FILES:
+        parsed = [fn(*args) for args in zip(pending_paths, *pending_extra)]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            parsed = list(executor.map(fn, pending_paths, *pending_extra, chunksize=PARALLEL_PARSE_CHUNKSIZE))
+
+    for idx, value in zip(pending, parsed):
+        results[idx] = value
+        if cache is not None and idx in stats:
+            cache.put(kind, paths[idx], *stats[idx], value)
+    return results
+
+
+def load_codex_sessions(
+    codex_root: Path,
+    repo_root: Path,
+    *,
+    max_workers: int | None = None,
+    cache: SessionParseCache | None = None,
+) -> list[CodexSession]:
+    paths = scan_jsonl_files(codex_root, prefix="rollout-")
     sessions: list[CodexSession] = []
-    for path in sorted(codex_root.rglob("rollout-*.jsonl")):
-        session = parse_codex_session(path)
+    for session in map_session_files(
+        parse_codex_session,
+        paths,
+        max_workers=max_workers,
+        cache=cache,
+        cache_kind="codex",
+    ):
         if session is None:
             continue
         if not path_matches_repo(session.cwd, repo_root):
@@ -432,98 +1358,156 @@ def parse_claude_usage_line(
     )
 
 
-def load_claude_events(claude_projects_root: Path, repo_root: Path) -> list[ClaudeUsageEvent]:
+def parse_claude_file(path: Path, repo_root: Path, file_is_repo_scoped: bool) -> list[ClaudeUsageEvent]:
+    events: list[ClaudeUsageEvent] = []
+    try:
+        for obj in iter_jsonl_objects(path):
+            event = parse_claude_usage_line(
+                obj,
+                repo_root=repo_root,
+                file_is_repo_scoped=file_is_repo_scoped,
+            )
+            if event is None:
+                continue
+            events.append(
+                ClaudeUsageEvent(
+                    path=path,
+                    timestamp_utc=event.timestamp_utc,
+                    model=event.model,
+                    input_tokens=event.input_tokens,
+                    cache_creation_input_tokens=event.cache_creation_input_tokens,
+                    cache_read_input_tokens=event.cache_read_input_tokens,
+                    tokens_in=event.tokens_in,
+                    tokens_out=event.tokens_out,
+                    total_tokens=event.total_tokens,
+                    is_tool_use=event.is_tool_use,
+                )
+            )
+    except OSError:
+        return []
+    return events
+
+
+def load_claude_events(
+    claude_projects_root: Path,
+    repo_root: Path,
+    *,
+    max_workers: int | None = None,
+    cache: SessionParseCache | None = None,
+) -> list[ClaudeUsageEvent]:
     encoded_repo = "-" + str(repo_root.resolve()).strip("/").replace("/", "-")
     preferred_dir = claude_projects_root / encoded_repo
-    if preferred_dir.exists():
-        candidate_files = sorted(preferred_dir.rglob("*.jsonl"))
-    else:
-        candidate_files = sorted(claude_projects_root.rglob("*.jsonl"))
+    preferred_exists = preferred_dir.exists()
+    candidate_files = scan_jsonl_files(preferred_dir if preferred_exists else claude_projects_root)
 
+    scoped_flags = [preferred_exists and preferred_dir in path.parents for path in candidate_files]
     events: list[ClaudeUsageEvent] = []
-    for path in candidate_files:
-        file_is_repo_scoped = preferred_dir.exists() and preferred_dir in path.parents
-        try:
-            with path.open("r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        obj = json.loads(line)
-                    except json.JSONDecodeError:
-                        continue
-                    if not isinstance(obj, dict):
-                        continue
-                    event = parse_claude_usage_line(
-                        obj,
-                        repo_root=repo_root,
-                        file_is_repo_scoped=file_is_repo_scoped,
-                    )
-                    if event is None:
-                        continue
-                    events.append(
-                        ClaudeUsageEvent(
-                            path=path,
-                            timestamp_utc=event.timestamp_utc,
-                            model=event.model,
-                            input_tokens=event.input_tokens,
-                            cache_creation_input_tokens=event.cache_creation_input_tokens,
-                            cache_read_input_tokens=event.cache_read_input_tokens,
-                            tokens_in=event.tokens_in,
-                            tokens_out=event.tokens_out,
-                            total_tokens=event.total_tokens,
-                            is_tool_use=event.is_tool_use,
-                        )
-                    )
-        except OSError:
-            continue
+    for file_events in map_session_files(
+        parse_claude_file,
+        candidate_files,
+        [repo_root] * len(candidate_files),
+        scoped_flags,
+        max_workers=max_workers,
+        cache=cache,
+        cache_kind="claude",
+    ):
+        events.extend(file_events)
     events.sort(key=lambda row: row.timestamp_utc)
     return events
 
 
-def _filter_window_timestamps(
-    timestamps: list[datetime],
-    *,
-    start_exclusive: datetime | None,
-    end_inclusive: datetime,
-) -> list[datetime]:
-    return [
-        ts
-        for ts in timestamps
-        if (start_exclusive is None or ts > start_exclusive) and ts <= end_inclusive
-    ]
+EPOCH_UTC = datetime(1970, 1, 1, tzinfo=UTC)
+ONE_MICROSECOND = timedelta(microseconds=1)
+MICROS_PER_SECOND = 1_000_000
 
 
-def estimate_active_seconds_from_points(
-    timestamps: list[datetime],
+def epoch_micros(ts: datetime) -> int:
+    """Exact integer microseconds since the Unix epoch for an aware datetime."""
+    return (ts - EPOCH_UTC) // ONE_MICROSECOND
+
+
+def is_sorted(points: Sequence[int]) -> bool:
+    return all(a <= b for a, b in zip(points, points[1:]))
+
+
+def merge_sorted_micros(left: list[int], right: list[int]) -> list[int]:
+    """Merge two sorted point lists without unpack-and-sort when a shortcut applies.
+
+    Empty or non-overlapping inputs (e.g. a window with only Codex or only Claude activity)
+    are joined in O(1)/O(n). Overlapping inputs are concatenated once and sorted in place;
+    Timsort merges the two pre-sorted runs in C, which outpaces a Python-level heapq.merge.
+    """
+    if not left:
+        return right
+    if not right:
+        return left
+    if left[-1] <= right[0]:
+        return left + right
+    if right[-1] <= left[0]:
+        return right + left
+    merged = left + right
+    merged.sort()
+    return merged
+
+
+def slice_window_micros(points: list[int], *, start_exclusive: int | None, end_inclusive: int) -> list[int]:
+    """Return the sorted `points` inside `(start_exclusive, end_inclusive]` via two bisects."""
+    lo = 0 if start_exclusive is None else bisect_right(points, start_exclusive)
+    hi = bisect_right(points, end_inclusive)
+    return points[lo:hi]
+
+
+def estimate_active_seconds_from_epoch_micros(
+    points: Sequence[int],
     *,
     idle_threshold_seconds: int,
     min_burst_seconds: int,
 ) -> int:
-    if not timestamps:
+    """Burst-sum kernel over sorted integer epoch-microsecond timestamps.
+
+    Pure integer arithmetic: no datetime/timedelta objects are created per gap. Gaps are
+    non-negative, so floor division matches `int(timedelta.total_seconds())` truncation.
+    """
+    if not points:
         return 0
-    points = sorted(timestamps)
     threshold = max(0, idle_threshold_seconds)
     min_burst = max(0, min_burst_seconds)
 
     active = 0
-    burst_start = points[0]
-    prev = points[0]
+    burst_start = prev = points[0]
     for ts in points[1:]:
-        gap = int((ts - prev).total_seconds())
-        if gap <= threshold:
+        if (ts - prev) // MICROS_PER_SECOND <= threshold:
             prev = ts
             continue
-        burst_seconds = int((prev - burst_start).total_seconds())
-        active += max(min_burst, burst_seconds)
-        burst_start = ts
-        prev = ts
-    burst_seconds = int((prev - burst_start).total_seconds())
-    active += max(min_burst, burst_seconds)
+        burst_seconds = (prev - burst_start) // MICROS_PER_SECOND
+        active += burst_seconds if burst_seconds > min_burst else min_burst
+        burst_start = prev = ts
+    burst_seconds = (prev - burst_start) // MICROS_PER_SECOND
+    active += burst_seconds if burst_seconds > min_burst else min_burst
     return active
 
 
+def estimate_active_seconds_from_points(
+    timestamps: list[datetime],
+    *,
+    idle_threshold_seconds: int,
+    min_burst_seconds: int,
+) -> int:
+    """Datetime wrapper around the epoch-micro kernel; `timestamps` must already be sorted.
+
+    Every caller passes stored-sorted session/event timestamps, so no re-sort is done here.
+    """
+    if not timestamps:
+        return 0
+    points = [epoch_micros(ts) for ts in timestamps]
+    assert is_sorted(points), "timestamps must be sorted"
+    return estimate_active_seconds_from_epoch_micros(
+        points,
+        idle_threshold_seconds=idle_threshold_seconds,
+        min_burst_seconds=min_burst_seconds,
+    )
+
+
 def activity_summary_from_points(
     *,
     all_points: list[datetime],
@@ -533,38 +1517,52 @@ def activity_summary_from_points(
     idle_threshold_seconds: int,
     min_burst_seconds: int,
 ) -> dict[str, Any]:
-    filtered_all = _filter_window_timestamps(
-        all_points,
-        start_exclusive=start_exclusive,
-        end_inclusive=end_inclusive,
-    )
-    filtered_coding = _filter_window_timestamps(
-        coding_points,
-        start_exclusive=start_exclusive,
-        end_inclusive=end_inclusive,
+    """Datetime wrapper around `activity_summary_from_micros`; point lists must be sorted."""
+    start_us = epoch_micros(start_exclusive) if start_exclusive is not None else None
+    end_us = epoch_micros(end_inclusive)
+    all_micros = [epoch_micros(ts) for ts in all_points]
+    coding_micros = [epoch_micros(ts) for ts in coding_points]
+    assert is_sorted(all_micros) and is_sorted(coding_micros), "points must be sorted"
+    return activity_summary_from_micros(
+        all_points=slice_window_micros(all_micros, start_exclusive=start_us, end_inclusive=end_us),
+        coding_points=slice_window_micros(coding_micros, start_exclusive=start_us, end_inclusive=end_us),
+        start_exclusive=start_us,
+        end_inclusive=end_us,
+        idle_threshold_seconds=idle_threshold_seconds,
+        min_burst_seconds=min_burst_seconds,
     )
-    wall_start = start_exclusive if start_exclusive is not None else (filtered_all[0] if filtered_all else None)
-    wall_seconds = duration_seconds(wall_start, end_inclusive) if wall_start is not None else 0
-    active_seconds = estimate_active_seconds_from_points(
-        filtered_all,
+
+
+def activity_summary_from_micros(
+    *,
+    all_points: Sequence[int],
+    coding_points: Sequence[int],
+    start_exclusive: int | None,
+    end_inclusive: int,
+    idle_threshold_seconds: int,
+    min_burst_seconds: int,
+) -> dict[str, Any]:
+    """Activity summary over sorted epoch-micro points already restricted to the window."""
+    wall_start = start_exclusive if start_exclusive is not None else (all_points[0] if all_points else None)
+    wall_seconds = max(0, (end_inclusive - wall_start) // MICROS_PER_SECOND) if wall_start is not None else 0
+    active_seconds = estimate_active_seconds_from_epoch_micros(
+        all_points,
         idle_threshold_seconds=idle_threshold_seconds,
         min_burst_seconds=min_burst_seconds,
     )
-    coding_seconds = estimate_active_seconds_from_points(
-        filtered_coding,
+    coding_seconds = estimate_active_seconds_from_epoch_micros(
+        coding_points,
         idle_threshold_seconds=idle_threshold_seconds,
         min_burst_seconds=min_burst_seconds,
     )
-    if wall_seconds is None:
-        wall_seconds = 0
     active_seconds = min(active_seconds, wall_seconds)
     coding_seconds = min(coding_seconds, active_seconds)
     planning_seconds = max(0, active_seconds - coding_seconds)
     idle_seconds = max(0, wall_seconds - active_seconds)
     active_ratio = round((active_seconds / wall_seconds), 4) if wall_seconds else None
     return {
-        "events": len(filtered_all),
-        "coding_events": len(filtered_coding),
+        "events": len(all_points),
+        "coding_events": len(coding_points),
         "wall_seconds": wall_seconds,
         "active_seconds": active_seconds,
         "coding_seconds": coding_seconds,
@@ -581,19 +1579,13 @@ def activity_summary_from_points(
 
 def aggregate_usage_for_window(
     *,
-    codex_sessions: list[CodexSession],
-    claude_events: list[ClaudeUsageEvent],
+    codex_sessions: list[CodexSession] | CodexSessionIndex,
+    claude_events: list[ClaudeUsageEvent] | ClaudeEventColumns,
     start_exclusive: datetime | None,
     end_inclusive: datetime,
     idle_threshold_seconds: int = 300,
     min_burst_seconds: int = 60,
-    codex_price_in_per_1m: float = DEFAULT_GPT5_INPUT_USD_PER_1M,
-    codex_price_cached_input_per_1m: float = DEFAULT_GPT5_CACHED_INPUT_USD_PER_1M,
-    codex_price_out_per_1m: float = DEFAULT_GPT5_OUTPUT_USD_PER_1M,
-    claude_price_in_per_1m: float = DEFAULT_OPUS4_INPUT_USD_PER_1M,
-    claude_price_cache_write_per_1m: float = DEFAULT_OPUS4_CACHE_WRITE_USD_PER_1M,
-    claude_price_cache_read_per_1m: float = DEFAULT_OPUS4_CACHE_READ_USD_PER_1M,
-    claude_price_out_per_1m: float = DEFAULT_OPUS4_OUTPUT_USD_PER_1M,
+    prices: PriceTable = PriceTable(),
 ) -> dict[str, Any]:
     codex_in = 0
     codex_cached_in = 0
@@ -602,29 +1594,28 @@ def aggregate_usage_for_window(
     codex_total = 0
     codex_sessions_with_usage: set[str] = set()
     codex_files_with_usage = 0
-    codex_model_totals: dict[str, int] = {}
-    codex_all_points: list[datetime] = []
-    codex_coding_points: list[datetime] = []
-
-    for session in codex_sessions:
+    codex_model_totals: Counter[str] = Counter()
+    codex_all_points: list[int] = []
+    codex_coding_points: list[int] = []
+    start_us = epoch_micros(start_exclusive) if start_exclusive is not None else None
+    end_us = epoch_micros(end_inclusive)
+
+    codex = (
+        codex_sessions
+        if isinstance(codex_sessions, CodexSessionIndex)
+        else CodexSessionIndex.from_sessions(codex_sessions)
+    )
+    for session in codex.overlapping(start_exclusive=start_us, end_inclusive=end_us):
         delta = codex_tokens_in_window(
             session,
             start_exclusive=start_exclusive,
             end_inclusive=end_inclusive,
         )
         codex_all_points.extend(
-            _filter_window_timestamps(
-                session.event_timestamps,
-                start_exclusive=start_exclusive,
-                end_inclusive=end_inclusive,
-            )
+            slice_window_micros(session.event_micros, start_exclusive=start_us, end_inclusive=end_us)
         )
         codex_coding_points.extend(
-            _filter_window_timestamps(
-                session.coding_timestamps,
-                start_exclusive=start_exclusive,
-                end_inclusive=end_inclusive,
-            )
+            slice_window_micros(session.coding_micros, start_exclusive=start_us, end_inclusive=end_us)
         )
         if safe_int(delta.get("total_tokens")) <= 0:
             continue
@@ -636,85 +1627,80 @@ def aggregate_usage_for_window(
         codex_files_with_usage += 1
         codex_sessions_with_usage.add(session.session_id or str(session.path))
         model_key = session.model or "unknown"
-        codex_model_totals[model_key] = codex_model_totals.get(model_key, 0) + safe_int(delta.get("total_tokens"))
-
-    claude_in = 0
-    claude_base_in = 0
-    claude_cache_write_in = 0
-    claude_cache_read_in = 0
-    claude_out = 0
-    claude_total = 0
-    claude_files_with_usage: set[str] = set()
-    claude_model_totals: dict[str, int] = {}
-    claude_all_points: list[datetime] = []
-    claude_coding_points: list[datetime] = []
-    for event in claude_events:
-        if start_exclusive is not None and event.timestamp_utc <= start_exclusive:
-            continue
-        if event.timestamp_utc > end_inclusive:
-            continue
-        claude_all_points.append(event.timestamp_utc)
-        if event.is_tool_use:
-            claude_coding_points.append(event.timestamp_utc)
-        claude_base_in += event.input_tokens
-        claude_cache_write_in += event.cache_creation_input_tokens
-        claude_cache_read_in += event.cache_read_input_tokens
-        claude_in += event.tokens_in
-        claude_out += event.tokens_out
-        claude_total += event.total_tokens
-        claude_files_with_usage.add(str(event.path))
-        model_key = event.model or "unknown"
-        claude_model_totals[model_key] = claude_model_totals.get(model_key, 0) + event.total_tokens
-
-    codex_timing = activity_summary_from_points(
+        codex_model_totals[model_key] += safe_int(delta.get("total_tokens"))
+
+    claude = (
+        claude_events
+        if isinstance(claude_events, ClaudeEventColumns)
+        else ClaudeEventColumns.from_events(claude_events)
+    )
+    lo, hi = claude.window_bounds(start_exclusive=start_exclusive, end_inclusive=end_inclusive)
+    claude_all_points = claude.micros[lo:hi]
+    claude_coding_points = list(compress(claude_all_points, claude.is_tool_use[lo:hi]))
+    claude_base_in = claude.window_sum("input_tokens", lo, hi)
+    claude_cache_write_in = claude.window_sum("cache_creation_input_tokens", lo, hi)
+    claude_cache_read_in = claude.window_sum("cache_read_input_tokens", lo, hi)
+    claude_in = claude.window_sum("tokens_in", lo, hi)
+    claude_out = claude.window_sum("tokens_out", lo, hi)
+    claude_total = claude.window_sum("total_tokens", lo, hi)
+    claude_files_with_usage = set(claude.paths[lo:hi])
+    claude_model_totals: Counter[str] = Counter()
+    for model_key, total_tokens in zip(claude.models[lo:hi], claude.total_tokens[lo:hi]):
+        claude_model_totals[model_key] += total_tokens
+
+    # Per-session slices are each sorted; the burst kernel needs one sorted stream. Timsort
+    # merges these pre-sorted runs in C, which beats a Python-level heapq.merge.
+    codex_all_points.sort()
+    codex_coding_points.sort()
+    codex_timing = activity_summary_from_micros(
         all_points=codex_all_points,
         coding_points=codex_coding_points,
-        start_exclusive=start_exclusive,
-        end_inclusive=end_inclusive,
+        start_exclusive=start_us,
+        end_inclusive=end_us,
         idle_threshold_seconds=idle_threshold_seconds,
         min_burst_seconds=min_burst_seconds,
     )
-    claude_timing = activity_summary_from_points(
+    claude_timing = activity_summary_from_micros(
         all_points=claude_all_points,
         coding_points=claude_coding_points,
-        start_exclusive=start_exclusive,
-        end_inclusive=end_inclusive,
+        start_exclusive=start_us,
+        end_inclusive=end_us,
         idle_threshold_seconds=idle_threshold_seconds,
         min_burst_seconds=min_burst_seconds,
     )
-    combined_timing = activity_summary_from_points(
-        all_points=[*codex_all_points, *claude_all_points],
-        coding_points=[*codex_coding_points, *claude_coding_points],
-        start_exclusive=start_exclusive,
-        end_inclusive=end_inclusive,
+    combined_timing = activity_summary_from_micros(
+        all_points=merge_sorted_micros(codex_all_points, claude_all_points),
+        coding_points=merge_sorted_micros(codex_coding_points, claude_coding_points),
+        start_exclusive=start_us,
+        end_inclusive=end_us,
         idle_threshold_seconds=idle_threshold_seconds,
         min_burst_seconds=min_burst_seconds,
     )
     codex_cost = estimate_cost_usd(
         codex_uncached_in,
         codex_out,
-        price_in_per_1m=codex_price_in_per_1m,
-        price_out_per_1m=codex_price_out_per_1m,
+        price_in_per_1m=prices.gpt5_input_per_1m,
+        price_out_per_1m=prices.gpt5_output_per_1m,
     ) + estimate_cost_usd(
         codex_cached_in,
         0,
-        price_in_per_1m=codex_price_cached_input_per_1m,
+        price_in_per_1m=prices.gpt5_cached_input_per_1m,
         price_out_per_1m=0.0,
     )
     claude_cost = estimate_cost_usd(
         claude_base_in,
         claude_out,
-        price_in_per_1m=claude_price_in_per_1m,
-        price_out_per_1m=claude_price_out_per_1m,
+        price_in_per_1m=prices.opus4_input_per_1m,
+        price_out_per_1m=prices.opus4_output_per_1m,
     ) + estimate_cost_usd(
         claude_cache_write_in,
         0,
-        price_in_per_1m=claude_price_cache_write_per_1m,
+        price_in_per_1m=prices.opus4_cache_write_per_1m,
         price_out_per_1m=0.0,
     ) + estimate_cost_usd(
         claude_cache_read_in,
         0,
-        price_in_per_1m=claude_price_cache_read_per_1m,
+        price_in_per_1m=prices.opus4_cache_read_per_1m,
         price_out_per_1m=0.0,
     )
     combined_cost = codex_cost + claude_cost
@@ -725,7 +1711,7 @@ def aggregate_usage_for_window(
             "end_inclusive_utc": end_inclusive.isoformat(),
         },
         "codex": {
-            "sessions_considered": len(codex_sessions),
+            "sessions_considered": len(codex),
             "files_with_usage": codex_files_with_usage,
             "sessions_with_usage": len(codex_sessions_with_usage),
             "tokens_in": codex_in,
@@ -734,10 +1720,10 @@ def aggregate_usage_for_window(
             "tokens_out": codex_out,
             "total_tokens": codex_total,
             "estimated_cost_usd": round(codex_cost, 2),
-            "model_tokens": dict(sorted(codex_model_totals.items(), key=lambda row: row[0])),
+            "model_tokens": dict(sorted(codex_model_totals.items())),
         },
         "claude": {
-            "events_considered": len(claude_events),
+            "events_considered": len(claude),
             "files_with_usage": len(claude_files_with_usage),
             "tokens_in": claude_in,
             "tokens_in_base": claude_base_in,
@@ -746,7 +1732,7 @@ def aggregate_usage_for_window(
             "tokens_out": claude_out,
             "total_tokens": claude_total,
             "estimated_cost_usd": round(claude_cost, 2),
-            "model_tokens": dict(sorted(claude_model_totals.items(), key=lambda row: row[0])),
+            "model_tokens": dict(sorted(claude_model_totals.items())),
         },
         "combined": {
             "tokens_in": codex_in + claude_in,
@@ -754,19 +1740,7 @@ def aggregate_usage_for_window(
             "total_tokens": codex_total + claude_total,
             "estimated_cost_usd": round(combined_cost, 2),
         },
-        "cost_assumptions_usd_per_1m": {
-            "codex_gpt5x": {
-                "input_uncached": codex_price_in_per_1m,
-                "input_cached": codex_price_cached_input_per_1m,
-                "output": codex_price_out_per_1m,
-            },
-            "claude_opus4x": {
-                "input_base": claude_price_in_per_1m,
-                "input_cache_write": claude_price_cache_write_per_1m,
-                "input_cache_read": claude_price_cache_read_per_1m,
-                "output": claude_price_out_per_1m,
-            },
-        },
+        "cost_assumptions_usd_per_1m": prices.cost_assumptions(),
         "timing": {
             "idle_threshold_seconds": idle_threshold_seconds,
             "min_burst_seconds": min_burst_seconds,
@@ -778,9 +1752,9 @@ def aggregate_usage_for_window(
 
 
 def parse_scc_cocomo(text_output: str) -> dict[str, Any]:
-    cost_match = re.search(r"Estimated Cost to Develop \(organic\)\s+\$([0-9,]+)", text_output)
-    schedule_match = re.search(r"Estimated Schedule Effort \(organic\)\s+([0-9.]+)\s+months", text_output)
-    people_match = re.search(r"Estimated People Required \(organic\)\s+([0-9.]+)", text_output)
+    cost_match = SCC_COST_RE.search(text_output)
+    schedule_match = SCC_SCHEDULE_RE.search(text_output)
+    people_match = SCC_PEOPLE_RE.search(text_output)
     return {
         "estimated_cost_usd": int(cost_match.group(1).replace(",", "")) if cost_match else None,
         "estimated_schedule_months": float(schedule_match.group(1)) if schedule_match else None,
@@ -788,94 +1762,421 @@ def parse_scc_cocomo(text_output: str) -> dict[str, Any]:
     }
 
 
-def collect_scc_snapshot(repo_root: Path, ref: str) -> dict[str, Any]:
+SNAPSHOT_CACHE_VERSION = 1
+DEFAULT_SNAPSHOT_CACHE_DIR = "~/.cache/realitycheck/snapshots"
+
+
+class SnapshotCache:
+    """On-disk JSON cache of per-tag snapshots keyed by git tree SHA.
+
+    A tree SHA fully determines the checked-out content, so a snapshot computed for it
+    never goes stale; bump `SNAPSHOT_CACHE_VERSION` when a snapshot's shape changes.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    def _path(self, kind: str, tree_sha: str) -> Path:
+        return self.root / f"{tree_sha}.{kind}.v{SNAPSHOT_CACHE_VERSION}.json"
+
+    def get(self, kind: str, tree_sha: str) -> dict[str, Any] | None:
+        try:
+            value = json_loads(self._path(kind, tree_sha).read_bytes())
+        except (OSError, ValueError):
+            return None
+        return value if isinstance(value, dict) else None
+
+    def put(self, kind: str, tree_sha: str, value: dict[str, Any]) -> None:
+        path = self._path(kind, tree_sha)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(json_dumps(value))
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+
+def resolve_tree_sha(repo_root: Path, ref: str) -> str:
+    return run_command(["git", "rev-parse", f"{ref}^{{tree}}"], cwd=repo_root).strip()
+
+
+def group_refs_by_tree(repo_root: Path, refs: Sequence[str]) -> tuple[list[str], list[int]]:
+    """One representative ref per distinct tree, plus each ref's index into that list.
+
+    Snapshots are a function of the tree alone, so consecutive tags with identical content
+    (re-tags, metadata-only releases) share one collection. Trees resolve over one cat-file pipe.
+    """
+    slot_by_tree: dict[str, int] = {}
+    unique_refs: list[str] = []
+    slots: list[int] = []
+    with GitBatch(repo_root) as batch:
+        for ref in refs:
+            info = batch.info(f"{ref}^{{tree}}")
+            slot = slot_by_tree.setdefault(info[0] if info is not None else f"unresolved:{ref}", len(unique_refs))
+            if slot == len(unique_refs):
+                unique_refs.append(ref)
+            slots.append(slot)
+    return unique_refs, slots
+
+
+@lru_cache(maxsize=None)
+def scc_supports_json2(scc_path: str) -> bool:
+    """Whether this scc binary emits `--format json2` (language rows plus COCOMO), probed once."""
+    with tempfile.TemporaryDirectory(prefix="realitycheck-scc-probe-") as probe_dir:
+        try:
+            output = run_command([scc_path, "--format", "json2", probe_dir])
+            return isinstance(json.loads(output), dict)
+        except (subprocess.CalledProcessError, OSError, ValueError):
+            return False
+
+
+def scc_json2_cocomo(summary: dict[str, Any]) -> dict[str, Any]:
+    """COCOMO fields from scc json2, rounded the way the text report prints them."""
+    cost = summary.get("estimatedCost")
+    schedule = summary.get("estimatedScheduleMonths")
+    people = summary.get("estimatedPeople")
+    return {
+        "estimated_cost_usd": int(cost) if isinstance(cost, (int, float)) else None,
+        "estimated_schedule_months": round(float(schedule), 2) if isinstance(schedule, (int, float)) else None,
+        "estimated_people": round(float(people), 2) if isinstance(people, (int, float)) else None,
+    }
+
+
+# Materializing a tag must not run the user's hooks or fetch LFS objects.
+CHECKOUT_GIT = ["git", "-c", "core.hooksPath=/dev/null"]
+CHECKOUT_ENV_OVERRIDES = {"GIT_LFS_SKIP_SMUDGE": "1"}
+
+
+class TagCheckout:
+    """One detached `git worktree` reused to materialize successive refs.
+
+    Created once with `--no-checkout`; each `checkout(ref)` only rewrites files that differ
+    from the previous ref, instead of a full `git archive | tar -x` into a fresh tempdir.
+    Asking for the ref that is already checked out is a no-op, so several collectors can
+    share one materialized tree per tag. Hooks are disabled and LFS pointers are left
+    unsmudged. Unlike `git archive`, `export-ignore` attributes are not applied.
+    """
+
+    def __init__(self, repo_root: Path) -> None:
+        self.repo_root = repo_root
+        self._tmp: tempfile.TemporaryDirectory[str] | None = None
+        self.path: Path | None = None
+        self.ref: str | None = None
+
+    def __enter__(self) -> TagCheckout:
+        self._tmp = tempfile.TemporaryDirectory(prefix="realitycheck-worktree-")
+        self.path = Path(self._tmp.name) / "tree"
+        run_command(
+            [*CHECKOUT_GIT, "worktree", "add", "--detach", "--no-checkout", str(self.path)],
+            cwd=self.repo_root,
+            env={**os.environ, **CHECKOUT_ENV_OVERRIDES},
+        )
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self.path is not None:
+            subprocess.run(
+                ["git", "worktree", "remove", "--force", str(self.path)],
+                cwd=str(self.repo_root),
+                capture_output=True,
+                check=False,
+            )
+            subprocess.run(["git", "worktree", "prune"], cwd=str(self.repo_root), capture_output=True, check=False)
+        if self._tmp is not None:
+            self._tmp.cleanup()
+        self._tmp = None
+        self.path = None
+        self.ref = None
+
+    def checkout(self, ref: str) -> Path:
+        if self.path is None:
+            raise RuntimeError("TagCheckout used outside of its context manager")
+        if ref == self.ref:
+            return self.path
+        self.ref = None
+        try:
+            run_command(
+                [*CHECKOUT_GIT, "checkout", "--force", "--detach", "--quiet", ref],
+                cwd=self.path,
+                env={**os.environ, **CHECKOUT_ENV_OVERRIDES},
+            )
+        except subprocess.CalledProcessError as exc:
+            raise RuntimeError(f"git checkout failed for {ref}: {(exc.stderr or '').strip()}") from exc
+        self.ref = ref
+        return self.path
+
+
+def collect_scc_snapshot(
+    repo_root: Path,
+    ref: str,
+    *,
+    checkout: TagCheckout | None = None,
+    cache: SnapshotCache | None = None,
+    lightweight: bool = False,
+) -> dict[str, Any]:
+    if lightweight:
+        if cache is None:
+            return collect_lightweight_loc_snapshot(repo_root, ref)
+        tree_sha = resolve_tree_sha(repo_root, ref)
+        cached = cache.get("loc", tree_sha)
+        if cached is None:
+            cached = collect_lightweight_loc_snapshot(repo_root, ref)
+            cache.put("loc", tree_sha, cached)
+        return cached
     if shutil.which("scc") is None:
         return {"error": "scc not found in PATH"}
+    if cache is not None:
+        tree_sha = resolve_tree_sha(repo_root, ref)
+        cached = cache.get("scc", tree_sha)
+        if cached is None:
+            cached = collect_scc_snapshot(repo_root, ref, checkout=checkout)
+            cache.put("scc", tree_sha, cached)
+        return cached
+    if checkout is None:
+        with TagCheckout(repo_root) as owned_checkout:
+            return collect_scc_snapshot(repo_root, ref, checkout=owned_checkout)
+
+    tmp_path = checkout.checkout(ref)
+    if scc_supports_json2(shutil.which("scc") or "scc"):
+        # One run: json2 carries the language rows and the COCOMO estimates together.
+        summary = json.loads(run_command(["scc", "--format", "json2", str(tmp_path)]))
+        if not isinstance(summary, dict):
+            raise RuntimeError(f"unexpected scc json2 format for {ref}")
+        rows = summary.get("languageSummary") or []
+        cocomo = scc_json2_cocomo(summary)
+    else:
+        rows = json.loads(run_command(["scc", "--format", "json", str(tmp_path)]))
+        cocomo = parse_scc_cocomo(run_command(["scc", str(tmp_path)]))
+    if not isinstance(rows, list):
+        raise RuntimeError(f"unexpected scc JSON format for {ref}")
+
+    totals = [0] * len(SCC_FIELDS)
+    python_totals = [0] * len(SCC_FIELDS)
+    for row_any in rows:
+        if not isinstance(row_any, dict):
+            continue
+        # scc emits plain ints; only anything else pays for the defensive `safe_int` call.
+        values = [
+            value if type(value) is int else safe_int(value) for value in map(row_any.get, SCC_SOURCE_FIELDS)
+        ]
+        totals = [total + value for total, value in zip(totals, values)]
+        if row_any.get("Name") == "Python":
+            python_totals = values
 
-    with tempfile.TemporaryDirectory(prefix="realitycheck-scc-") as tmp_dir:
-        tmp_path = Path(tmp_dir)
+    return {
+        "totals": dict(zip(SCC_KEYS, totals)),
+        "python": dict(zip(SCC_KEYS, python_totals)),
+        "cocomo": cocomo,
+    }
 
-        archive_proc = subprocess.Popen(
-            ["git", "archive", ref],
-            cwd=str(repo_root),
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
-        assert archive_proc.stdout is not None
-        extract = subprocess.run(
-            ["tar", "-x", "-C", str(tmp_path)],
-            stdin=archive_proc.stdout,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        archive_proc.stdout.close()
+
+# Extension -> (scc-style language name, line-comment prefix) for the in-process LOC counter.
+LIGHTWEIGHT_LANGUAGES: dict[str, tuple[str, bytes | None]] = {
+    ".py": ("Python", b"#"),
+    ".sh": ("Shell", b"#"),
+    ".bash": ("Shell", b"#"),
+    ".yaml": ("YAML", b"#"),
+    ".yml": ("YAML", b"#"),
+    ".toml": ("TOML", b"#"),
+    ".md": ("Markdown", None),
+    ".json": ("JSON", None),
+    ".jsonl": ("JSONL", None),
+    ".txt": ("Plain Text", None),
+    ".html": ("HTML", None),
+    ".css": ("CSS", None),
+    ".j2": ("Jinja", None),
+    ".js": ("JavaScript", b"//"),
+    ".ts": ("TypeScript", b"//"),
+}
+
+
+def collect_scc_snapshots(
+    repo_root: Path,
+    refs: Sequence[str],
+    *,
+    cache: SnapshotCache | None = None,
+) -> list[dict[str, Any]]:
+    """Full scc snapshots for `refs`, in order, from one reused worktree.
+
+    These runs stay sequential: they share the worktree and scc already uses every core.
+    """
+    if shutil.which("scc") is None:
+        return [collect_scc_snapshot(repo_root, ref, cache=cache) for ref in refs]
+    with TagCheckout(repo_root) as checkout:
+        return [collect_scc_snapshot(repo_root, ref, checkout=checkout, cache=cache) for ref in refs]
+
+
+def count_loc_bytes(data: bytes, comment_prefix: bytes | None) -> tuple[int, int, int, int]:
+    """Return (lines, code, comments, blanks) using whole-line comment detection only."""
+    lines = data.splitlines()
+    blanks = 0
+    comments = 0
+    for line in lines:
+        stripped = line.strip()
+        if not stripped:
+            blanks += 1
+        elif comment_prefix is not None and stripped.startswith(comment_prefix):
+            comments += 1
+    return len(lines), len(lines) - blanks - comments, comments, blanks
+
+
+ARCHIVE_PIPE_SIZE = 1 << 20
+
+
+def widen_pipe(stream: Any) -> None:
+    """Best-effort enlarge of a Linux pipe buffer so `git archive` stalls less on backpressure."""
+    set_pipe_size = getattr(fcntl, "F_SETPIPE_SZ", None)
+    if set_pipe_size is None:
+        return
+    try:
+        fcntl.fcntl(stream.fileno(), set_pipe_size, ARCHIVE_PIPE_SIZE)
+    except OSError:
+        pass
+
+
+def collect_lightweight_loc_snapshot(repo_root: Path, ref: str) -> dict[str, Any]:
+    """Approximate the scc snapshot by streaming `git archive` through `tarfile` in-process.
+
+    No tree is written to disk and no scc process is started. Only extensions in
+    `LIGHTWEIGHT_LANGUAGES` are counted, comments are whole-line only (docstrings count
+    as code), and complexity/COCOMO are not estimated.
+    """
+    totals = {"files": 0, "lines": 0, "code": 0, "comments": 0, "blanks": 0, "complexity": 0}
+    python_totals = dict(totals)
+    archive_proc = subprocess.Popen(
+        ["git", "archive", "--format=tar", ref],
+        cwd=str(repo_root),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        bufsize=ARCHIVE_PIPE_SIZE,
+    )
+    assert archive_proc.stdout is not None
+    widen_pipe(archive_proc.stdout)
+    try:
+        with tarfile.open(fileobj=archive_proc.stdout, mode="r|") as archive:
+            for member in archive:
+                if not member.isfile():
+                    continue
+                language = LIGHTWEIGHT_LANGUAGES.get(os.path.splitext(member.name)[1].lower())
+                handle = archive.extractfile(member) if language is not None else None
+                if language is None or handle is None:
+                    continue
+                data = handle.read()
+                if b"\x00" in data[:8000]:
+                    continue
+                lines, code, comments, blanks = count_loc_bytes(data, language[1])
+                targets = (totals, python_totals) if language[0] == "Python" else (totals,)
+                for target in targets:
+                    target["files"] += 1
+                    target["lines"] += lines
+                    target["code"] += code
+                    target["comments"] += comments
+                    target["blanks"] += blanks
+    except tarfile.TarError as exc:
+        archive_proc.kill()
         archive_stderr = archive_proc.stderr.read().decode("utf-8", errors="replace") if archive_proc.stderr else ""
-        archive_rc = archive_proc.wait()
-        if archive_rc != 0:
-            raise RuntimeError(f"git archive failed for {ref}: {archive_stderr.strip()}")
-        if extract.returncode != 0:
-            raise RuntimeError(f"tar extract failed for {ref}: {extract.stderr.strip()}")
-
-        scc_json_raw = run_command(["scc", "--format", "json", str(tmp_path)])
-        rows = json.loads(scc_json_raw)
-        if not isinstance(rows, list):
-            raise RuntimeError(f"unexpected scc JSON format for {ref}")
-
-        totals = {
-            "files": 0,
-            "lines": 0,
-            "code": 0,
-            "comments": 0,
-            "blanks": 0,
-            "complexity": 0,
-        }
-        python_totals = {
-            "files": 0,
-            "lines": 0,
-            "code": 0,
-            "comments": 0,
-            "blanks": 0,
-            "complexity": 0,
-        }
-        for row_any in rows:
-            if not isinstance(row_any, dict):
-                continue
-            count = safe_int(row_any.get("Count"))
-            lines = safe_int(row_any.get("Lines"))
-            code = safe_int(row_any.get("Code"))
-            comments = safe_int(row_any.get("Comment"))
-            blanks = safe_int(row_any.get("Blank"))
-            complexity = safe_int(row_any.get("Complexity"))
-            totals["files"] += count
-            totals["lines"] += lines
-            totals["code"] += code
-            totals["comments"] += comments
-            totals["blanks"] += blanks
-            totals["complexity"] += complexity
-            if row_any.get("Name") == "Python":
-                python_totals = {
-                    "files": count,
-                    "lines": lines,
-                    "code": code,
-                    "comments": comments,
-                    "blanks": blanks,
-                    "complexity": complexity,
-                }
-
-        scc_text = run_command(["scc", str(tmp_path)])
-        cocomo = parse_scc_cocomo(scc_text)
-        return {
-            "totals": totals,
-            "python": python_totals,
-            "cocomo": cocomo,
-        }
+        archive_proc.wait()
+        raise RuntimeError(f"git archive failed for {ref}: {archive_stderr.strip() or exc}") from exc
+    finally:
+        archive_proc.stdout.close()
+    archive_stderr = archive_proc.stderr.read().decode("utf-8", errors="replace") if archive_proc.stderr else ""
+    if archive_proc.wait() != 0:
+        raise RuntimeError(f"git archive failed for {ref}: {archive_stderr.strip()}")
+    return {
+        "method": "lightweight",
+        "totals": totals,
+        "python": python_totals,
+        "cocomo": parse_scc_cocomo(""),
+    }
 
 
-def count_tests_in_file(path: Path) -> int:
+# One left-to-right lexer pass: line-anchored shapes `count_tests_with_ast` counts (top-level `class X...:`
+# headers, `def test_*` at any indent, and the lookahead for any other column-0 statement, which ends a
+# class body), plus comments, string literals and brackets, which are consumed whole so nothing inside
+# them is mistaken for a line start.
+FAST_TEST_COUNT = True
+TEST_SCAN_RE = re.compile(
+    r"^(?:class[ \t]+(?P<cls>\w+)(?P<head>[^\n]*)|(?P<indent>[ \t]*)(?:async[ \t]+)?def[ \t]+test_|(?=[^\s#]))"
+    r"|(?P<skip>#[^\n]*+"
+    r"|'''(?:[^'\\]++|\\[\s\S]|'(?!''))*+'''"
+    r'|"""(?:[^"\\]++|\\[\s\S]|"(?!""))*+"""'
+    r"|'(?:[^'\\\n]++|\\[\s\S])*+'"
+    r'|"(?:[^"\\\n]++|\\[\s\S])*+")'
+    r"|(?P<open>[(\[{])|(?P<close>[)\]}])|(?P<cont>\\\r?\n)"
+    r"|(?P<bad>['\"\\])",
+    re.M,
+)
+CLASS_BODY_INDENT_RE = re.compile(r"\n([ \t]*)[^\s#]")
+
+
+def scan_test_count(source: str) -> int | None:
+    """Count tests like `count_tests_with_ast` without building an AST.
+
+    Returns None, so the caller falls back to `ast`, when the lexer hits something it
+    cannot place: unterminated strings, unbalanced brackets, a stray backslash, or class
+    headers that do not end on their own line with `:`.
+    """
+    if "test_" not in source:
+        return 0
+    count = 0
+    depth = 0
+    continued_at = -1
+    test_indent: str | None = None
+    for match in TEST_SCAN_RE.finditer(source):
+        kind = match.lastgroup
+        if kind == "skip":
+            continue
+        if kind == "cont":
+            continued_at = match.end()
+            continue
+        if kind == "open":
+            depth += 1
+            continue
+        if kind == "close":
+            depth -= 1
+            if depth < 0:
+                return None
+            continue
+        if kind == "bad":
+            return None
+        if depth or match.start() == continued_at:
+            if kind == "head":
+                return None
+            continue  # continuation line inside brackets or after a backslash
+        if kind == "head":
+            head = match.group("head")
+            if "\\" in head or '"' in head or "'" in head:
+                return None
+            code = head.split("#", 1)[0].rstrip()
+            if not code.endswith(":") or code.count("(") != code.count(")"):
+                return None
+            body = CLASS_BODY_INDENT_RE.search(source, match.end()) if match.group("cls").startswith("Test") else None
+            test_indent = (body.group(1) or None) if body else None
+            continue
+        indent = match.group("indent")
+        if indent is None:
+            test_indent = None
+        elif not indent:
+            count += 1
+            test_indent = None
+        elif indent == test_indent:
+            count += 1
+    return None if depth else count
+
+
+def count_tests_in_source(source: str, filename: str = "<unknown>") -> int:
+    if FAST_TEST_COUNT:
+        count = scan_test_count(source)
+        if count is not None:
+            return count
+    return count_tests_with_ast(source, filename)
+
+
+def count_tests_with_ast(source: str, filename: str = "<unknown>") -> int:
     try:
-        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
-    except (OSError, SyntaxError):
+        tree = ast.parse(source, filename=filename)
+    except SyntaxError:
         return 0
 
     count = 0
@@ -890,98 +2191,205 @@ def count_tests_in_file(path: Path) -> int:
     return count
 
 
+ADVERSARIAL_TEST_RE = re.compile("adversarial", re.IGNORECASE)
+INTEGRATION_TEST_RE = re.compile("integration|e2e", re.IGNORECASE)
+
+
 def classify_test_file(path: Path) -> str:
-    name = path.name.lower()
-    path_text = str(path).lower()
-    if "adversarial" in name or "adversarial" in path_text:
+    # A full-path match also covers the file name; "e2e" covers `test_e2e.py`.
+    if ADVERSARIAL_TEST_RE.search(str(path)):
         return "adversarial"
-    if name == "test_e2e.py" or "integration" in name or "e2e" in name:
+    if INTEGRATION_TEST_RE.search(path.name):
         return "integration"
     return "unit"
 
 
-def collect_test_composition_from_tree(root: Path) -> dict[str, Any]:
-    tests_root = root / "tests"
-    if not tests_root.exists():
-        return {
-            "tests_root": "tests",
-            "test_files": 0,
-            "test_functions": 0,
-            "by_category": {
-                "unit": {"test_files": 0, "test_functions": 0},
-                "integration": {"test_files": 0, "test_functions": 0},
-                "adversarial": {"test_files": 0, "test_functions": 0},
-            },
-        }
+def is_test_file_name(name: str) -> bool:
+    """Whether a file name matches the `test_*.py` / `*_test.py` discovery patterns."""
+    return name.endswith(".py") and (name.startswith("test_") or name.endswith("_test.py"))
 
-    files = sorted(
-        {
-            path
-            for pattern in ("test_*.py", "*_test.py")
-            for path in tests_root.rglob(pattern)
-            if path.is_file()
-        }
-    )
+
+def summarize_test_files(files: Iterable[tuple[Path, int]]) -> dict[str, Any]:
+    """Build the test-composition snapshot from `(path, test_function_count)` pairs."""
     by_category = {
         "unit": {"test_files": 0, "test_functions": 0},
         "integration": {"test_files": 0, "test_functions": 0},
         "adversarial": {"test_files": 0, "test_functions": 0},
     }
+    total_files = 0
     total_functions = 0
-    for file_path in files:
+    for file_path, functions in files:
         category = classify_test_file(file_path)
-        functions = count_tests_in_file(file_path)
         by_category[category]["test_files"] += 1
         by_category[category]["test_functions"] += functions
+        total_files += 1
         total_functions += functions
 
     return {
         "tests_root": "tests",
-        "test_files": len(files),
+        "test_files": total_files,
         "test_functions": total_functions,
         "by_category": by_category,
     }
 
 
-def collect_test_composition_snapshot(repo_root: Path, ref: str) -> dict[str, Any]:
-    with tempfile.TemporaryDirectory(prefix="realitycheck-tests-") as tmp_dir:
-        tmp_path = Path(tmp_dir)
-        archive_proc = subprocess.Popen(
-            ["git", "archive", ref],
-            cwd=str(repo_root),
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
-        assert archive_proc.stdout is not None
-        extract = subprocess.run(
-            ["tar", "-x", "-C", str(tmp_path)],
-            stdin=archive_proc.stdout,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        archive_proc.stdout.close()
-        archive_stderr = archive_proc.stderr.read().decode("utf-8", errors="replace") if archive_proc.stderr else ""
-        archive_rc = archive_proc.wait()
-        if archive_rc != 0:
-            raise RuntimeError(f"git archive failed for {ref}: {archive_stderr.strip()}")
-        if extract.returncode != 0:
-            raise RuntimeError(f"tar extract failed for {ref}: {extract.stderr.strip()}")
-        return collect_test_composition_from_tree(tmp_path)
+# Test counts by git blob SHA; unchanged test files are shared by most consecutive tags.
+BLOB_TEST_COUNT_CACHE: dict[str, int] = {}
+
+
+# Parsed `(path, sha)` test blobs by git tree SHA; an unchanged `tests/` subtree is listed once per report.
+TREE_TEST_BLOBS_CACHE: dict[str, list[tuple[str, str]]] = {}
+
+
+def list_test_blobs(batch: GitBatch, tree_sha: str) -> list[tuple[str, str]]:
+    """`(relative_path, blob_sha)` for every test file under a tree, read over the cat-file pipe.
+
+    Equivalent to `git ls-tree -r` filtered by `is_test_file_name`, but without a process per
+    tag: tree objects are parsed in-process and cached by SHA. Symlinks and submodules are skipped.
+    """
+    cached = TREE_TEST_BLOBS_CACHE.get(tree_sha)
+    if cached is not None:
+        return cached
+    obj = batch.read(tree_sha)
+    if obj is None or obj[1] != "tree":
+        return []
+    content = obj[2]
+    raw_len = len(obj[0]) // 2
+    blobs: list[tuple[str, str]] = []
+    subtrees: list[tuple[str, str]] = []
+    pos = 0
+    while pos < len(content):
+        space = content.index(b" ", pos)
+        nul = content.index(b"\x00", space)
+        mode = content[pos:space]
+        name = content[space + 1 : nul].decode("utf-8", errors="replace")
+        sha = content[nul + 1 : nul + 1 + raw_len].hex()
+        pos = nul + 1 + raw_len
+        if mode == b"40000":
+            subtrees.append((name + "/", sha))
+        elif mode in (b"100644", b"100755") and is_test_file_name(name):
+            blobs.append((name, sha))
+    for name, sha in subtrees:
+        blobs.extend((name + path, blob_sha) for path, blob_sha in list_test_blobs(batch, sha))
+    TREE_TEST_BLOBS_CACHE[obj[0]] = blobs
+    return blobs
+
+
+def collect_test_composition_from_git(repo_root: Path, ref: str, batch: GitBatch) -> dict[str, Any]:
+    """Test composition of `ref` read straight from the object store, without extracting a tree.
+
+    `tests/` is listed through `list_test_blobs`; only blobs not already in `BLOB_TEST_COUNT_CACHE`
+    are read, in one pipelined `batch.read_many()` call, and counted.
+    """
+    tests_tree = batch.info(f"{ref}:tests")
+    if tests_tree is None or tests_tree[1] != "tree":
+        files: list[tuple[str, str]] = []
+    else:
+        files = [("tests/" + path, sha) for path, sha in list_test_blobs(batch, tests_tree[0])]
+    missing = {sha: path for path, sha in files if sha not in BLOB_TEST_COUNT_CACHE}
+    for (sha, path), obj in zip(missing.items(), batch.read_many(list(missing))):
+        BLOB_TEST_COUNT_CACHE[sha] = count_tests_in_source(obj[2].decode("utf-8"), path) if obj is not None else 0
+    return summarize_test_files((Path(path), BLOB_TEST_COUNT_CACHE[sha]) for path, sha in files)
 
 
-def collect_documentation_churn(repo_root: Path, previous_tag: str | None, current_tag: str) -> dict[str, Any]:
-    range_arg = git_range_arg(previous_tag, current_tag)
-    paths = ["--", "docs", "README.md", "AGENTS.md", "methodology"]
-    commit_output = run_command(["git", "log", "--format=%H", range_arg, *paths], cwd=repo_root)
-    commits = [line.strip() for line in commit_output.splitlines() if line.strip()]
-    numstat_output = run_command(["git", "log", "--pretty=tformat:", "--numstat", range_arg, *paths], cwd=repo_root)
-    insertions, deletions = parse_numstat(numstat_output)
-    files_output = run_command(["git", "log", "--name-only", "--pretty=format:", range_arg, *paths], cwd=repo_root)
-    unique_files = {line.strip() for line in files_output.splitlines() if line.strip()}
+def collect_test_composition_snapshot(
+    repo_root: Path,
+    ref: str,
+    *,
+    cache: SnapshotCache | None = None,
+    batch: GitBatch | None = None,
+) -> dict[str, Any]:
+    if batch is None:
+        with GitBatch(repo_root) as owned_batch:
+            return collect_test_composition_snapshot(repo_root, ref, cache=cache, batch=owned_batch)
+    if cache is not None:
+        resolved = batch.info(f"{ref}^{{tree}}")
+        tree_sha = resolved[0] if resolved is not None else resolve_tree_sha(repo_root, ref)
+        cached = cache.get("tests", tree_sha)
+        if cached is None:
+            cached = collect_test_composition_from_git(repo_root, ref, batch)
+            cache.put("tests", tree_sha, cached)
+        return cached
+    return collect_test_composition_from_git(repo_root, ref, batch)
+
+
+def collect_test_composition_snapshots(
+    repo_root: Path,
+    refs: Sequence[str],
+    *,
+    cache: SnapshotCache | None = None,
+) -> list[dict[str, Any]]:
+    """Test composition for `refs`, in order, over one cat-file pipe."""
+    with GitBatch(repo_root) as batch:
+        return [collect_test_composition_snapshot(repo_root, ref, cache=cache, batch=batch) for ref in refs]
+
+
+def map_tag_snapshots(
+    fn: Callable[..., dict[str, Any]],
+    repo_root: Path,
+    refs: list[str],
+    *,
+    max_workers: int | None = None,
+    **kwargs: Any,
+) -> list[dict[str, Any]]:
+    """Run a per-ref snapshot collector for every ref, in a process pool when there are several.
+
+    Each ref is read independently from the immutable object store (git archive into its
+    own tempdir), so tags overlap their subprocess, disk and AST work. Result order matches `refs`.
+    """
+    job = partial(fn, repo_root, **kwargs)
+    workers = min(len(refs), max_workers or os.cpu_count() or 1)
+    if workers <= 1:
+        return [job(ref) for ref in refs]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(job, refs))
+
+
+DOC_CHURN_PATHS = ("docs", "README.md", "AGENTS.md", "methodology")
+DOC_CHURN_SCOPE = ["docs/**", "README.md", "AGENTS.md", "methodology/**"]
+
+
+def parse_numstat_z_log(output: str) -> dict[str, list[tuple[str, int, int]]]:
+    """Per-commit `(path, insertions, deletions)` rows of a `git log -z --numstat --format=%H` walk.
+
+    NUL framing makes every field its own token, paths are never C-quoted, and a rename is an
+    empty numstat path followed by separate pre-image and post-image tokens. Binary files
+    (`-`) are listed with zero lines.
+    """
+    commits: dict[str, list[tuple[str, int, int]]] = {}
+    rows: list[tuple[str, int, int]] = []
+    tokens = iter(output.split("\x00"))
+    for token in tokens:
+        if "\t" not in token:
+            token = token.lstrip("\n")
+            if token:
+                rows = commits.setdefault(token, [])
+            continue
+        added, removed, path = token.lstrip("\n").split("\t", 2)
+        if not path:
+            next(tokens, None)
+            path = next(tokens, "")
+        if added == "-":
+            rows.append((path, 0, 0))
+        else:
+            rows.append((path, int(added), int(removed)))
+    return commits
+
+
+def summarize_doc_churn(rows_by_commit: Iterable[list[tuple[str, int, int]]]) -> dict[str, Any]:
+    commits = 0
+    unique_files: set[str] = set()
+    insertions = 0
+    deletions = 0
+    for rows in rows_by_commit:
+        commits += 1
+        for path, added, removed in rows:
+            unique_files.add(path)
+            insertions += added
+            deletions += removed
     return {
-        "scope": ["docs/**", "README.md", "AGENTS.md", "methodology/**"],
-        "commits": len(set(commits)),
+        "scope": list(DOC_CHURN_SCOPE),
+        "commits": commits,
         "unique_files_touched": len(unique_files),
         "insertions": insertions,
         "deletions": deletions,
@@ -989,16 +2397,31 @@ def collect_documentation_churn(repo_root: Path, previous_tag: str | None, curre
     }
 
 
+def collect_documentation_churn(repo_root: Path, previous_tag: str | None, current_tag: str) -> dict[str, Any]:
+    range_arg = git_range_arg(previous_tag, current_tag)
+    output = run_command(
+        ["git", "log", "-z", "--numstat", "--format=%H", range_arg, "--", *DOC_CHURN_PATHS],
+        cwd=repo_root,
+    )
+    return summarize_doc_churn(parse_numstat_z_log(output).values())
+
+
+# Cell formatters are pure and see the same few values (zeros, None, repeated totals) across every
+# table; `typed=True` keeps 1 and 1.0 from sharing a cache slot since they render differently.
+FORMAT_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=FORMAT_CACHE_SIZE, typed=True)
 def fmt_int(value: int | None) -> str:
     if value is None:
         return "-"
-    return f"{value:,}"
+    return format(value, ",")
 
 
 def fmt_money(value: float | None) -> str:
     if value is None:
         return "-"
-    return f"${value:,.2f}"
+    return "$" + format(value, ",.2f")
 
 
 def estimate_cost_usd(tokens_in: int, tokens_out: int, *, price_in_per_1m: float, price_out_per_1m: float) -> float:
@@ -1016,7 +2439,7 @@ def delta_row(current: int | float | None, previous: int | float | None) -> dict
 def fmt_pct(value: float | None) -> str:
     if value is None:
         return "-"
-    return f"{value:+.1f}%"
+    return format(value, "+.1f") + "%"
 
 
 def duration_seconds(start: datetime | None, end: datetime | None) -> int | None:
@@ -1026,6 +2449,7 @@ def duration_seconds(start: datetime | None, end: datetime | None) -> int | None
     return max(0, delta)
 
 
+@lru_cache(maxsize=FORMAT_CACHE_SIZE, typed=True)
 def fmt_duration(seconds: int | None) -> str:
     if seconds is None:
         return "-"
@@ -1046,54 +2470,115 @@ def fmt_duration(seconds: int | None) -> str:
 
 def markdown_table(
     headers: list[str],
-    rows: list[list[Any]],
+    rows: Iterable[Sequence[Any]],
     *,
     colalign: list[str] | None = None,
 ) -> str:
+    # Imported on first use so JSON-only runs never pay for tabulate's import.
+    try:
+        from tabulate import tabulate
+    except ImportError:  # pragma: no cover
+        tabulate = None
     if tabulate is not None:
         return tabulate(rows, headers=headers, tablefmt="pipe", colalign=colalign)
 
-    # Fallback when tabulate is unavailable.
-    all_rows = [headers, *rows]
-    widths = [max(len(str(row[idx])) for row in all_rows) for idx in range(len(headers))]
-
-    def _render_row(row: list[Any]) -> str:
-        cells: list[str] = []
-        for idx, value in enumerate(row):
-            text = str(value)
-            align = (colalign[idx] if colalign and idx < len(colalign) else "left").lower()
-            if align == "right":
-                cells.append(text.rjust(widths[idx]))
-            elif align == "center":
-                cells.append(text.center(widths[idx]))
-            else:
-                cells.append(text.ljust(widths[idx]))
-        return "| " + " | ".join(cells) + " |"
-
-    def _rule_row() -> str:
-        cells: list[str] = []
-        for idx, width in enumerate(widths):
-            align = (colalign[idx] if colalign and idx < len(colalign) else "left").lower()
-            w = max(3, width)
-            if align == "right":
-                cells.append("-" * (w - 1) + ":")
-            elif align == "center":
-                cells.append(":" + "-" * (w - 2) + ":")
-            else:
-                cells.append(":" + "-" * (w - 1))
-        return "| " + " | ".join(cells) + " |"
+    # Fallback when tabulate is unavailable. Rows may be a generator: each is stringified once as
+    # it arrives and folded into running column widths, and each column's justify method is
+    # resolved up front.
+    text_rows: list[list[str]] = []
+    widths = [0] * len(headers)
+    for row in chain((headers,), rows):
+        cells = [str(value) for value in row]
+        text_rows.append(cells)
+        widths = list(map(max, widths, map(len, cells)))
+    aligns = [(colalign[idx] if colalign and idx < len(colalign) else "left").lower() for idx in range(len(headers))]
+    justify = [
+        str.rjust if align == "right" else str.center if align == "center" else str.ljust for align in aligns
+    ]
+    rule_cells: list[str] = []
+    for align, width in zip(aligns, widths):
+        w = max(3, width)
+        if align == "right":
+            rule_cells.append("-" * (w - 1) + ":")
+        elif align == "center":
+            rule_cells.append(":" + "-" * (w - 2) + ":")
+        else:
+            rule_cells.append(":" + "-" * (w - 1))
 
-    rendered = [_render_row(headers), _rule_row()]
-    rendered.extend(_render_row(row) for row in rows)
+    rendered = [
+        "| " + " | ".join([justify[idx](text, widths[idx]) for idx, text in enumerate(row)]) + " |"
+        for row in text_rows
+    ]
+    rendered.insert(1, "| " + " | ".join(rule_cells) + " |")
     return "\n".join(rendered)
 
 
+# Shared default for `.get()` chains over report dicts, so a missing section allocates nothing.
+# Read-only by convention: nothing may mutate or return it.
+EMPTY: dict[str, Any] = {}
+
+# (label, snapshot_delta_vs_prior_release key, formatter) for the per-release delta table.
+RELEASE_DELTA_ROWS: list[tuple[str, str, Callable[[Any], str]]] = [
+    ("Commits", "commits", fmt_int),
+    ("Net lines", "net_lines", fmt_int),
+    ("Combined tokens", "combined_tokens", fmt_int),
+    ("Estimated cost (USD)", "combined_cost_usd", fmt_money),
+    ("Test functions", "test_functions", fmt_int),
+]
+
+TEST_CATEGORY_ROWS = (("Unit", "unit"), ("Integration", "integration"), ("Adversarial", "adversarial"))
+# (label, usage.timing key) rows and the humanized duration columns of the per-release activity table.
+ACTIVITY_SOURCE_ROWS = (("Codex", "codex"), ("Claude", "claude"), ("Combined", "combined"))
+ACTIVITY_DURATION_COLUMNS = ("wall_human", "active_human", "coding_human", "planning_human", "idle_human")
+# (label, key) rows of the per-release git metric and documentation churn tables.
+GIT_METRIC_ROWS = (
+    ("Commits in range", "commits_in_range"),
+    ("Unique files touched", "unique_files_touched"),
+    ("Insertions", "insertions"),
+    ("Deletions", "deletions"),
+    ("Net lines", "net_lines"),
+    ("Cumulative commits at tag", "commits_to_tag"),
+)
+DOC_CHURN_ROWS = (
+    ("Commits touching docs scope", "commits"),
+    ("Unique files touched", "unique_files_touched"),
+    ("Insertions", "insertions"),
+    ("Deletions", "deletions"),
+    ("Net lines", "net_lines"),
+)
+
+
 def render_markdown(payload: dict[str, Any]) -> str:
+    return "\n".join(markdown_lines(payload)).rstrip() + "\n"
+
+
+MARKDOWN_WRITE_BUFFER = 1 << 16
+
+
+def write_markdown(payload: dict[str, Any], stream: BinaryIO) -> None:
+    """Write `render_markdown(payload)` block by block, without materializing the joined text.
+
+    Pair with a stream opened with `buffering=MARKDOWN_WRITE_BUFFER` so blocks coalesce into large writes.
+    """
+    lines = markdown_lines(payload)
+    while lines and not lines[-1].strip():
+        lines.pop()
+    if not lines:
+        stream.write(b"\n")
+        return
+    lines[-1] = lines[-1].rstrip()
+    for line in lines:
+        stream.write(line.encode("utf-8"))
+        stream.write(b"\n")
+
+
+def markdown_lines(payload: dict[str, Any]) -> list[str]:
+    """The markdown report as a list of blocks; each may span several lines."""
     releases = payload.get("releases", [])
     if not isinstance(releases, list):
         releases = []
-    totals = payload.get("totals", {})
-    cost_assumptions = payload.get("cost_assumptions_usd_per_1m", {})
+    totals = payload.get("totals", EMPTY)
+    cost_assumptions = payload.get("cost_assumptions_usd_per_1m", EMPTY)
 
     lines: list[str] = []
     lines.append("# Reality Check - Development Statistics by Tagged Release")
@@ -1112,8 +2597,8 @@ def render_markdown(payload: dict[str, Any]) -> str:
     lines.append("  - `active`: contiguous event clusters (gap <= 5m).")
     lines.append("  - `coding`: tool-use/function-call clusters.")
     lines.append("  - `planning`: `active - coding`.")
-    codex_pricing = cost_assumptions.get("codex_gpt5x", {})
-    claude_pricing = cost_assumptions.get("claude_opus4x", {})
+    codex_pricing = cost_assumptions.get("codex_gpt5x", EMPTY)
+    claude_pricing = cost_assumptions.get("claude_opus4x", EMPTY)
     lines.append("- Cost assumptions used for estimated USD:")
     lines.append(
         "  - Codex/gpt-5.x: "
@@ -1128,33 +2613,38 @@ def render_markdown(payload: dict[str, Any]) -> str:
         f"cache read `${claude_pricing.get('input_cache_read', DEFAULT_OPUS4_CACHE_READ_USD_PER_1M):.2f}` / "
         f"output `${claude_pricing.get('output', DEFAULT_OPUS4_OUTPUT_USD_PER_1M):.2f}` per 1M."
     )
-    lines.append("- `scc` snapshots are taken from `git archive <tag>` extracts when `--with-scc` is enabled.")
+    lines.append(
+        "- `scc` snapshots are taken from a detached worktree checkout of each tag when `--with-scc` is enabled."
+    )
     lines.append("")
     lines.append("## Project Totals")
     lines.append("")
 
-    token_totals = totals.get("tokens", {})
+    token_totals = totals.get("tokens", EMPTY)
+    codex_totals = token_totals.get("codex", EMPTY)
+    claude_totals = token_totals.get("claude", EMPTY)
+    combined_totals = token_totals.get("combined", EMPTY)
     token_rows = [
         [
             "Codex",
-            fmt_int(token_totals.get("codex", {}).get("tokens_in")),
-            fmt_int(token_totals.get("codex", {}).get("tokens_out")),
-            fmt_int(token_totals.get("codex", {}).get("total_tokens")),
-            fmt_money(token_totals.get("codex", {}).get("estimated_cost_usd")),
+            fmt_int(codex_totals.get("tokens_in")),
+            fmt_int(codex_totals.get("tokens_out")),
+            fmt_int(codex_totals.get("total_tokens")),
+            fmt_money(codex_totals.get("estimated_cost_usd")),
         ],
         [
             "Claude",
-            fmt_int(token_totals.get("claude", {}).get("tokens_in")),
-            fmt_int(token_totals.get("claude", {}).get("tokens_out")),
-            fmt_int(token_totals.get("claude", {}).get("total_tokens")),
-            fmt_money(token_totals.get("claude", {}).get("estimated_cost_usd")),
+            fmt_int(claude_totals.get("tokens_in")),
+            fmt_int(claude_totals.get("tokens_out")),
+            fmt_int(claude_totals.get("total_tokens")),
+            fmt_money(claude_totals.get("estimated_cost_usd")),
         ],
         [
             "Combined",
-            fmt_int(token_totals.get("combined", {}).get("tokens_in")),
-            fmt_int(token_totals.get("combined", {}).get("tokens_out")),
-            fmt_int(token_totals.get("combined", {}).get("total_tokens")),
-            fmt_money(token_totals.get("combined", {}).get("estimated_cost_usd")),
+            fmt_int(combined_totals.get("tokens_in")),
+            fmt_int(combined_totals.get("tokens_out")),
+            fmt_int(combined_totals.get("total_tokens")),
+            fmt_money(combined_totals.get("estimated_cost_usd")),
         ],
     ]
     lines.append(
@@ -1171,17 +2661,17 @@ def render_markdown(payload: dict[str, Any]) -> str:
             [
                 [
                     "Codex/gpt-5.x",
-                    fmt_int(token_totals.get("codex", {}).get("tokens_in_uncached")),
-                    fmt_int(token_totals.get("codex", {}).get("tokens_in_cached")),
+                    fmt_int(codex_totals.get("tokens_in_uncached")),
+                    fmt_int(codex_totals.get("tokens_in_cached")),
                     "-",
                     "-",
                 ],
                 [
                     "Claude/Opus-4.x",
-                    fmt_int(token_totals.get("claude", {}).get("tokens_in_base")),
+                    fmt_int(claude_totals.get("tokens_in_base")),
                     "-",
-                    fmt_int(token_totals.get("claude", {}).get("tokens_in_cache_write")),
-                    fmt_int(token_totals.get("claude", {}).get("tokens_in_cache_read")),
+                    fmt_int(claude_totals.get("tokens_in_cache_write")),
+                    fmt_int(claude_totals.get("tokens_in_cache_read")),
                 ],
             ],
             colalign=["left", "right", "right", "right", "right"],
@@ -1189,7 +2679,7 @@ def render_markdown(payload: dict[str, Any]) -> str:
     )
     lines.append("")
 
-    activity_totals = totals.get("activity_seconds", {})
+    activity_totals = totals.get("activity_seconds", EMPTY)
     activity_total_rows = [
         ["Active (estimated)", activity_totals.get("active_human", "-"), fmt_int(activity_totals.get("active"))],
         ["Coding (estimated)", activity_totals.get("coding_human", "-"), fmt_int(activity_totals.get("coding"))],
@@ -1204,7 +2694,7 @@ def render_markdown(payload: dict[str, Any]) -> str:
     )
     lines.append("")
 
-    test_totals = totals.get("tests", {})
+    test_totals = totals.get("tests", EMPTY)
     lines.append(
         markdown_table(
             ["Test Composition (sum across tags)", "Value"],
@@ -1220,7 +2710,7 @@ def render_markdown(payload: dict[str, Any]) -> str:
     )
     lines.append("")
 
-    doc_totals = totals.get("documentation_churn", {})
+    doc_totals = totals.get("documentation_churn", EMPTY)
     lines.append(
         markdown_table(
             ["Documentation Churn (sum across tags)", "Value"],
@@ -1262,18 +2752,18 @@ def render_markdown(payload: dict[str, Any]) -> str:
     ]
     summary_rows: list[list[Any]] = []
     for release in releases:
-        tag = release.get("tag", {})
-        rel_timing = release.get("timing", {})
-        git_stats = release.get("git", {})
-        usage = release.get("usage", {})
-        codex = usage.get("codex", {})
-        claude = usage.get("claude", {})
-        combined = usage.get("combined", {})
-        timing = usage.get("timing", {}).get("combined", {})
-        tests = release.get("tests", {})
-        docs = release.get("documentation_churn", {})
-        scc = release.get("scc", {})
-        python_code = scc.get("python", {}).get("code") if isinstance(scc, dict) else None
+        tag = release.get("tag", EMPTY)
+        rel_timing = release.get("timing", EMPTY)
+        git_stats = release.get("git", EMPTY)
+        usage = release.get("usage", EMPTY)
+        codex = usage.get("codex", EMPTY)
+        claude = usage.get("claude", EMPTY)
+        combined = usage.get("combined", EMPTY)
+        timing = usage.get("timing", EMPTY).get("combined", EMPTY)
+        tests = release.get("tests", EMPTY)
+        docs = release.get("documentation_churn", EMPTY)
+        scc = release.get("scc", EMPTY)
+        python_code = scc.get("python", EMPTY).get("code") if isinstance(scc, dict) else None
         summary_rows.append(
             [
                 f"`{tag.get('name', '-')}`",
@@ -1309,9 +2799,9 @@ def render_markdown(payload: dict[str, Any]) -> str:
             fmt_int(totals.get("insertions")),
             fmt_int(totals.get("deletions")),
             fmt_int(totals.get("net_lines")),
-            fmt_int(token_totals.get("codex", {}).get("total_tokens")),
-            fmt_int(token_totals.get("claude", {}).get("total_tokens")),
-            fmt_money(token_totals.get("combined", {}).get("estimated_cost_usd")),
+            fmt_int(codex_totals.get("total_tokens")),
+            fmt_int(claude_totals.get("total_tokens")),
+            fmt_money(combined_totals.get("estimated_cost_usd")),
             activity_totals.get("active_human", "-"),
             activity_totals.get("coding_human", "-"),
             activity_totals.get("planning_human", "-"),
@@ -1350,19 +2840,21 @@ def render_markdown(payload: dict[str, Any]) -> str:
     lines.append("")
 
     for release in releases:
-        tag = release.get("tag", {})
-        rel_timing = release.get("timing", {})
+        tag = release.get("tag", EMPTY)
+        rel_timing = release.get("timing", EMPTY)
         release_delta = release.get("snapshot_delta_vs_prior_release")
-        git_stats = release.get("git", {})
-        usage = release.get("usage", {})
-        codex = usage.get("codex", {})
-        claude = usage.get("claude", {})
-        combined = usage.get("combined", {})
-        window = usage.get("window", {})
-        timing = usage.get("timing", {})
-        tests = release.get("tests", {})
-        docs = release.get("documentation_churn", {})
-        scc = release.get("scc", {})
+        git_stats = release.get("git", EMPTY)
+        usage = release.get("usage", EMPTY)
+        codex = usage.get("codex", EMPTY)
+        claude = usage.get("claude", EMPTY)
+        combined = usage.get("combined", EMPTY)
+        window = usage.get("window", EMPTY)
+        timing = usage.get("timing", EMPTY)
+        tests = release.get("tests", EMPTY)
+        tests_by_category = tests.get("by_category", EMPTY)
+        docs = release.get("documentation_churn", EMPTY)
+        scc = release.get("scc", EMPTY)
+        peak_commit_day = git_stats.get("peak_commit_day")
 
         lines.append(f"## {tag.get('name', '-')}")
         lines.append("")
@@ -1377,14 +2869,7 @@ def render_markdown(payload: dict[str, Any]) -> str:
         lines.append(
             markdown_table(
                 ["Metric", "Value"],
-                [
-                    ["Commits in range", fmt_int(git_stats.get("commits_in_range"))],
-                    ["Unique files touched", fmt_int(git_stats.get("unique_files_touched"))],
-                    ["Insertions", fmt_int(git_stats.get("insertions"))],
-                    ["Deletions", fmt_int(git_stats.get("deletions"))],
-                    ["Net lines", fmt_int(git_stats.get("net_lines"))],
-                    ["Cumulative commits at tag", fmt_int(git_stats.get("commits_to_tag"))],
-                ],
+                ((label, fmt_int(git_stats.get(key))) for label, key in GIT_METRIC_ROWS),
                 colalign=["left", "right"],
             )
         )
@@ -1400,9 +2885,8 @@ def render_markdown(payload: dict[str, Any]) -> str:
                     [
                         "Peak commit day",
                         (
-                            f"{git_stats.get('peak_commit_day', {}).get('date')} "
-                            f"({git_stats.get('peak_commit_day', {}).get('commits')} commits)"
-                            if git_stats.get("peak_commit_day")
+                            f"{peak_commit_day.get('date')} ({peak_commit_day.get('commits')} commits)"
+                            if peak_commit_day
                             else "-"
                         ),
                     ],
@@ -1410,7 +2894,7 @@ def render_markdown(payload: dict[str, Any]) -> str:
                 colalign=["left", "right"],
             )
         )
-        commits_by_day = git_stats.get("commits_by_day", {})
+        commits_by_day = git_stats.get("commits_by_day", EMPTY)
         if isinstance(commits_by_day, dict) and commits_by_day:
             lines.append("")
             lines.append(
@@ -1427,40 +2911,14 @@ def render_markdown(payload: dict[str, Any]) -> str:
                     ["Release Snapshot Delta vs Prior", "Previous", "Current", "Delta", "Delta %"],
                     [
                         [
-                            "Commits",
-                            fmt_int(release_delta.get("commits", {}).get("previous")),
-                            fmt_int(release_delta.get("commits", {}).get("current")),
-                            fmt_int(release_delta.get("commits", {}).get("delta")),
-                            fmt_pct(release_delta.get("commits", {}).get("pct")),
-                        ],
-                        [
-                            "Net lines",
-                            fmt_int(release_delta.get("net_lines", {}).get("previous")),
-                            fmt_int(release_delta.get("net_lines", {}).get("current")),
-                            fmt_int(release_delta.get("net_lines", {}).get("delta")),
-                            fmt_pct(release_delta.get("net_lines", {}).get("pct")),
-                        ],
-                        [
-                            "Combined tokens",
-                            fmt_int(release_delta.get("combined_tokens", {}).get("previous")),
-                            fmt_int(release_delta.get("combined_tokens", {}).get("current")),
-                            fmt_int(release_delta.get("combined_tokens", {}).get("delta")),
-                            fmt_pct(release_delta.get("combined_tokens", {}).get("pct")),
-                        ],
-                        [
-                            "Estimated cost (USD)",
-                            fmt_money(release_delta.get("combined_cost_usd", {}).get("previous")),
-                            fmt_money(release_delta.get("combined_cost_usd", {}).get("current")),
-                            fmt_money(release_delta.get("combined_cost_usd", {}).get("delta")),
-                            fmt_pct(release_delta.get("combined_cost_usd", {}).get("pct")),
-                        ],
-                        [
-                            "Test functions",
-                            fmt_int(release_delta.get("test_functions", {}).get("previous")),
-                            fmt_int(release_delta.get("test_functions", {}).get("current")),
-                            fmt_int(release_delta.get("test_functions", {}).get("delta")),
-                            fmt_pct(release_delta.get("test_functions", {}).get("pct")),
-                        ],
+                            label,
+                            fmt_value(delta.get("previous")),
+                            fmt_value(delta.get("current")),
+                            fmt_value(delta.get("delta")),
+                            fmt_pct(delta.get("pct")),
+                        ]
+                        for label, key, fmt_value in RELEASE_DELTA_ROWS
+                        for delta in (release_delta.get(key, EMPTY),)
                     ],
                     colalign=["left", "right", "right", "right", "right"],
                 )
@@ -1527,38 +2985,16 @@ def render_markdown(payload: dict[str, Any]) -> str:
         lines.append(
             markdown_table(
                 ["Activity (estimated)", "Events", "Wall", "Active", "Coding", "Planning", "Idle", "Active Ratio"],
-                [
-                    [
-                        "Codex",
-                        fmt_int(timing.get("codex", {}).get("events")),
-                        timing.get("codex", {}).get("wall_human", "-"),
-                        timing.get("codex", {}).get("active_human", "-"),
-                        timing.get("codex", {}).get("coding_human", "-"),
-                        timing.get("codex", {}).get("planning_human", "-"),
-                        timing.get("codex", {}).get("idle_human", "-"),
-                        timing.get("codex", {}).get("active_ratio"),
-                    ],
-                    [
-                        "Claude",
-                        fmt_int(timing.get("claude", {}).get("events")),
-                        timing.get("claude", {}).get("wall_human", "-"),
-                        timing.get("claude", {}).get("active_human", "-"),
-                        timing.get("claude", {}).get("coding_human", "-"),
-                        timing.get("claude", {}).get("planning_human", "-"),
-                        timing.get("claude", {}).get("idle_human", "-"),
-                        timing.get("claude", {}).get("active_ratio"),
-                    ],
-                    [
-                        "Combined",
-                        fmt_int(timing.get("combined", {}).get("events")),
-                        timing.get("combined", {}).get("wall_human", "-"),
-                        timing.get("combined", {}).get("active_human", "-"),
-                        timing.get("combined", {}).get("coding_human", "-"),
-                        timing.get("combined", {}).get("planning_human", "-"),
-                        timing.get("combined", {}).get("idle_human", "-"),
-                        timing.get("combined", {}).get("active_ratio"),
-                    ],
-                ],
+                (
+                    (
+                        label,
+                        fmt_int(source_timing.get("events")),
+                        *(source_timing.get(column, "-") for column in ACTIVITY_DURATION_COLUMNS),
+                        source_timing.get("active_ratio"),
+                    )
+                    for label, key in ACTIVITY_SOURCE_ROWS
+                    for source_timing in (timing.get(key, EMPTY),)
+                ),
                 colalign=["left", "right", "right", "right", "right", "right", "right", "right"],
             )
         )
@@ -1567,24 +3003,13 @@ def render_markdown(payload: dict[str, Any]) -> str:
         lines.append(
             markdown_table(
                 ["Test Composition", "Files", "Functions"],
-                [
-                    [
-                        "Unit",
-                        fmt_int(tests.get("by_category", {}).get("unit", {}).get("test_files")),
-                        fmt_int(tests.get("by_category", {}).get("unit", {}).get("test_functions")),
-                    ],
-                    [
-                        "Integration",
-                        fmt_int(tests.get("by_category", {}).get("integration", {}).get("test_files")),
-                        fmt_int(tests.get("by_category", {}).get("integration", {}).get("test_functions")),
-                    ],
-                    [
-                        "Adversarial",
-                        fmt_int(tests.get("by_category", {}).get("adversarial", {}).get("test_files")),
-                        fmt_int(tests.get("by_category", {}).get("adversarial", {}).get("test_functions")),
-                    ],
-                    ["Total", fmt_int(tests.get("test_files")), fmt_int(tests.get("test_functions"))],
-                ],
+                (
+                    (label, fmt_int(counts.get("test_files")), fmt_int(counts.get("test_functions")))
+                    for label, counts in chain(
+                        ((label, tests_by_category.get(key, EMPTY)) for label, key in TEST_CATEGORY_ROWS),
+                        (("Total", tests),),
+                    )
+                ),
                 colalign=["left", "right", "right"],
             )
         )
@@ -1593,35 +3018,30 @@ def render_markdown(payload: dict[str, Any]) -> str:
         lines.append(
             markdown_table(
                 ["Documentation Churn", "Value"],
-                [
-                    ["Commits touching docs scope", fmt_int(docs.get("commits"))],
-                    ["Unique files touched", fmt_int(docs.get("unique_files_touched"))],
-                    ["Insertions", fmt_int(docs.get("insertions"))],
-                    ["Deletions", fmt_int(docs.get("deletions"))],
-                    ["Net lines", fmt_int(docs.get("net_lines"))],
-                ],
+                ((label, fmt_int(docs.get(key))) for label, key in DOC_CHURN_ROWS),
                 colalign=["left", "right"],
             )
         )
 
         if isinstance(scc, dict) and not scc.get("error"):
-            python_row = scc.get("python", {})
-            cocomo = scc.get("cocomo", {})
+            scc_totals = scc.get("totals", EMPTY)
+            python_row = scc.get("python", EMPTY)
+            cocomo = scc.get("cocomo", EMPTY)
             lines.append("")
             schedule = cocomo.get("estimated_schedule_months")
             people = cocomo.get("estimated_people")
             lines.append(
                 markdown_table(
                     ["scc Snapshot", "Value"],
-                    [
-                        ["Total files", fmt_int(scc.get("totals", {}).get("files"))],
-                        ["Total code lines", fmt_int(scc.get("totals", {}).get("code"))],
-                        ["Python files", fmt_int(python_row.get("files"))],
-                        ["Python code lines", fmt_int(python_row.get("code"))],
-                        ["COCOMO estimated cost (USD)", fmt_int(cocomo.get("estimated_cost_usd"))],
-                        ["COCOMO schedule (months)", schedule if schedule is not None else "-"],
-                        ["COCOMO people", people if people is not None else "-"],
-                    ],
+                    (
+                        ("Total files", fmt_int(scc_totals.get("files"))),
+                        ("Total code lines", fmt_int(scc_totals.get("code"))),
+                        ("Python files", fmt_int(python_row.get("files"))),
+                        ("Python code lines", fmt_int(python_row.get("code"))),
+                        ("COCOMO estimated cost (USD)", fmt_int(cocomo.get("estimated_cost_usd"))),
+                        ("COCOMO schedule (months)", schedule if schedule is not None else "-"),
+                        ("COCOMO people", people if people is not None else "-"),
+                    ),
                     colalign=["left", "right"],
                 )
             )
@@ -1638,7 +3058,65 @@ def render_markdown(payload: dict[str, Any]) -> str:
     lines.append("  --output-markdown docs/STATUS-dev-stats.md")
     lines.append("```")
     lines.append("")
-    return "\n".join(lines).rstrip() + "\n"
+    return lines
+
+
+# Report totals as `(total_key, release_key)` pairs, summed over the selected releases.
+GIT_TOTAL_FIELDS = (
+    ("commits", "commits_in_range"),
+    ("files_touched_sum", "unique_files_touched"),
+    ("insertions", "insertions"),
+    ("deletions", "deletions"),
+    ("net_lines", "net_lines"),
+)
+TOKEN_TOTAL_FIELDS = {
+    "codex": ("tokens_in", "tokens_in_uncached", "tokens_in_cached", "tokens_out", "total_tokens"),
+    "claude": (
+        "tokens_in",
+        "tokens_in_base",
+        "tokens_in_cache_write",
+        "tokens_in_cache_read",
+        "tokens_out",
+        "total_tokens",
+    ),
+    "combined": ("tokens_in", "tokens_out", "total_tokens"),
+}
+ACTIVITY_TOTAL_FIELDS = (("active", "active_seconds"), ("coding", "coding_seconds"), ("planning", "planning_seconds"))
+TEST_TOTAL_FIELDS = (("test_files_sum", "test_files"), ("test_functions_sum", "test_functions"))
+TEST_CATEGORY_TOTAL_FIELDS = (
+    ("unit_functions_sum", "unit"),
+    ("integration_functions_sum", "integration"),
+    ("adversarial_functions_sum", "adversarial"),
+)
+DOC_TOTAL_FIELDS = (
+    ("commits_sum", "commits"),
+    ("unique_files_touched_sum", "unique_files_touched"),
+    ("insertions_sum", "insertions"),
+    ("deletions_sum", "deletions"),
+)
+
+
+@dataclass(slots=True)
+class ReleaseRow:
+    """One tag's report row; held as slots while the report is assembled, emitted as a dict."""
+
+    tag: dict[str, Any]
+    previous_tag: str | None
+    timing: dict[str, Any]
+    git: dict[str, Any]
+    usage: dict[str, Any]
+    scc: dict[str, Any]
+    tests: dict[str, Any]
+    documentation_churn: dict[str, Any]
+    snapshot_delta_vs_prior_release: dict[str, Any] | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        return {field.name: getattr(self, field.name) for field in fields(self)}
+
+
+def add_total_fields(totals: Counter[str], section: dict[str, Any], fields: Iterable[tuple[str, str]]) -> None:
+    for total_key, release_key in fields:
+        totals[total_key] += safe_int(section.get(release_key))
 
 
 def select_tag_slice(tags: list[TagInfo], from_tag: str | None, to_tag: str | None) -> tuple[int, int]:
@@ -1673,101 +3151,121 @@ def build_report(
     claude_events: list[ClaudeUsageEvent],
     with_scc: bool,
     with_test_composition: bool,
-    codex_price_in_per_1m: float,
-    codex_price_cached_input_per_1m: float,
-    codex_price_out_per_1m: float,
-    claude_price_in_per_1m: float,
-    claude_price_cache_write_per_1m: float,
-    claude_price_cache_read_per_1m: float,
-    claude_price_out_per_1m: float,
+    prices: PriceTable,
+    net_diff_churn: bool = False,
+    snapshot_cache: SnapshotCache | None = None,
+    scc_lightweight: bool = False,
+    max_workers: int | None = None,
 ) -> dict[str, Any]:
-    releases: list[dict[str, Any]] = []
-    previous_release_for_delta: dict[str, Any] | None = None
-    total_commits = 0
-    total_files = 0
-    total_insertions = 0
-    total_deletions = 0
-    total_net = 0
-    total_codex_in = 0
-    total_codex_uncached_in = 0
-    total_codex_cached_in = 0
-    total_codex_out = 0
-    total_codex_total = 0
-    total_claude_in = 0
-    total_claude_base_in = 0
-    total_claude_cache_write_in = 0
-    total_claude_cache_read_in = 0
-    total_claude_out = 0
-    total_claude_total = 0
-    total_combined_in = 0
-    total_combined_out = 0
-    total_combined_total = 0
-    total_codex_cost = 0.0
-    total_claude_cost = 0.0
-    total_combined_cost = 0.0
-    total_active = 0
-    total_coding = 0
-    total_planning = 0
-    total_test_files = 0
-    total_test_functions = 0
-    total_test_unit_functions = 0
-    total_test_integration_functions = 0
-    total_test_adversarial_functions = 0
-    total_doc_commits = 0
-    total_doc_files = 0
-    total_doc_insertions = 0
-    total_doc_deletions = 0
+    releases: list[ReleaseRow] = []
+    previous_release_for_delta: ReleaseRow | None = None
+    git_totals: Counter[str] = Counter()
+    token_totals: dict[str, Counter[str]] = {agent: Counter() for agent in TOKEN_TOTAL_FIELDS}
+    cost_totals: dict[str, float] = dict.fromkeys(TOKEN_TOTAL_FIELDS, 0.0)
+    activity_totals: Counter[str] = Counter()
+    test_totals: Counter[str] = Counter()
+    doc_totals: Counter[str] = Counter()
+
+    codex_index = CodexSessionIndex.from_sessions(codex_sessions)
+    claude_columns = ClaudeEventColumns.from_events(claude_events)
+    refs = [tags[idx].name for idx in range(start_idx, end_idx + 1)]
+    if with_scc or with_test_composition:
+        snapshot_refs, snapshot_slots = group_refs_by_tree(repo_root, refs)
+    else:
+        snapshot_refs, snapshot_slots = refs, list(range(len(refs)))
+    # The lightweight pool forks worker processes, so it runs before any gather thread starts.
+    lightweight_scc_snapshots = (
+        map_tag_snapshots(
+            collect_scc_snapshot,
+            repo_root,
+            snapshot_refs,
+            max_workers=max_workers,
+            cache=snapshot_cache,
+            lightweight=True,
+        )
+        if with_scc and scc_lightweight
+        else None
+    )
+    # The git walks, the scc runs and the test-blob reads mostly wait on their own subprocesses,
+    # so they overlap on threads while this thread aggregates usage; rows are stitched in order below.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        range_stats_future = executor.submit(
+            collect_all_range_stats, repo_root, tags, start_idx, end_idx, net_diff_churn=net_diff_churn
+        )
+        scc_future = (
+            executor.submit(collect_scc_snapshots, repo_root, snapshot_refs, cache=snapshot_cache)
+            if with_scc and lightweight_scc_snapshots is None
+            else None
+        )
+        tests_future = (
+            executor.submit(collect_test_composition_snapshots, repo_root, snapshot_refs, cache=snapshot_cache)
+            if with_test_composition
+            else None
+        )
+        usage_by_window = [
+            aggregate_usage_for_window(
+                codex_sessions=codex_index,
+                claude_events=claude_columns,
+                start_exclusive=tags[idx - 1].commit_time_utc if idx > 0 else None,
+                end_inclusive=tags[idx].commit_time_utc,
+                prices=prices,
+            )
+            for idx in range(start_idx, end_idx + 1)
+        ]
+        git_stats_by_window, doc_churn_by_window = range_stats_future.result()
+        if lightweight_scc_snapshots is not None:
+            scc_snapshots = [lightweight_scc_snapshots[slot] for slot in snapshot_slots]
+        elif scc_future is not None:
+            scc_snapshots = [scc_future.result()[slot] for slot in snapshot_slots]
+        else:
+            scc_snapshots = [{"skipped": True} for _ in refs]
+        if tests_future is not None:
+            test_snapshots = [tests_future.result()[slot] for slot in snapshot_slots]
+        else:
+            test_snapshots = [{"skipped": True} for _ in refs]
 
     for idx in range(start_idx, end_idx + 1):
         tag = tags[idx]
         previous = tags[idx - 1] if idx > 0 else None
-        git_stats = collect_git_range_stats(repo_root, previous.name if previous else None, tag.name)
-        usage = aggregate_usage_for_window(
-            codex_sessions=codex_sessions,
-            claude_events=claude_events,
-            start_exclusive=previous.commit_time_utc if previous else None,
-            end_inclusive=tag.commit_time_utc,
-            codex_price_in_per_1m=codex_price_in_per_1m,
-            codex_price_cached_input_per_1m=codex_price_cached_input_per_1m,
-            codex_price_out_per_1m=codex_price_out_per_1m,
-            claude_price_in_per_1m=claude_price_in_per_1m,
-            claude_price_cache_write_per_1m=claude_price_cache_write_per_1m,
-            claude_price_cache_read_per_1m=claude_price_cache_read_per_1m,
-            claude_price_out_per_1m=claude_price_out_per_1m,
-        )
-        scc_snapshot = collect_scc_snapshot(repo_root, tag.name) if with_scc else {"skipped": True}
-        test_composition = (
-            collect_test_composition_snapshot(repo_root, tag.name) if with_test_composition else {"skipped": True}
-        )
-        doc_churn = collect_documentation_churn(repo_root, previous.name if previous else None, tag.name)
+        offset = idx - start_idx
+        git_stats = git_stats_by_window[offset]
+        usage = usage_by_window[offset]
+        scc_snapshot = scc_snapshots[offset]
+        test_composition = test_snapshots[offset]
+        doc_churn = doc_churn_by_window[offset]
         cadence_seconds = duration_seconds(previous.commit_time_utc, tag.commit_time_utc) if previous else None
         cadence_human = fmt_duration(cadence_seconds)
 
-        release_row: dict[str, Any] = {
-            "tag": {
+        release_row = ReleaseRow(
+            tag={
                 "name": tag.name,
                 "commit": tag.commit,
                 "commit_short": tag.commit_short,
                 "commit_time_utc": tag.commit_time_utc.isoformat(),
                 "tag_time_utc": tag.tag_time_utc.isoformat(),
             },
-            "previous_tag": previous.name if previous else None,
-            "timing": {
+            previous_tag=previous.name if previous else None,
+            timing={
                 "cadence_since_prev_seconds": cadence_seconds,
                 "cadence_since_prev_human": cadence_human,
             },
-            "git": git_stats,
-            "usage": usage,
-            "scc": scc_snapshot,
-            "tests": test_composition,
-            "documentation_churn": doc_churn,
-        }
+            git=git_stats,
+            usage=usage,
+            scc=scc_snapshot,
+            tests=test_composition,
+            documentation_churn=doc_churn,
+        )
 
+        usage_codex = usage.get("codex", EMPTY)
+        usage_claude = usage.get("claude", EMPTY)
+        usage_combined = usage.get("combined", EMPTY)
+        timing_combined = usage.get("timing", EMPTY).get("combined", EMPTY)
+        tests_by_category = test_composition.get("by_category", EMPTY)
         if previous_release_for_delta is not None:
-            prev_git = previous_release_for_delta.get("git", {})
-            prev_usage = previous_release_for_delta.get("usage", {})
-            prev_tests = previous_release_for_delta.get("tests", {})
-            release_row["snapshot_delta_vs_prior_release"] = {
+            prev_git = previous_release_for_delta.git
+            prev_usage_combined = previous_release_for_delta.usage.get("combined", EMPTY)
+            prev_tests = previous_release_for_delta.tests
+            release_row.snapshot_delta_vs_prior_release = {
                 "commits": delta_row(
                     safe_int(git_stats.get("commits_in_range")),
                     safe_int(prev_git.get("commits_in_range")),
@@ -1777,118 +3275,54 @@ def build_report(
                     safe_int(prev_git.get("net_lines")),
                 ),
                 "combined_tokens": delta_row(
-                    safe_int(usage.get("combined", {}).get("total_tokens")),
-                    safe_int(prev_usage.get("combined", {}).get("total_tokens")),
+                    safe_int(usage_combined.get("total_tokens")),
+                    safe_int(prev_usage_combined.get("total_tokens")),
                 ),
                 "combined_cost_usd": delta_row(
-                    float(usage.get("combined", {}).get("estimated_cost_usd") or 0.0),
-                    float(prev_usage.get("combined", {}).get("estimated_cost_usd") or 0.0),
+                    float(usage_combined.get("estimated_cost_usd") or 0.0),
+                    float(prev_usage_combined.get("estimated_cost_usd") or 0.0),
                 ),
                 "test_functions": delta_row(
                     safe_int(test_composition.get("test_functions")),
                     safe_int(prev_tests.get("test_functions")),
                 ),
             }
-        else:
-            release_row["snapshot_delta_vs_prior_release"] = None
-
-        total_commits += safe_int(git_stats.get("commits_in_range"))
-        total_files += safe_int(git_stats.get("unique_files_touched"))
-        total_insertions += safe_int(git_stats.get("insertions"))
-        total_deletions += safe_int(git_stats.get("deletions"))
-        total_net += safe_int(git_stats.get("net_lines"))
-        total_codex_in += safe_int(usage.get("codex", {}).get("tokens_in"))
-        total_codex_uncached_in += safe_int(usage.get("codex", {}).get("tokens_in_uncached"))
-        total_codex_cached_in += safe_int(usage.get("codex", {}).get("tokens_in_cached"))
-        total_codex_out += safe_int(usage.get("codex", {}).get("tokens_out"))
-        total_codex_total += safe_int(usage.get("codex", {}).get("total_tokens"))
-        total_claude_in += safe_int(usage.get("claude", {}).get("tokens_in"))
-        total_claude_base_in += safe_int(usage.get("claude", {}).get("tokens_in_base"))
-        total_claude_cache_write_in += safe_int(usage.get("claude", {}).get("tokens_in_cache_write"))
-        total_claude_cache_read_in += safe_int(usage.get("claude", {}).get("tokens_in_cache_read"))
-        total_claude_out += safe_int(usage.get("claude", {}).get("tokens_out"))
-        total_claude_total += safe_int(usage.get("claude", {}).get("total_tokens"))
-        total_combined_in += safe_int(usage.get("combined", {}).get("tokens_in"))
-        total_combined_out += safe_int(usage.get("combined", {}).get("tokens_out"))
-        total_combined_total += safe_int(usage.get("combined", {}).get("total_tokens"))
-        total_codex_cost += float(usage.get("codex", {}).get("estimated_cost_usd") or 0.0)
-        total_claude_cost += float(usage.get("claude", {}).get("estimated_cost_usd") or 0.0)
-        total_combined_cost += float(usage.get("combined", {}).get("estimated_cost_usd") or 0.0)
-        total_active += safe_int(usage.get("timing", {}).get("combined", {}).get("active_seconds"))
-        total_coding += safe_int(usage.get("timing", {}).get("combined", {}).get("coding_seconds"))
-        total_planning += safe_int(usage.get("timing", {}).get("combined", {}).get("planning_seconds"))
-        total_test_files += safe_int(test_composition.get("test_files"))
-        total_test_functions += safe_int(test_composition.get("test_functions"))
-        total_test_unit_functions += safe_int(
-            test_composition.get("by_category", {}).get("unit", {}).get("test_functions")
-        )
-        total_test_integration_functions += safe_int(
-            test_composition.get("by_category", {}).get("integration", {}).get("test_functions")
-        )
-        total_test_adversarial_functions += safe_int(
-            test_composition.get("by_category", {}).get("adversarial", {}).get("test_functions")
-        )
-        total_doc_commits += safe_int(doc_churn.get("commits"))
-        total_doc_files += safe_int(doc_churn.get("unique_files_touched"))
-        total_doc_insertions += safe_int(doc_churn.get("insertions"))
-        total_doc_deletions += safe_int(doc_churn.get("deletions"))
+
+        add_total_fields(git_totals, git_stats, GIT_TOTAL_FIELDS)
+        for agent, agent_usage in (("codex", usage_codex), ("claude", usage_claude), ("combined", usage_combined)):
+            agent_fields = TOKEN_TOTAL_FIELDS[agent]
+            add_total_fields(token_totals[agent], agent_usage, zip(agent_fields, agent_fields))
+            cost_totals[agent] += float(agent_usage.get("estimated_cost_usd") or 0.0)
+        add_total_fields(activity_totals, timing_combined, ACTIVITY_TOTAL_FIELDS)
+        add_total_fields(test_totals, test_composition, TEST_TOTAL_FIELDS)
+        for dst, category in TEST_CATEGORY_TOTAL_FIELDS:
+            test_totals[dst] += safe_int(tests_by_category.get(category, EMPTY).get("test_functions"))
+        add_total_fields(doc_totals, doc_churn, DOC_TOTAL_FIELDS)
 
         releases.append(release_row)
         previous_release_for_delta = release_row
 
     totals = {
         "releases": len(releases),
-        "commits": total_commits,
-        "files_touched_sum": total_files,
-        "insertions": total_insertions,
-        "deletions": total_deletions,
-        "net_lines": total_net,
+        **{dst: git_totals[dst] for dst, _ in GIT_TOTAL_FIELDS},
         "tokens": {
-            "codex": {
-                "tokens_in": total_codex_in,
-                "tokens_in_uncached": total_codex_uncached_in,
-                "tokens_in_cached": total_codex_cached_in,
-                "tokens_out": total_codex_out,
-                "total_tokens": total_codex_total,
-                "estimated_cost_usd": round(total_codex_cost, 2),
-            },
-            "claude": {
-                "tokens_in": total_claude_in,
-                "tokens_in_base": total_claude_base_in,
-                "tokens_in_cache_write": total_claude_cache_write_in,
-                "tokens_in_cache_read": total_claude_cache_read_in,
-                "tokens_out": total_claude_out,
-                "total_tokens": total_claude_total,
-                "estimated_cost_usd": round(total_claude_cost, 2),
-            },
-            "combined": {
-                "tokens_in": total_combined_in,
-                "tokens_out": total_combined_out,
-                "total_tokens": total_combined_total,
-                "estimated_cost_usd": round(total_combined_cost, 2),
-            },
+            agent: {
+                **{field: token_totals[agent][field] for field in fields},
+                "estimated_cost_usd": round(cost_totals[agent], 2),
+            }
+            for agent, fields in TOKEN_TOTAL_FIELDS.items()
         },
         "activity_seconds": {
-            "active": total_active,
-            "coding": total_coding,
-            "planning": total_planning,
-            "active_human": fmt_duration(total_active),
-            "coding_human": fmt_duration(total_coding),
-            "planning_human": fmt_duration(total_planning),
+            **{dst: activity_totals[dst] for dst, _ in ACTIVITY_TOTAL_FIELDS},
+            **{f"{dst}_human": fmt_duration(activity_totals[dst]) for dst, _ in ACTIVITY_TOTAL_FIELDS},
         },
         "tests": {
-            "test_files_sum": total_test_files,
-            "test_functions_sum": total_test_functions,
-            "unit_functions_sum": total_test_unit_functions,
-            "integration_functions_sum": total_test_integration_functions,
-            "adversarial_functions_sum": total_test_adversarial_functions,
+            **{dst: test_totals[dst] for dst, _ in TEST_TOTAL_FIELDS},
+            **{dst: test_totals[dst] for dst, _ in TEST_CATEGORY_TOTAL_FIELDS},
         },
         "documentation_churn": {
-            "commits_sum": total_doc_commits,
-            "unique_files_touched_sum": total_doc_files,
-            "insertions_sum": total_doc_insertions,
-            "deletions_sum": total_doc_deletions,
-            "net_lines_sum": total_doc_insertions - total_doc_deletions,
+            **{dst: doc_totals[dst] for dst, _ in DOC_TOTAL_FIELDS},
+            "net_lines_sum": doc_totals["insertions_sum"] - doc_totals["deletions_sum"],
         },
     }
 
@@ -1897,21 +3331,9 @@ def build_report(
         "repo_root": str(repo_root),
         "tags_scanned": [tag.name for tag in tags],
         "selected_tags": [tag.name for tag in tags[start_idx : end_idx + 1]],
-        "cost_assumptions_usd_per_1m": {
-            "codex_gpt5x": {
-                "input_uncached": codex_price_in_per_1m,
-                "input_cached": codex_price_cached_input_per_1m,
-                "output": codex_price_out_per_1m,
-            },
-            "claude_opus4x": {
-                "input_base": claude_price_in_per_1m,
-                "input_cache_write": claude_price_cache_write_per_1m,
-                "input_cache_read": claude_price_cache_read_per_1m,
-                "output": claude_price_out_per_1m,
-            },
-        },
+        "cost_assumptions_usd_per_1m": prices.cost_assumptions(),
         "totals": totals,
-        "releases": releases,
+        "releases": [row.as_dict() for row in releases],
     }
 
 
@@ -1922,10 +3344,20 @@ def main() -> int:
     parser.add_argument("--to-tag", help="Inclusive ending tag for report")
     parser.add_argument("--skip-usage", action="store_true", help="Skip Codex/Claude usage aggregation")
     parser.add_argument("--with-scc", action="store_true", help="Collect per-tag scc snapshots")
+    parser.add_argument(
+        "--scc-lightweight",
+        action="store_true",
+        help="With --with-scc, count lines in-process from git archive instead of running scc (no complexity/COCOMO)",
+    )
+    parser.add_argument(
+        "--net-diff-churn",
+        action="store_true",
+        help="Faster git churn: use one endpoint `git diff` per tag range (net change, not per-commit churn)",
+    )
     parser.add_argument(
         "--with-test-composition",
         action="store_true",
-        help="Collect per-tag test composition snapshots from git archive",
+        help="Collect per-tag test composition snapshots from the git object store",
     )
     parser.add_argument(
         "--price-gpt5-input-per-1m",
@@ -1969,9 +3401,37 @@ def main() -> int:
         default=DEFAULT_OPUS4_OUTPUT_USD_PER_1M,
         help="Cost assumption for Claude Opus 4.x output tokens (USD per 1M)",
     )
+    parser.add_argument(
+        "--prices",
+        type=parse_price_overrides,
+        metavar="NAME=USD[,NAME=USD...]",
+        help="Override several prices at once, e.g. gpt5-input-per-1m=1.5,opus4-output-per-1m=60 (wins over --price-*)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes for parsing session files and per-tag snapshots (default: CPU count; 1 disables pools)",
+    )
+    parser.add_argument(
+        "--session-cache",
+        default=DEFAULT_SESSION_CACHE_PATH,
+        help="SQLite cache of parsed session files, keyed by path/mtime/size",
+    )
+    parser.add_argument(
+        "--snapshot-cache",
+        default=DEFAULT_SNAPSHOT_CACHE_DIR,
+        help="Directory caching scc/test-composition snapshots, keyed by git tree SHA",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Disable the session and snapshot caches")
     parser.add_argument("--codex-root", default="~/.codex/sessions", help="Codex sessions root")
     parser.add_argument("--claude-projects-root", default="~/.claude/projects", help="Claude projects root")
     parser.add_argument("--output-json", help="Optional output JSON file path")
+    parser.add_argument(
+        "--canonicalize",
+        action="store_true",
+        help="Sort JSON object keys (stable diffs across report layout changes); default keeps build order",
+    )
     parser.add_argument("--output-markdown", help="Optional output markdown file path")
     args = parser.parse_args()
 
@@ -1984,10 +3444,15 @@ def main() -> int:
     if not args.skip_usage:
         codex_root = Path(args.codex_root).expanduser().resolve()
         claude_root = Path(args.claude_projects_root).expanduser().resolve()
-        if codex_root.exists():
-            codex_sessions = load_codex_sessions(codex_root, repo_root)
-        if claude_root.exists():
-            claude_events = load_claude_events(claude_root, repo_root)
+        cache = None if args.no_cache else SessionParseCache(Path(args.session_cache).expanduser())
+        try:
+            if codex_root.exists():
+                codex_sessions = load_codex_sessions(codex_root, repo_root, max_workers=args.jobs, cache=cache)
+            if claude_root.exists():
+                claude_events = load_claude_events(claude_root, repo_root, max_workers=args.jobs, cache=cache)
+        finally:
+            if cache is not None:
+                cache.close()
 
     payload = build_report(
         repo_root=repo_root,
@@ -1998,26 +3463,27 @@ def main() -> int:
         claude_events=claude_events,
         with_scc=args.with_scc,
         with_test_composition=args.with_test_composition,
-        codex_price_in_per_1m=args.price_gpt5_input_per_1m,
-        codex_price_cached_input_per_1m=args.price_gpt5_cached_input_per_1m,
-        codex_price_out_per_1m=args.price_gpt5_output_per_1m,
-        claude_price_in_per_1m=args.price_opus4_input_per_1m,
-        claude_price_cache_write_per_1m=args.price_opus4_cache_write_per_1m,
-        claude_price_cache_read_per_1m=args.price_opus4_cache_read_per_1m,
-        claude_price_out_per_1m=args.price_opus4_output_per_1m,
+        net_diff_churn=args.net_diff_churn,
+        snapshot_cache=None if args.no_cache else SnapshotCache(Path(args.snapshot_cache).expanduser()),
+        scc_lightweight=args.scc_lightweight,
+        max_workers=args.jobs,
+        prices=PriceTable.from_args(args),
     )
 
     if args.output_json:
         output_json = Path(args.output_json).expanduser().resolve()
         output_json.parent.mkdir(parents=True, exist_ok=True)
-        output_json.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        with output_json.open("wb") as handle:
+            write_json(payload, handle, sort_keys=args.canonicalize)
     else:
-        print(json.dumps(payload, indent=2, sort_keys=True))
+        write_json(payload, sys.stdout.buffer, sort_keys=args.canonicalize)
+        sys.stdout.flush()
 
     if args.output_markdown:
         output_md = Path(args.output_markdown).expanduser().resolve()
         output_md.parent.mkdir(parents=True, exist_ok=True)
-        output_md.write_text(render_markdown(payload), encoding="utf-8")
+        with output_md.open("wb", buffering=MARKDOWN_WRITE_BUFFER) as handle:
+            write_markdown(payload, handle)
 
     return 0
 
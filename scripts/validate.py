@@ -17,16 +17,26 @@ Checks:
 from __future__ import annotations
 
 import argparse
+import heapq
 import json
 import os
 import re
 import sys
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any, Optional
 
+import pyarrow as pa
+import pyarrow.compute as pc
 import yaml
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 if __package__:
     from .db import (
         VALID_DOMAINS,
@@ -81,11 +91,42 @@ else:
 CLAIM_ID_RE = re.compile(r"^[A-Z]+-\d{4}-\d{3}$")
 CHAIN_ID_RE = re.compile(r"^CHAIN-\d{4}-\d{3}$")
 CONTRADICTION_ID_RE = re.compile(r"^TENS-\d{4}-\d{3}$")
+PRED_CLAIM_ID_RE = re.compile(r"\*\*Claim ID\*\*:\s*([A-Z]+-\d{4}-\d{3})")
+
+# Bound once; the validators call these per record.
+_CLAIM_ID_MATCH = CLAIM_ID_RE.match
+_CHAIN_ID_MATCH = CHAIN_ID_RE.match
+
+ALLOWED_CLAIM_TYPES = frozenset({"[F]", "[T]", "[H]", "[P]", "[A]", "[C]", "[S]", "[X]"})
+ALLOWED_EVIDENCE_LEVELS = frozenset(f"E{i}" for i in range(1, 7))
+ALLOWED_PREDICTION_STATUSES = frozenset({"[P+]", "[P~]", "[P→]", "[P?]", "[P←]", "[P!]", "[P-]", "[P∅]"})
+ALLOWED_SOURCE_TYPES = frozenset(
+    {"PAPER", "BOOK", "REPORT", "ARTICLE", "BLOG", "SOCIAL", "CONVO", "INTERVIEW", "DATA", "FICTION", "KNOWLEDGE"}
+)
+
+
+# Columns each validation pass reads; table scans project to these so unused fields
+# (notably the other tables' embeddings and free text) are never decoded.
+CLAIM_COLUMNS = (
+    "id", "domain", "type", "evidence_level", "credence", "text", "source_ids",
+    "supports", "contradicts", "depends_on", "modified_by", "part_of_chain", "embedding",
+)
+SOURCE_COLUMNS = ("id", "type", "reliability", "claims_extracted")
+CHAIN_COLUMNS = ("id", "credence", "claims")
+PREDICTION_COLUMNS = ("claim_id", "status", "source_id")
+SCAN_BATCH_SIZE = 8192
+
+# Claim list columns whose entries must name another claim
+CLAIM_REL_FIELDS = ("supports", "contradicts", "depends_on", "modified_by")
 
-ALLOWED_CLAIM_TYPES = {"[F]", "[T]", "[H]", "[P]", "[A]", "[C]", "[S]", "[X]"}
-ALLOWED_EVIDENCE_LEVELS = {f"E{i}" for i in range(1, 7)}
-ALLOWED_PREDICTION_STATUSES = {"[P+]", "[P~]", "[P→]", "[P?]", "[P←]", "[P!]", "[P-]", "[P∅]"}
-ALLOWED_SOURCE_TYPES = {"PAPER", "BOOK", "REPORT", "ARTICLE", "BLOG", "SOCIAL", "CONVO", "INTERVIEW", "DATA", "FICTION", "KNOWLEDGE"}
+# List columns normalized at load (None/empty -> ()) so checks can iterate them directly
+CLAIM_LIST_FIELDS = ("source_ids", *CLAIM_REL_FIELDS)
+SOURCE_LIST_FIELDS = ("claims_extracted",)
+CHAIN_LIST_FIELDS = ("claims",)
+
+# Characters a JSON document can start with after leading whitespace. N and I cover the NaN/Infinity
+# literals, which only the stdlib json.loads accepts; json_loads falls back to it for them.
+JSON_VALUE_START = frozenset('{["-0123456789tfnNI')
 
 
 @dataclass(frozen=True)
@@ -109,6 +150,137 @@ def _is_probability(value: Any) -> bool:
 # Database Validation
 # =============================================================================
 
+def json_loads(text: str) -> Any:
+    """Parse JSON, with orjson when available.
+
+    orjson rejects some input that json.loads accepts (NaN/Infinity literals, lone
+    surrogates), so anything it rejects is re-parsed with json.loads. Validation verdicts
+    therefore never depend on whether orjson is installed; only invalid payloads parse twice.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
+def _is_json(text: str) -> bool:
+    """Return True if `text` parses as JSON.
+
+    Text whose first non-whitespace character cannot begin a JSON value is rejected
+    without running the parser; everything else is decided by a full parse.
+    """
+    stripped = text.lstrip(" \t\n\r")
+    if not stripped or stripped[0] not in JSON_VALUE_START:
+        return False
+    try:
+        json_loads(text)
+    except json.JSONDecodeError:
+        return False
+    return True
+
+
+def _normalize_list_fields(rows: Iterable[dict[str, Any]], fields: tuple[str, ...]) -> None:
+    """Replace missing, None or empty list fields with () in place."""
+    for row in rows:
+        for field in fields:
+            if not row.get(field):
+                row[field] = ()
+
+
+def _scan_batches(db: Any, table_name: str, columns: tuple[str, ...]) -> Iterator[pa.RecordBatch]:
+    """Yield every row of a table as Arrow record batches, projected to `columns`.
+
+    Unlike the `list_*` helpers there is no row limit; columns missing from an older
+    table schema are skipped (rows then read as None for them via `.get`).
+    """
+    table = db.open_table(table_name)
+    present = set(table.schema.names)
+    query = table.search().select([c for c in columns if c in present]).limit(None)
+    yield from query.to_batches(SCAN_BATCH_SIZE)
+
+
+def _scan_rows(db: Any, table_name: str, columns: tuple[str, ...]) -> Iterator[dict[str, Any]]:
+    """Yield every row of a table as a dict, decoded batch by batch (see `_scan_batches`)."""
+    for batch in _scan_batches(db, table_name, columns):
+        yield from batch.to_pylist()
+
+
+def _claim_field_suspects(batches: list[pa.RecordBatch]) -> set[str]:
+    """IDs of claims that may fail a per-field check (ID format, domain, type, evidence, embedding).
+
+    The predicates run as Arrow kernels over whole columns, so only flagged claims go through
+    the per-claim Python checks, which still decide the findings. The flags are a superset:
+    nulls and columns absent from the schema count as suspect.
+    """
+    domains = pa.array(sorted(VALID_DOMAINS))
+    claim_types = pa.array(sorted(ALLOWED_CLAIM_TYPES))
+    evidence_levels = pa.array(sorted(ALLOWED_EVIDENCE_LEVELS))
+    suspects: set[str] = set()
+    for batch in batches:
+        ids = batch.column("id")
+        names = batch.schema.names
+        if not {"domain", "type", "evidence_level", "embedding"}.issubset(names):
+            suspects.update(ids.to_pylist())
+            continue
+        domain = batch.column("domain")
+        ok = pc.and_(pc.match_substring_regex(ids, CLAIM_ID_RE.pattern),
+                     pc.equal(pc.list_element(pc.split_pattern(ids, "-", max_splits=1), 0), domain))
+        ok = pc.and_(ok, pc.is_in(domain, value_set=domains))
+        ok = pc.and_(ok, pc.is_in(batch.column("type"), value_set=claim_types))
+        ok = pc.and_(ok, pc.is_in(batch.column("evidence_level"), value_set=evidence_levels))
+        ok = pc.and_(ok, pc.greater(pc.list_value_length(batch.column("embedding")), 0))
+        suspects.update(pc.filter(ids, pc.invert(pc.fill_null(ok, False))).to_pylist())
+    return suspects
+
+
+def _invalid_probability_ids(batches: list[pa.RecordBatch], column: str) -> set[str]:
+    """IDs of rows whose `column` fails `_is_probability`, evaluated over whole Arrow columns.
+
+    Nulls, NaN and out-of-range values are flagged; a missing or non-numeric column flags every row.
+    """
+    invalid: set[str] = set()
+    for batch in batches:
+        ids = batch.column("id")
+        if column not in batch.schema.names:
+            invalid.update(ids.to_pylist())
+            continue
+        values = batch.column(column)
+        if not (pa.types.is_integer(values.type) or pa.types.is_floating(values.type)):
+            invalid.update(ids.to_pylist())
+            continue
+        ok = pc.and_(pc.greater_equal(values, 0.0), pc.less_equal(values, 1.0))
+        invalid.update(pc.filter(ids, pc.invert(pc.fill_null(ok, False))).to_pylist())
+    return invalid
+
+
+def _claim_ref_suspects(
+    batches: list[pa.RecordBatch], claim_ids: frozenset[str], source_ids: frozenset[str]
+) -> set[str]:
+    """IDs of claims holding at least one source or relationship reference that does not resolve.
+
+    Each list column is flattened once and matched against the known IDs with `is_in`; the
+    parent indices of unmatched values map back to the owning claims. Python checks then emit
+    one finding per dangling reference for just these claims.
+    """
+    known = {
+        "source_ids": pa.array(list(source_ids), type=pa.string()),
+        **dict.fromkeys(CLAIM_REL_FIELDS, pa.array(list(claim_ids), type=pa.string())),
+    }
+    suspects: set[str] = set()
+    for batch in batches:
+        ids = batch.column("id")
+        for field, value_set in known.items():
+            if field not in batch.schema.names:
+                continue
+            refs = batch.column(field)
+            missing = pc.invert(pc.is_in(pc.list_flatten(refs), value_set=value_set))
+            parents = pc.filter(pc.list_parent_indices(refs), missing)
+            suspects.update(ids.take(parents).to_pylist())
+    return suspects
+
+
 def validate_db(db_path: Optional[Path] = None, strict: bool = False) -> list[Finding]:
     """Validate LanceDB database integrity.
 
@@ -127,21 +299,18 @@ def validate_db(db_path: Optional[Path] = None, strict: bool = False) -> list[Fi
             db_path = default_db
         else:
             project_root = find_project_root(Path.cwd())
-            if project_root:
-                detected = resolve_db_path_from_project_root(project_root)
-                if detected.exists():
-                    db_path = detected
-
-    if db_path is None and not os.getenv("REALITYCHECK_DATA"):
-        default_db = Path("data/realitycheck.lance")
-        return [
-            Finding(
-                "ERROR",
-                "REALITYCHECK_DATA_MISSING",
-                "REALITYCHECK_DATA is not set and no database was found at "
-                f"'{default_db}' (or via project auto-detect). Set REALITYCHECK_DATA or pass --db-path.",
-            )
-        ]
+            detected = resolve_db_path_from_project_root(project_root) if project_root else None
+            if detected is not None and detected.exists():
+                db_path = detected
+            else:
+                return [
+                    Finding(
+                        "ERROR",
+                        "REALITYCHECK_DATA_MISSING",
+                        "REALITYCHECK_DATA is not set and no database was found at "
+                        f"'{default_db}' (or via project auto-detect). Set REALITYCHECK_DATA or pass --db-path.",
+                    )
+                ]
 
     try:
         db = get_db(db_path)
@@ -158,81 +327,121 @@ def validate_db(db_path: Optional[Path] = None, strict: bool = False) -> list[Fi
         # Can't continue validation without tables
         return findings
 
-    # Load all data
+    # Load all data; the four scans are independent and mostly wait on IO/Arrow decode, so they overlap
     try:
-        claims = {c["id"]: c for c in list_claims(limit=100000, db=db)}
-        sources = {s["id"]: s for s in list_sources(limit=100000, db=db)}
-        chains = {c["id"]: c for c in list_chains(limit=100000, db=db)}
-        predictions = {p["claim_id"]: p for p in list_predictions(limit=100000, db=db)}
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            claims_future = executor.submit(lambda: list(_scan_batches(db, "claims", CLAIM_COLUMNS)))
+            sources_future = executor.submit(lambda: {s["id"]: s for s in _scan_rows(db, "sources", SOURCE_COLUMNS)})
+            chains_future = executor.submit(lambda: list(_scan_batches(db, "chains", CHAIN_COLUMNS)))
+            predictions_future = executor.submit(
+                lambda: {p["claim_id"]: p for p in _scan_rows(db, "predictions", PREDICTION_COLUMNS)}
+            )
+        claim_batches = claims_future.result()
+        claims = {c["id"]: c for batch in claim_batches for c in batch.to_pylist()}
+        sources = sources_future.result()
+        chain_batches = chains_future.result()
+        chains = {c["id"]: c for batch in chain_batches for c in batch.to_pylist()}
+        predictions = predictions_future.result()
     except Exception as e:
         return [Finding("ERROR", "DB_READ", f"Error reading database: {e}")]
 
-    claim_ids = set(claims.keys())
-    source_ids = set(sources.keys())
-    chain_ids = set(chains.keys())
+    _normalize_list_fields(claims.values(), CLAIM_LIST_FIELDS)
+    _normalize_list_fields(sources.values(), SOURCE_LIST_FIELDS)
+    _normalize_list_fields(chains.values(), CHAIN_LIST_FIELDS)
+
+    claim_ids = frozenset(claims)
+    source_ids = frozenset(sources)
+    chain_ids = frozenset(chains)
+    field_suspects = _claim_field_suspects(claim_batches)
+    ref_suspects = _claim_ref_suspects(claim_batches, claim_ids, source_ids)
+    invalid_claim_credences = _invalid_probability_ids(claim_batches, "credence")
 
     # Validate claims
+    append = findings.append
+    prediction_claim_ids: set[str] = set()
     for claim_id, claim in claims.items():
-        # ID format
-        if not CLAIM_ID_RE.match(claim_id):
-            findings.append(Finding("ERROR", "CLAIM_ID_FORMAT", f"Invalid claim ID format: {claim_id}"))
-            continue
-
-        # Domain from ID matches field
-        domain_from_id = claim_id.split("-")[0]
-        if claim.get("domain") != domain_from_id:
-            findings.append(Finding("ERROR", "CLAIM_DOMAIN_MISMATCH",
-                f"{claim_id}: ID domain '{domain_from_id}' != field domain '{claim.get('domain')}'"))
-
-        # Domain is valid
-        if claim.get("domain") not in VALID_DOMAINS:
-            findings.append(Finding("ERROR", "CLAIM_DOMAIN_INVALID",
-                f"{claim_id}: Invalid domain '{claim.get('domain')}'"))
-
-        # Type is valid
-        if claim.get("type") not in ALLOWED_CLAIM_TYPES:
-            findings.append(Finding("ERROR", "CLAIM_TYPE_INVALID",
-                f"{claim_id}: Invalid type '{claim.get('type')}'"))
-
-        # Evidence level is valid
-        if claim.get("evidence_level") not in ALLOWED_EVIDENCE_LEVELS:
-            findings.append(Finding("ERROR", "CLAIM_EVIDENCE_INVALID",
-                f"{claim_id}: Invalid evidence_level '{claim.get('evidence_level')}'"))
+        get = claim.get
+        if get("type") == "[P]":
+            prediction_claim_ids.add(claim_id)
+
+        # Per-field checks only for claims the Arrow pre-pass could not clear
+        if claim_id in field_suspects:
+            # ID format
+            if not _CLAIM_ID_MATCH(claim_id):
+                append(Finding("ERROR", "CLAIM_ID_FORMAT", f"Invalid claim ID format: {claim_id}"))
+                continue
+
+            # Domain from ID matches field
+            domain_from_id = claim_id.split("-")[0]
+            domain = get("domain")
+            if domain != domain_from_id:
+                append(Finding("ERROR", "CLAIM_DOMAIN_MISMATCH",
+                    f"{claim_id}: ID domain '{domain_from_id}' != field domain '{domain}'"))
+
+            # Domain is valid
+            if domain not in VALID_DOMAINS:
+                append(Finding("ERROR", "CLAIM_DOMAIN_INVALID",
+                    f"{claim_id}: Invalid domain '{domain}'"))
+
+            # Type is valid
+            if get("type") not in ALLOWED_CLAIM_TYPES:
+                append(Finding("ERROR", "CLAIM_TYPE_INVALID",
+                    f"{claim_id}: Invalid type '{get('type')}'"))
+
+            # Evidence level is valid
+            if get("evidence_level") not in ALLOWED_EVIDENCE_LEVELS:
+                append(Finding("ERROR", "CLAIM_EVIDENCE_INVALID",
+                    f"{claim_id}: Invalid evidence_level '{get('evidence_level')}'"))
 
         # Credence is valid probability
-        if not _is_probability(claim.get("credence")):
-            findings.append(Finding("ERROR", "CLAIM_CREDENCE_INVALID",
-                f"{claim_id}: Invalid credence '{claim.get('credence')}'"))
+        if claim_id in invalid_claim_credences and not _is_probability(get("credence")):
+            append(Finding("ERROR", "CLAIM_CREDENCE_INVALID",
+                f"{claim_id}: Invalid credence '{get('credence')}'"))
 
         # Text is non-empty
-        if not claim.get("text") or not claim["text"].strip():
-            findings.append(Finding("ERROR", "CLAIM_TEXT_EMPTY",
+        text = get("text")
+        if not text or not text.strip():
+            append(Finding("ERROR", "CLAIM_TEXT_EMPTY",
                 f"{claim_id}: Missing or empty text"))
 
-        # Source IDs exist
-        for source_id in claim.get("source_ids", []) or []:
-            if source_id not in source_ids:
-                findings.append(Finding("ERROR", "CLAIM_SOURCE_MISSING",
-                    f"{claim_id}: References unknown source '{source_id}'"))
+        if claim_id in ref_suspects:
+            # Source IDs exist
+            findings.extend(
+                Finding("ERROR", "CLAIM_SOURCE_MISSING", f"{claim_id}: References unknown source '{source_id}'")
+                for source_id in claim["source_ids"]
+                if source_id not in source_ids
+            )
 
-        # Relationship targets exist
-        for rel_field in ("supports", "contradicts", "depends_on", "modified_by"):
-            for target_id in claim.get(rel_field, []) or []:
-                if target_id not in claim_ids:
-                    findings.append(Finding("ERROR", "CLAIM_REL_MISSING",
-                        f"{claim_id}: {rel_field} references unknown claim '{target_id}'"))
+            # Relationship targets exist
+            findings.extend(
+                Finding("ERROR", "CLAIM_REL_MISSING",
+                    f"{claim_id}: {rel_field} references unknown claim '{target_id}'")
+                for rel_field in CLAIM_REL_FIELDS
+                for target_id in claim[rel_field]
+                if target_id not in claim_ids
+            )
 
         # Chain reference exists
-        chain_ref = claim.get("part_of_chain")
+        chain_ref = get("part_of_chain")
         if chain_ref and chain_ref not in chain_ids:
-            findings.append(Finding("ERROR", "CLAIM_CHAIN_MISSING",
+            append(Finding("ERROR", "CLAIM_CHAIN_MISSING",
                 f"{claim_id}: References unknown chain '{chain_ref}'"))
 
         # Embedding exists (warning only)
-        if not claim.get("embedding"):
-            findings.append(Finding("WARN", "CLAIM_NO_EMBEDDING",
+        if claim_id in field_suspects and not get("embedding"):
+            append(Finding("WARN", "CLAIM_NO_EMBEDDING",
                 f"{claim_id}: Missing embedding"))
 
+    # Backlink index: source_id -> claims citing it, built in one pass. Values are dicts used as
+    # insertion-ordered sets, so they serve both the O(1) backlink lookups and ordered reporting.
+    claims_citing_source: dict[str, dict[str, None]] = {}
+    for claim_id, claim in claims.items():
+        for source_id in claim["source_ids"]:
+            claims_citing_source.setdefault(source_id, {})[claim_id] = None
+
+    # Forward index: source_id -> set of claims it lists in claims_extracted
+    extracted_by_source = {sid: frozenset(source["claims_extracted"]) for sid, source in sources.items()}
+
     # Validate sources
     for source_id, source in sources.items():
         # Type is valid
@@ -245,56 +454,65 @@ def validate_db(db_path: Optional[Path] = None, strict: bool = False) -> list[Fi
             findings.append(Finding("ERROR", "SOURCE_RELIABILITY_INVALID",
                 f"{source_id}: Invalid reliability '{source.get('reliability')}'"))
 
+        # Consistent source: the claims it lists are exactly the claims citing it, so every listed
+        # claim exists and links back, and nothing is unlisted
+        citing = claims_citing_source.get(source_id, {})
+        extracted = extracted_by_source[source_id]
+        if citing.keys() == extracted:
+            continue
+
         # Claims extracted exist and have backlinks
-        for claim_id in source.get("claims_extracted", []) or []:
+        for claim_id in source["claims_extracted"]:
             if claim_id not in claim_ids:
                 findings.append(Finding("ERROR", "SOURCE_CLAIM_MISSING",
                     f"{source_id}: claims_extracted references unknown claim '{claim_id}'"))
-            else:
-                # Check backlink
-                claim = claims[claim_id]
-                if source_id not in (claim.get("source_ids") or []):
-                    findings.append(Finding("ERROR", "SOURCE_BACKLINK_MISSING",
-                        f"{source_id}: lists {claim_id} but claim doesn't reference this source"))
+            elif claim_id not in citing:
+                # Claim exists but its source_ids don't include this source
+                findings.append(Finding("ERROR", "SOURCE_BACKLINK_MISSING",
+                    f"{source_id}: lists {claim_id} but claim doesn't reference this source"))
 
         # Check reverse: claims citing this source should be in claims_extracted
-        for claim_id, claim in claims.items():
-            if source_id in (claim.get("source_ids") or []):
-                if claim_id not in (source.get("claims_extracted") or []):
-                    findings.append(Finding("ERROR", "SOURCE_CLAIM_NOT_LISTED",
-                        f"{source_id}: claim {claim_id} cites this source but not in claims_extracted"))
+        findings.extend(
+            Finding("ERROR", "SOURCE_CLAIM_NOT_LISTED",
+                f"{source_id}: claim {claim_id} cites this source but not in claims_extracted")
+            for claim_id in citing
+            if claim_id not in extracted
+        )
 
     # Validate chains
+    credence_by_id = {cid: c.get("credence", 1.0) for cid, c in claims.items()}
+    invalid_chain_credences = _invalid_probability_ids(chain_batches, "credence")
     for chain_id, chain in chains.items():
         # ID format
-        if not CHAIN_ID_RE.match(chain_id):
+        if not _CHAIN_ID_MATCH(chain_id):
             findings.append(Finding("ERROR", "CHAIN_ID_FORMAT",
                 f"Invalid chain ID format: {chain_id}"))
             continue
 
         # Credence is valid probability
-        if not _is_probability(chain.get("credence")):
+        if chain_id in invalid_chain_credences and not _is_probability(chain.get("credence")):
             findings.append(Finding("ERROR", "CHAIN_CREDENCE_INVALID",
                 f"{chain_id}: Invalid credence '{chain.get('credence')}'"))
 
         # Claims exist
-        for claim_id in chain.get("claims", []) or []:
-            if claim_id not in claim_ids:
-                findings.append(Finding("ERROR", "CHAIN_CLAIM_MISSING",
-                    f"{chain_id}: References unknown claim '{claim_id}'"))
+        findings.extend(
+            Finding("ERROR", "CHAIN_CLAIM_MISSING", f"{chain_id}: References unknown claim '{claim_id}'")
+            for claim_id in chain["claims"]
+            if claim_id not in claim_ids
+        )
 
         # Verify MIN scoring: chain credence <= min(claim credences)
-        chain_claims = [claims[cid] for cid in (chain.get("claims") or []) if cid in claims]
-        if chain_claims:
-            min_credence = min(c.get("credence", 1.0) for c in chain_claims)
+        min_credence = min(
+            (credence_by_id[cid] for cid in chain["claims"] if cid in credence_by_id),
+            default=None,
+        )
+        if min_credence is not None:
             chain_credence = chain.get("credence", 0)
             if chain_credence > min_credence + 0.01:  # Small tolerance
                 findings.append(Finding("WARN", "CHAIN_CREDENCE_EXCEEDS_MIN",
                     f"{chain_id}: Chain credence {chain_credence} > min claim credence {min_credence}"))
 
-    # Validate predictions
-    prediction_claim_ids = {cid for cid, c in claims.items() if c.get("type") == "[P]"}
-
+    # Validate predictions ([P] claim IDs were collected in the claims loop)
     for claim_id, pred in predictions.items():
         # Status is valid
         if pred.get("status") not in ALLOWED_PREDICTION_STATUSES:
@@ -316,16 +534,15 @@ def validate_db(db_path: Optional[Path] = None, strict: bool = False) -> list[Fi
                 f"Prediction {claim_id}: References unknown source '{source_id}'"))
 
     # Check all [P] claims have predictions
-    prediction_ids = set(predictions.keys())
-    missing_predictions = prediction_claim_ids - prediction_ids
+    missing_predictions = prediction_claim_ids - predictions.keys()
     if missing_predictions:
         findings.append(Finding("ERROR", "PREDICTIONS_MISSING",
-            f"{len(missing_predictions)} [P] claims without prediction records: {', '.join(sorted(missing_predictions)[:5])}..."))
+            f"{len(missing_predictions)} [P] claims without prediction records: {', '.join(heapq.nsmallest(5, missing_predictions))}..."))
 
     # Validate analysis logs (if table exists)
     if "analysis_logs" in existing_tables:
         try:
-            analysis_logs = list_analysis_logs(limit=100000, db=db)
+            analysis_logs = list_analysis_logs(limit=None, db=db)
         except Exception as e:
             findings.append(Finding("ERROR", "ANALYSIS_LOGS_READ", f"Error reading analysis_logs: {e}"))
             analysis_logs = []
@@ -378,12 +595,9 @@ def validate_db(db_path: Optional[Path] = None, strict: bool = False) -> list[Fi
 
             # Validate stages_json is valid JSON if present
             stages_json = log.get("stages_json")
-            if stages_json:
-                try:
-                    json.loads(stages_json)
-                except json.JSONDecodeError:
-                    findings.append(Finding("ERROR", "ANALYSIS_STAGES_INVALID_JSON",
-                        f"{log_id}: stages_json is not valid JSON"))
+            if stages_json and not _is_json(stages_json):
+                findings.append(Finding("ERROR", "ANALYSIS_STAGES_INVALID_JSON",
+                    f"{log_id}: stages_json is not valid JSON"))
 
             # Check for impossible metrics
             duration = log.get("duration_seconds")
@@ -425,11 +639,11 @@ def validate_db(db_path: Optional[Path] = None, strict: bool = False) -> list[Fi
     evidence_links = {}
     if "evidence_links" in existing_tables:
         try:
-            evidence_links = {e["id"]: e for e in list_evidence_links(include_superseded=True, limit=100000, db=db)}
+            evidence_links = {e["id"]: e for e in list_evidence_links(include_superseded=True, limit=None, db=db)}
         except Exception as e:
             findings.append(Finding("ERROR", "EVIDENCE_LINKS_READ", f"Error reading evidence_links: {e}"))
 
-        evidence_link_ids = set(evidence_links.keys())
+        evidence_link_ids = frozenset(evidence_links)
 
         for link_id, link in evidence_links.items():
             # Claim exists
@@ -468,12 +682,12 @@ def validate_db(db_path: Optional[Path] = None, strict: bool = False) -> list[Fi
     reasoning_trails = {}
     if "reasoning_trails" in existing_tables:
         try:
-            reasoning_trails = {r["id"]: r for r in list_reasoning_trails(include_superseded=True, limit=100000, db=db)}
+            reasoning_trails = {r["id"]: r for r in list_reasoning_trails(include_superseded=True, limit=None, db=db)}
         except Exception as e:
             findings.append(Finding("ERROR", "REASONING_TRAILS_READ", f"Error reading reasoning_trails: {e}"))
 
-        reasoning_trail_ids = set(reasoning_trails.keys())
-        evidence_link_ids = set(evidence_links.keys())
+        reasoning_trail_ids = frozenset(reasoning_trails)
+        evidence_link_ids = frozenset(evidence_links)
 
         for trail_id, trail in reasoning_trails.items():
             # Status is valid
@@ -637,13 +851,13 @@ def validate_yaml(repo_root: Path, strict_paths: bool = False) -> list[Finding]:
     chains = claims_data.get("chains", {})
     sources = sources_data.get("sources", {})
 
-    claim_ids = set(claims.keys())
-    source_ids = set(sources.keys())
-    chain_ids = set(chains.keys())
+    claim_ids = frozenset(claims)
+    source_ids = frozenset(sources)
+    chain_ids = frozenset(chains)
 
     # Validate claims (similar to DB validation but for YAML structure)
     for claim_id, claim in claims.items():
-        if not CLAIM_ID_RE.match(claim_id):
+        if not _CLAIM_ID_MATCH(claim_id):
             findings.append(Finding("ERROR", "CLAIM_ID_FORMAT", f"Invalid claim ID: {claim_id}"))
             continue
 
@@ -693,7 +907,7 @@ def validate_yaml(repo_root: Path, strict_paths: bool = False) -> list[Finding]:
 
     # Validate chains
     for chain_id, chain in chains.items():
-        if not CHAIN_ID_RE.match(chain_id):
+        if not _CHAIN_ID_MATCH(chain_id):
             findings.append(Finding("ERROR", "CHAIN_ID_FORMAT", f"Invalid chain ID: {chain_id}"))
             continue
 
@@ -705,14 +919,14 @@ def validate_yaml(repo_root: Path, strict_paths: bool = False) -> list[Finding]:
     # Validate predictions.md
     if predictions_path.exists():
         text = predictions_path.read_text()
-        pred_claim_ids = set(re.findall(r"\*\*Claim ID\*\*:\s*([A-Z]+-\d{4}-\d{3})", text))
+        pred_claim_ids = set(PRED_CLAIM_ID_RE.findall(text))
 
         # Check all [P] claims are in predictions.md
         p_claims = {cid for cid, c in claims.items() if c.get("type") == "[P]"}
         missing = p_claims - pred_claim_ids
         if missing:
             findings.append(Finding("ERROR", "PREDICTIONS_MISSING",
-                f"Missing from predictions.md: {', '.join(sorted(missing)[:5])}..."))
+                f"Missing from predictions.md: {', '.join(heapq.nsmallest(5, missing))}..."))
 
         # Check referenced claims exist
         unknown = pred_claim_ids - claim_ids
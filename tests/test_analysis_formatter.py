@@ -29,11 +29,25 @@ from analysis_formatter import (
     insert_confidence,
     insert_missing_sections,
     format_file,
+    format_text,
+    scan_content,
+    TRACKED_SECTIONS,
     extract_claim_id,
     is_linked_claim_id,
+    _section_pattern,
 )
 
 
+def _positions(text: str, markers: list[str]) -> list[int]:
+    """Return the index of each marker in text, failing if any is missing."""
+    positions = []
+    for marker in markers:
+        pos = text.find(marker)
+        assert pos >= 0, marker
+        positions.append(pos)
+    return positions
+
+
 class TestHelperFunctions:
     """Tests for detection helper functions."""
 
@@ -72,6 +86,20 @@ Some content.
 """
         assert has_section(content, "## Metadata") is True
 
+    def test_has_section_unicode_case_folding(self):
+        """Characters regex case-folding equates with ASCII letters still match."""
+        assert has_section("### Claim \u017fummary", "### Claim Summary") is True
+        assert has_section("### Key Cla\u0130ms", "### Key Claims") is True
+        assert has_section("### Key Cla\u00edms", "### Key Claims") is False
+
+    def test_has_section_matches_header_literally(self):
+        """Header text is matched literally, not as a regex, via a reused compiled pattern."""
+        content = """### Corrections & Updates (v1.0)
+"""
+        assert has_section(content, "### Corrections & Updates (v1.0)") is True
+        assert has_section("### Corrections & Updates v1x0", "### Corrections & Updates (v1.0)") is False
+        assert _section_pattern("## Metadata") is _section_pattern("## Metadata")
+
     def test_has_claims_yaml_true(self):
         """YAML block detected when present."""
         content = """### Claims to Register
@@ -92,6 +120,17 @@ claims:
 """
         assert has_claims_yaml(content) is False
 
+    def test_has_claims_yaml_requires_claims_right_after_fence(self):
+        """A claims key elsewhere in the file does not count as a claims YAML block."""
+        content = """```yaml
+source: example
+```
+
+claims: listed below
+"""
+        assert has_claims_yaml(content) is False
+        assert has_claims_yaml("```yaml\n```\n```yaml  \n\nclaims:\n```") is True
+
     def test_has_credence_true(self):
         """Credence detected when present."""
         content = """**Credence in Analysis**: 0.8"""
@@ -108,6 +147,78 @@ claims:
         assert has_credence(content) is False
 
 
+class TestContentScan:
+    """Tests for the single-pass content scan."""
+
+    def test_scan_single_pass(self):
+        """One scan reports the same markers as the individual detectors."""
+        content = """# Source Analysis: Test
+
+> **Claim types**: `[F]` fact
+
+## METADATA
+
+| Field | Value |
+|-------|-------|
+| **Analysis Depth** | quick |
+
+### Claim Summary
+
+| ID | Type | Domain | Evidence | Credence | Claim |
+|----|------|--------|----------|----------|-------|
+
+### Claims to Register
+
+```yaml
+claims:
+```
+"""
+        scan = scan_content(content)
+
+        assert scan.profile == detect_profile(content) == "quick"
+        assert scan.has_legends is True
+        assert scan.has_claims_yaml is True
+        assert scan.has_credence is False
+        assert scan.has_claim_summary_table is True
+        assert scan.has_key_claims_table is False
+        assert scan.sections == {s for s in TRACKED_SECTIONS if has_section(content, s)}
+        assert scan.sections == {"## Metadata", "### Claim Summary", "### Claims to Register"}
+
+    def test_scan_records_first_header_line_offsets(self):
+        """Offsets point at the first line holding each header and bound every search for it."""
+        from analysis_formatter import QUICK_SECTION_ORDER, find_section_position
+
+        content = "# T\r\n\r\n## Metadata\r\nx\r\nSee ### Claim Summary\n### Claim Summary\n"
+
+        scan = scan_content(content)
+
+        assert scan.section_offsets == {
+            "## Metadata": content.index("## Metadata"),
+            "### Claim Summary": content.index("See ### Claim Summary"),
+        }
+        for section in QUICK_SECTION_ORDER:
+            assert find_section_position(
+                content, section, QUICK_SECTION_ORDER, scan.section_offsets
+            ) == find_section_position(content, section, QUICK_SECTION_ORDER)
+
+    def test_scan_sections_match_headers_anywhere_in_line(self):
+        """Deeper headers and headers after other text count, as they do for has_section."""
+        content = "#### Claim Summary\nSee ### Key Claims below\n### Summary notes\n# Stage 3\n"
+
+        scan = scan_content(content)
+
+        assert scan.sections == {s for s in TRACKED_SECTIONS if has_section(content, s)}
+        assert scan.sections == {"### Claim Summary", "### Key Claims", "## Summary"}
+
+    def test_scan_sections_match_regex_for_non_ascii_lines(self):
+        """Lines with non-ASCII text fall back to the regex's Unicode case folding."""
+        content = "## Metadata é\n### Claim \u017fummary\n"
+
+        scan = scan_content(content)
+
+        assert scan.sections == {s for s in TRACKED_SECTIONS if has_section(content, s)}
+
+
 class TestLegendInsertion:
     """Tests for legend insertion."""
 
@@ -119,10 +230,11 @@ class TestLegendInsertion:
 """
         result = insert_legends(content)
 
-        assert "> **Claim types**:" in result
-        assert "> **Evidence**:" in result
+        legend_pos, evidence_pos, metadata_pos = _positions(
+            result, ["> **Claim types**:", "> **Evidence**:", "## Metadata"]
+        )
         # Legends should come before Metadata
-        assert result.index("> **Claim types**:") < result.index("## Metadata")
+        assert legend_pos < evidence_pos < metadata_pos
 
     def test_insert_legends_idempotent(self):
         """Legends not duplicated if already present."""
@@ -162,10 +274,14 @@ class TestTableInsertion:
         result = insert_claim_summary_table(content)
 
         # Rigor-v1 format includes Layer/Actor/Scope/Quantifier columns
-        assert "| ID | Type | Domain | Layer | Actor | Scope | Quantifier | Evidence | Credence | Claim |" in result
+        header_pos, table_pos = _positions(
+            result,
+            [
+                "### Claim Summary",
+                "| ID | Type | Domain | Layer | Actor | Scope | Quantifier | Evidence | Credence | Claim |",
+            ],
+        )
         # Table should be after the header
-        header_pos = result.index("### Claim Summary")
-        table_pos = result.index("| ID | Type |")
         assert table_pos > header_pos
 
     def test_insert_claim_summary_idempotent(self):
@@ -198,12 +314,11 @@ class TestYamlInsertion:
 """
         result = insert_claims_yaml(content)
 
-        assert "```yaml" in result
-        assert "claims:" in result
+        header_pos, yaml_pos, claims_pos = _positions(
+            result, ["### Claims to Register", "```yaml", "claims:"]
+        )
         # YAML should be after the header
-        header_pos = result.index("### Claims to Register")
-        yaml_pos = result.index("```yaml")
-        assert yaml_pos > header_pos
+        assert header_pos < yaml_pos < claims_pos
 
     def test_insert_yaml_idempotent(self):
         """YAML block not duplicated."""
@@ -264,6 +379,13 @@ class TestSectionInsertion:
         assert "### Claim Summary" in result
         assert "### Claims to Register" in result
 
+    def test_every_ordered_section_has_template(self):
+        """Each profile section is inserted from a prebuilt template that opens with its header."""
+        from analysis_formatter import FULL_SECTION_ORDER, QUICK_SECTION_ORDER, SECTION_TEMPLATES
+
+        for section in (*FULL_SECTION_ORDER, *QUICK_SECTION_ORDER):
+            assert SECTION_TEMPLATES[section].startswith(f"\n{section}\n")
+
     def test_insert_missing_full_sections(self):
         """Missing full profile sections inserted."""
         content = """# Source Analysis
@@ -281,9 +403,10 @@ class TestSectionInsertion:
 class TestFileFormatting:
     """End-to-end file formatting tests."""
 
-    def test_format_minimal_quick_analysis(self, tmp_path):
-        """Minimal file gets all quick profile elements added."""
-        content = """# Source Analysis: Test
+    @pytest.fixture
+    def quick_content(self):
+        """Minimal analysis with only a Metadata table declaring quick depth."""
+        return """# Source Analysis: Test
 
 ## Metadata
 
@@ -292,10 +415,15 @@ class TestFileFormatting:
 | **Source ID** | test-source |
 | **Analysis Depth** | quick |
 """
-        test_file = tmp_path / "test.md"
-        test_file.write_text(content)
 
-        formatted, changes = format_file(test_file)
+    @pytest.fixture
+    def full_content(self, quick_content):
+        """Minimal analysis declaring full depth."""
+        return quick_content.replace("| quick |", "| full |")
+
+    def test_format_minimal_quick_analysis(self, quick_content):
+        """Minimal file gets all quick profile elements added."""
+        formatted, changes = format_text(quick_content)
 
         # Should have added missing elements
         assert len(changes) > 0
@@ -305,26 +433,13 @@ class TestFileFormatting:
         assert "### Claims to Register" in formatted
         assert "```yaml" in formatted
 
-    def test_format_idempotent(self, tmp_path):
+    def test_format_idempotent(self, quick_content):
         """Running formatter twice produces same result."""
-        content = """# Source Analysis: Test
-
-## Metadata
-
-| Field | Value |
-|-------|-------|
-| **Source ID** | test-source |
-| **Analysis Depth** | quick |
-"""
-        test_file = tmp_path / "test.md"
-        test_file.write_text(content)
-
         # First run
-        formatted1, changes1 = format_file(test_file)
-        test_file.write_text(formatted1)
+        formatted1, changes1 = format_text(quick_content)
 
-        # Second run
-        formatted2, changes2 = format_file(test_file)
+        # Second run, on the first run's output
+        formatted2, changes2 = format_text(formatted1)
 
         # Second run should have no changes
         assert len(changes2) == 0
@@ -345,21 +460,9 @@ class TestFileFormatting:
         # File should be unchanged
         assert test_file.read_text() == original
 
-    def test_format_full_profile(self, tmp_path):
+    def test_format_full_profile(self, full_content):
         """Full profile gets all required elements."""
-        content = """# Source Analysis: Test
-
-## Metadata
-
-| Field | Value |
-|-------|-------|
-| **Source ID** | test-source |
-| **Analysis Depth** | full |
-"""
-        test_file = tmp_path / "test.md"
-        test_file.write_text(content)
-
-        formatted, changes = format_file(test_file)
+        formatted, changes = format_text(full_content)
 
         # Should have all full profile elements
         assert "## Stage 1: Descriptive Analysis" in formatted
@@ -367,28 +470,16 @@ class TestFileFormatting:
         assert "## Stage 3: Dialectical Analysis" in formatted
         assert "**Credence in Analysis**:" in formatted
 
-    def test_format_profile_override(self, tmp_path):
+    def test_format_profile_override(self, quick_content):
         """Profile can be overridden."""
-        content = """# Source Analysis: Test
-
-## Metadata
-
-| Field | Value |
-|-------|-------|
-| **Source ID** | test-source |
-| **Analysis Depth** | quick |
-"""
-        test_file = tmp_path / "test.md"
-        test_file.write_text(content)
-
         # Force full profile despite quick marker
-        formatted, changes = format_file(test_file, profile="full")
+        formatted, changes = format_text(quick_content, profile="full")
 
         # Should have full profile elements
         assert "## Stage 1: Descriptive Analysis" in formatted
         assert "**Credence in Analysis**:" in formatted
 
-    def test_format_preserves_existing_content(self, tmp_path):
+    def test_format_preserves_existing_content(self):
         """Existing content is preserved."""
         content = """# Source Analysis: Test
 
@@ -420,10 +511,7 @@ claims:
     text: "My existing claim"
 ```
 """
-        test_file = tmp_path / "test.md"
-        test_file.write_text(content)
-
-        formatted, changes = format_file(test_file)
+        formatted, changes = format_text(content)
 
         # Should preserve existing content
         assert "This is my existing summary that should be preserved." in formatted
@@ -431,6 +519,35 @@ claims:
         # Should have no changes
         assert len(changes) == 0
 
+    def test_format_complete_content_returns_early(self, full_content, monkeypatch):
+        """Compliant content skips claim derivation but still gets blank lines collapsed."""
+        import analysis_formatter
+
+        formatted, _ = format_text(full_content)
+
+        def fail(content):
+            raise AssertionError("claims derived for compliant content")
+
+        monkeypatch.setattr(analysis_formatter, "extract_claims_from_key_claims_table", fail)
+        reformatted, changes = format_text(formatted.replace("## Metadata", "\n\n\n\n## Metadata", 1))
+
+        assert changes == []
+        assert "\n\n\n\n" not in reformatted
+
+    def test_format_file_writes_formatted_text(self, tmp_path):
+        """format_file writes back exactly what format_text produces for the file's content."""
+        content = """# Source Analysis: Test
+
+## Metadata
+"""
+        test_file = tmp_path / "test.md"
+        test_file.write_text(content)
+
+        formatted, changes = format_file(test_file)
+
+        assert (formatted, changes) == format_text(content, path=test_file)
+        assert test_file.read_text() == formatted
+
     def test_format_nonexistent_file(self, tmp_path):
         """Nonexistent file returns error."""
         test_file = tmp_path / "nonexistent.md"
@@ -2274,6 +2274,16 @@ class TestAnalysisLogsCRUD:
         results = list_analysis_logs(limit=3, db=initialized_db)
         assert len(results) == 3
 
+    def test_list_analysis_logs_no_limit(self, initialized_db, sample_analysis_log):
+        """limit=None returns every log rather than a capped page."""
+        for i in range(105):
+            log = sample_analysis_log.copy()
+            log["id"] = f"ANALYSIS-2026-{i+1:03d}"
+            add_analysis_log(log, initialized_db)
+
+        assert len(list_analysis_logs(db=initialized_db)) == 100
+        assert len(list_analysis_logs(limit=None, db=initialized_db)) == 105
+
     def test_add_analysis_log_auto_pass(self, initialized_db, sample_analysis_log):
         """Pass number is auto-computed when not provided."""
         log1 = sample_analysis_log.copy()
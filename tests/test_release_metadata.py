@@ -17,6 +17,28 @@ def test_find_changelog_release_date() -> None:
     assert release_metadata.find_changelog_release_date(changelog, "9.9.9") is None
 
 
+def test_find_changelog_release_date_ignores_non_header_and_malformed_lines() -> None:
+    changelog = """# Changelog
+
+See ## 0.3.0 - 2026-02-01 in prose.
+
+##  0.3.0  -  2026-02-02  
+
+## 0.2.0 - 2026-1-31
+"""
+    assert release_metadata.find_changelog_release_date(changelog, "0.3.0") == "2026-02-02"
+    assert release_metadata.find_changelog_release_date(changelog, "0.2.0") is None
+    assert release_metadata.find_changelog_release_date(changelog, "0.3") is None
+
+
+def test_find_changelog_release_date_header_at_edges() -> None:
+    assert release_metadata.find_changelog_release_date("## 0.3.0 - 2026-02-01", "0.3.0") == "2026-02-01"
+    changelog = "# Changelog\r\n\r\n## 0.3.0 - 2026-02-01\r\n\r\n## 0.2.0 - 2026-01-31"
+    assert release_metadata.find_changelog_release_date(changelog, "0.3.0") == "2026-02-01"
+    assert release_metadata.find_changelog_release_date(changelog, "0.2.0") == "2026-01-31"
+    assert release_metadata.find_changelog_release_date("", "0.3.0") is None
+
+
 def test_update_readme_content_updates_status_tree_and_bibtex_marker_block() -> None:
     readme = """# Reality Check
 
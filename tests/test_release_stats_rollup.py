@@ -1,7 +1,17 @@
 from __future__ import annotations
 
+import argparse
+import dataclasses
+import io
+import json
+import os
+import subprocess
+import sys
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
+
+import pytest
 
 from scripts import release_stats_rollup as rollup
 
@@ -222,3 +232,1073 @@ def test_render_markdown_includes_summary_row() -> None:
     assert "`v0.1.0`" in markdown
     assert "Combined" in markdown
     assert "**TOTAL**" in markdown
+
+    stream = io.BytesIO()
+    rollup.write_markdown(payload, stream)
+    assert stream.getvalue() == markdown.encode("utf-8")
+
+
+def _git(repo: Path, *args: str, env: dict[str, str] | None = None) -> str:
+    return subprocess.run(
+        ["git", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+        text=True,
+        env=env,
+    ).stdout
+
+
+def _init_tagged_repo(repo: Path) -> None:
+    env = {
+        **os.environ,
+        "GIT_AUTHOR_NAME": "Test",
+        "GIT_AUTHOR_EMAIL": "test@example.com",
+        "GIT_COMMITTER_NAME": "Test",
+        "GIT_COMMITTER_EMAIL": "test@example.com",
+    }
+    _git(repo, "init", "-q", env=env)
+    (repo / "a.py").write_text("a = 1\n", encoding="utf-8")
+    _git(repo, "add", "a.py", env=env)
+    _git(
+        repo,
+        "commit",
+        "-q",
+        "-m",
+        "first",
+        env={**env, "GIT_AUTHOR_DATE": "2026-01-01T00:00:00Z", "GIT_COMMITTER_DATE": "2026-01-01T00:00:00Z"},
+    )
+    _git(repo, "tag", "v0.1.0", env=env)
+    (repo / "a.py").write_text("a = 1\nb = 2\n", encoding="utf-8")
+    (repo / "b.py").write_text("c = 3\n", encoding="utf-8")
+    _git(repo, "add", "a.py", "b.py", env=env)
+    _git(
+        repo,
+        "commit",
+        "-q",
+        "-m",
+        "second",
+        env={**env, "GIT_AUTHOR_DATE": "2026-01-02T00:00:00Z", "GIT_COMMITTER_DATE": "2026-01-02T00:00:00Z"},
+    )
+    _git(
+        repo,
+        "tag",
+        "-a",
+        "v0.2.0",
+        "-m",
+        "release",
+        env={**env, "GIT_COMMITTER_DATE": "2026-01-03T00:00:00Z"},
+    )
+
+
+def test_list_tags_resolves_lightweight_and_annotated_tags(tmp_path: Path) -> None:
+    _init_tagged_repo(tmp_path)
+    tags = rollup.list_tags(tmp_path)
+
+    assert [tag.name for tag in tags] == ["v0.1.0", "v0.2.0"]
+    head = _git(tmp_path, "rev-parse", "HEAD").strip()
+    assert tags[1].commit == head
+    assert head.startswith(tags[1].commit_short)
+    assert tags[0].commit_time_utc == _dt("2026-01-01T00:00:00+00:00")
+    assert tags[0].tag_time_utc == tags[0].commit_time_utc
+    assert tags[1].commit_time_utc == _dt("2026-01-02T00:00:00+00:00")
+    assert tags[1].tag_time_utc == _dt("2026-01-03T00:00:00+00:00")
+
+
+def test_numstat_path_resolves_rename_notation() -> None:
+    assert rollup.numstat_path("scripts/db.py") == "scripts/db.py"
+    assert rollup.numstat_path("old.py => new.py") == "new.py"
+    assert rollup.numstat_path("scripts/{old => new}/db.py") == "scripts/new/db.py"
+    assert rollup.numstat_path("scripts/{sub => }/db.py") == "scripts/db.py"
+    assert rollup.numstat_path("{ => sub}/db.py") == "sub/db.py"
+
+
+def test_collect_git_range_stats_single_log_pass(tmp_path: Path) -> None:
+    _init_tagged_repo(tmp_path)
+
+    first = rollup.collect_git_range_stats(tmp_path, None, "v0.1.0")
+    assert first["range"] == "v0.1.0"
+    assert first["commits_in_range"] == 1
+    assert first["commits_to_tag"] == 1
+    assert first["unique_files_touched"] == 1
+    assert (first["insertions"], first["deletions"]) == (1, 0)
+
+    second = rollup.collect_git_range_stats(tmp_path, "v0.1.0", "v0.2.0")
+    assert second["range"] == "v0.1.0..v0.2.0"
+    assert second["commits_in_range"] == 1
+    assert second["commits_to_tag"] == 2
+    assert second["unique_files_touched"] == 2
+    assert (second["insertions"], second["deletions"], second["net_lines"]) == (2, 0, 2)
+    assert second["commits_by_day"] == {"2026-01-02": 1}
+    assert second["first_commit_utc"] == "2026-01-02T00:00:00+00:00"
+
+
+def test_parse_numstat_accepts_line_iterables() -> None:
+    assert rollup.parse_numstat(iter(["1\t2\ta.py", "-\t-\tbin.dat", "3\t0\tb.py"])) == (4, 2)
+
+
+def test_run_command_stream_yields_lines_and_raises_on_failure(tmp_path: Path) -> None:
+    _init_tagged_repo(tmp_path)
+    lines = list(rollup.run_command_stream(["git", "log", "--format=%s"], cwd=tmp_path))
+    assert lines == ["second", "first"]
+    with pytest.raises(subprocess.CalledProcessError):
+        list(rollup.run_command_stream(["git", "log", "no-such-ref"], cwd=tmp_path))
+
+
+def test_run_command_stream_keeps_stderr_flowing_while_reading_stdout() -> None:
+    # Far more stderr than a pipe buffer holds, written before any stdout.
+    script = "import sys; sys.stderr.write('w' * 1_000_000); print('out'); sys.exit(3)"
+    lines = []
+    with pytest.raises(subprocess.CalledProcessError) as excinfo:
+        lines.extend(rollup.run_command_stream([sys.executable, "-c", script]))
+    assert lines == ["out"]
+    assert excinfo.value.returncode == 3
+    assert excinfo.value.stderr == "w" * 1_000_000
+
+
+def test_git_batch_resolves_and_reads_objects(tmp_path: Path) -> None:
+    _init_tagged_repo(tmp_path)
+    head = _git(tmp_path, "rev-parse", "HEAD").strip()
+    with rollup.GitBatch(tmp_path) as batch:
+        info = batch.info("v0.2.0^{commit}")
+        assert info is not None
+        assert info[:2] == (head, "commit")
+        assert batch.info("no-such-ref") is None
+
+        blob = batch.read("v0.1.0:a.py")
+        assert blob is not None
+        assert blob[1:] == ("blob", b"a = 1\n")
+        commit = batch.read("v0.1.0")
+        assert commit is not None
+        assert rollup.parse_commit_committer_time(commit[2]) == _dt("2026-01-01T00:00:00+00:00")
+        assert batch.read("no-such-ref") is None
+
+        refs = ["v0.1.0:a.py", "no-such-ref", "v0.1.0", "v0.1.0:a.py"]
+        assert batch.read_many(refs) == [batch.read(ref) for ref in refs]
+        # The pipe stays framed for single lookups after a pipelined batch.
+        assert batch.read("v0.1.0:a.py") == blob
+
+
+def test_git_batch_read_many_fails_loudly(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _init_tagged_repo(tmp_path)
+    with rollup.GitBatch(tmp_path) as batch:
+        # git dying mid-batch must raise rather than turn the remaining objects into None.
+        batch._proc("--batch").kill()
+        with pytest.raises(RuntimeError, match="cat-file"):
+            batch.read_many(["v0.1.0:a.py", "v0.1.0:a.py"])
+        assert batch.read("v0.1.0:a.py") is not None
+
+        # A reader error with both pipes full must not leave the writer thread blocked forever.
+        calls = iter(range(2))
+        read_object = rollup.GitBatch._read_object
+
+        def flaky(proc: subprocess.Popen[bytes]) -> Any:
+            if next(calls, None) is None:
+                raise ValueError("boom")
+            return read_object(proc)
+
+        monkeypatch.setattr(rollup.GitBatch, "_read_object", staticmethod(flaky))
+        with pytest.raises(ValueError, match="boom"):
+            batch.read_many(["v0.1.0:a.py"] * 50_000)
+        monkeypatch.undo()
+        assert batch.read("v0.1.0:a.py") is not None
+
+
+def test_list_tags_peels_nested_annotated_tags(tmp_path: Path) -> None:
+    _init_tagged_repo(tmp_path)
+    _git(
+        tmp_path,
+        "tag",
+        "-a",
+        "v0.2.0-nested",
+        "-m",
+        "tag of a tag",
+        "v0.2.0",
+        env={
+            **os.environ,
+            "GIT_COMMITTER_NAME": "Test",
+            "GIT_COMMITTER_EMAIL": "test@example.com",
+            "GIT_COMMITTER_DATE": "2026-01-04T00:00:00Z",
+        },
+    )
+    tags = {tag.name: tag for tag in rollup.list_tags(tmp_path)}
+    nested = tags["v0.2.0-nested"]
+    assert nested.commit == tags["v0.2.0"].commit
+    assert nested.commit_short == tags["v0.2.0"].commit_short
+    assert nested.commit_time_utc == _dt("2026-01-02T00:00:00+00:00")
+    assert nested.tag_time_utc == _dt("2026-01-04T00:00:00+00:00")
+
+
+def _write_codex_rollout(path: Path, cwd: str) -> None:
+    rows = [
+        {"timestamp": "2026-01-01T00:00:00Z", "type": "session_meta", "payload": {"id": "sess-1", "cwd": cwd}},
+        {"timestamp": "2026-01-01T00:01:00Z", "type": "turn_context", "payload": {"model": "gpt-5"}},
+        {
+            "timestamp": "2026-01-01T00:02:00Z",
+            "type": "response_item",
+            "payload": {"type": "function_call"},
+        },
+        {
+            "timestamp": "2026-01-01T00:03:00Z",
+            "type": "event_msg",
+            "payload": {
+                "type": "token_count",
+                "info": {
+                    "total_token_usage": {
+                        "input_tokens": 100,
+                        "cached_input_tokens": 40,
+                        "output_tokens": 10,
+                        "total_tokens": 110,
+                    }
+                },
+            },
+        },
+    ]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("wb") as f:
+        f.write(b"\n")
+        f.write(b"{not json\n")
+        f.write(b"\xff\xfe\n")
+        f.write(b"[1, 2]\n")
+        for row in rows:
+            f.write(json.dumps(row).encode("utf-8") + b"\n")
+
+
+def test_parse_codex_session_skips_blank_and_malformed_lines(tmp_path: Path) -> None:
+    rollout = tmp_path / "rollout-1.jsonl"
+    _write_codex_rollout(rollout, "/repo")
+    session = rollup.parse_codex_session(rollout)
+    assert session is not None
+    assert session.session_id == "sess-1"
+    assert session.cwd == "/repo"
+    assert session.model == "gpt-5"
+    assert len(session.snapshots) == 1
+    assert session.snapshots[0].total_tokens == 110
+    assert len(session.event_timestamps) == 4
+    assert session.coding_timestamps == [_dt("2026-01-01T00:02:00+00:00")]
+
+
+def test_iter_jsonl_objects_maps_files_and_handles_edges(tmp_path: Path) -> None:
+    path = tmp_path / "events.jsonl"
+    path.write_bytes(b'{"a": 1}\n\n  \nnot-json\n[1]\n{"b": 2}')
+    assert list(rollup.iter_jsonl_objects(path)) == [{"a": 1}, {"b": 2}]
+
+    empty = tmp_path / "empty.jsonl"
+    empty.write_bytes(b"")
+    assert list(rollup.iter_jsonl_objects(empty)) == []
+
+    with pytest.raises(OSError):
+        list(rollup.iter_jsonl_objects(tmp_path / "missing.jsonl"))
+
+
+def test_load_claude_events_reads_repo_scoped_files(tmp_path: Path) -> None:
+    repo_root = tmp_path / "repo"
+    repo_root.mkdir()
+    projects_root = tmp_path / "projects"
+    encoded = "-" + str(repo_root.resolve()).strip("/").replace("/", "-")
+    session_file = projects_root / encoded / "session.jsonl"
+    session_file.parent.mkdir(parents=True)
+    row = {
+        "timestamp": "2026-01-02T00:00:00Z",
+        "message": {
+            "model": "claude-opus",
+            "usage": {"input_tokens": 10, "output_tokens": 3},
+            "content": [{"type": "tool_use"}],
+        },
+    }
+    session_file.write_bytes(b"\n{broken\n" + json.dumps(row).encode("utf-8") + b"\n")
+
+    events = rollup.load_claude_events(projects_root, repo_root)
+    assert len(events) == 1
+    assert events[0].path == session_file
+    assert events[0].total_tokens == 13
+    assert events[0].is_tool_use is True
+
+
+def test_load_codex_sessions_pool_matches_inline(tmp_path: Path) -> None:
+    repo_root = tmp_path / "repo"
+    repo_root.mkdir()
+    codex_root = tmp_path / "codex"
+    for idx in range(rollup.PARALLEL_PARSE_MIN_FILES + 2):
+        cwd = str(repo_root) if idx % 2 == 0 else str(tmp_path / "elsewhere")
+        _write_codex_rollout(codex_root / "2026" / f"rollout-{idx:02d}.jsonl", cwd)
+
+    inline = rollup.load_codex_sessions(codex_root, repo_root, max_workers=1)
+    pooled = rollup.load_codex_sessions(codex_root, repo_root, max_workers=2)
+    assert len(inline) == (rollup.PARALLEL_PARSE_MIN_FILES + 2 + 1) // 2
+    assert pooled == inline
+
+
+def test_session_parse_cache_reuses_unchanged_files(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    repo_root = tmp_path / "repo"
+    repo_root.mkdir()
+    codex_root = tmp_path / "codex"
+    rollout = codex_root / "rollout-1.jsonl"
+    _write_codex_rollout(rollout, str(repo_root))
+    cache_path = tmp_path / "cache" / "sessions.sqlite3"
+
+    with rollup.SessionParseCache(cache_path) as cache:
+        first = rollup.load_codex_sessions(codex_root, repo_root, max_workers=1, cache=cache)
+    assert len(first) == 1
+
+    def _fail(path: Path) -> None:
+        raise AssertionError(f"unexpected reparse of {path}")
+
+    monkeypatch.setattr(rollup, "parse_codex_session", _fail)
+    with rollup.SessionParseCache(cache_path) as cache:
+        second = rollup.load_codex_sessions(codex_root, repo_root, max_workers=1, cache=cache)
+    assert second == first
+
+    with rollout.open("ab") as f:
+        f.write(b"\n")
+    with rollup.SessionParseCache(cache_path) as cache, pytest.raises(AssertionError, match="unexpected reparse"):
+        rollup.load_codex_sessions(codex_root, repo_root, max_workers=1, cache=cache)
+
+
+@pytest.mark.parametrize("broken", ["parent_is_file", "not_a_database"])
+def test_session_parse_cache_unusable_falls_back_to_uncached(tmp_path: Path, broken: str) -> None:
+    repo_root = tmp_path / "repo"
+    repo_root.mkdir()
+    codex_root = tmp_path / "codex"
+    _write_codex_rollout(codex_root / "rollout-1.jsonl", str(repo_root))
+    if broken == "parent_is_file":
+        (tmp_path / "cache").write_text("not a directory")
+        cache_path = tmp_path / "cache" / "sessions.sqlite3"
+    else:
+        cache_path = tmp_path / "sessions.sqlite3"
+        cache_path.write_bytes(b"garbage, not an sqlite database" * 10)
+
+    expected = rollup.load_codex_sessions(codex_root, repo_root, max_workers=1)
+    with rollup.SessionParseCache(cache_path) as cache:
+        assert rollup.load_codex_sessions(codex_root, repo_root, max_workers=1, cache=cache) == expected
+
+
+def _usage_fixture() -> tuple[list[rollup.CodexSession], list[rollup.ClaudeUsageEvent]]:
+    sessions = [
+        rollup.CodexSession(
+            path=Path("/tmp/rollout-1.jsonl"),
+            session_id="sess-1",
+            cwd="/repo",
+            model="gpt-5",
+            snapshots=[
+                rollup.TokenSnapshot(_dt("2026-01-01T00:00:00+00:00"), 100, 20, 50, 150),
+                rollup.TokenSnapshot(_dt("2026-01-01T00:10:00+00:00"), 140, 30, 80, 220),
+                rollup.TokenSnapshot(_dt("2026-01-02T00:10:00+00:00"), 200, 60, 100, 300),
+            ],
+            event_timestamps=[
+                _dt("2026-01-01T00:00:00+00:00"),
+                _dt("2026-01-01T00:02:00+00:00"),
+                _dt("2026-01-01T00:10:00+00:00"),
+                _dt("2026-01-02T00:10:00+00:00"),
+            ],
+            coding_timestamps=[_dt("2026-01-01T00:02:00+00:00"), _dt("2026-01-02T00:10:00+00:00")],
+        ),
+        rollup.CodexSession(
+            path=Path("/tmp/rollout-2.jsonl"),
+            session_id=None,
+            cwd="/repo",
+            model=None,
+            snapshots=[rollup.TokenSnapshot(_dt("2026-01-01T12:00:00+00:00"), 10, 0, 5, 15)],
+            event_timestamps=[_dt("2026-01-01T12:00:00+00:00")],
+            coding_timestamps=[],
+        ),
+    ]
+
+    def _event(ts: str, model: str | None, tokens: tuple[int, int, int, int], tool: bool, path: str):
+        base_in, cache_write, cache_read, out = tokens
+        tokens_in = base_in + cache_write + cache_read
+        return rollup.ClaudeUsageEvent(
+            path=Path(path),
+            timestamp_utc=_dt(ts),
+            model=model,
+            input_tokens=base_in,
+            cache_creation_input_tokens=cache_write,
+            cache_read_input_tokens=cache_read,
+            tokens_in=tokens_in,
+            tokens_out=out,
+            total_tokens=tokens_in + out,
+            is_tool_use=tool,
+        )
+
+    events = [
+        _event("2026-01-01T00:05:00+00:00", "claude-opus", (10, 5, 7, 3), True, "/tmp/c1.jsonl"),
+        _event("2026-01-01T00:20:00+00:00", None, (1, 0, 0, 1), False, "/tmp/c1.jsonl"),
+        _event("2026-01-01T12:01:00+00:00", "claude-opus", (4, 0, 2, 8), True, "/tmp/c2.jsonl"),
+        _event("2026-01-02T00:00:00+00:00", "claude-sonnet", (6, 1, 1, 2), False, "/tmp/c2.jsonl"),
+    ]
+    return sessions, events
+
+
+@pytest.mark.parametrize(
+    ("start", "end", "codex", "claude", "timing"),
+    [
+        (
+            None,
+            "2026-01-01T00:15:00+00:00",
+            (140, 30, 80, 220, 1, {"gpt-5": 220}),
+            (22, 10, 3, 25, 1, {"claude-opus": 25}),
+            {"codex": (3, 1, 180, 60, 900), "claude": (1, 1, 60, 60, 600), "combined": (4, 2, 600, 180, 900)},
+        ),
+        (
+            "2026-01-01T00:15:00+00:00",
+            "2026-01-02T00:05:00+00:00",
+            (10, 0, 5, 15, 1, {"unknown": 15}),
+            (15, 11, 11, 26, 2, {"claude-opus": 14, "claude-sonnet": 10, "unknown": 2}),
+            {
+                "codex": (1, 0, 60, 0, 85800),
+                "claude": (3, 1, 180, 60, 85800),
+                "combined": (4, 1, 180, 60, 85800),
+            },
+        ),
+        (
+            "2026-01-02T00:05:00+00:00",
+            "2026-01-03T00:00:00+00:00",
+            (60, 30, 20, 80, 1, {"gpt-5": 80}),
+            (0, 0, 0, 0, 0, {}),
+            {"codex": (1, 1, 60, 60, 86100), "claude": (0, 0, 0, 0, 86100), "combined": (1, 1, 60, 60, 86100)},
+        ),
+    ],
+)
+def test_aggregate_usage_for_window_slices_sessions_and_events(
+    start: str | None,
+    end: str,
+    codex: tuple[Any, ...],
+    claude: tuple[Any, ...],
+    timing: dict[str, tuple[int, ...]],
+) -> None:
+    sessions, events = _usage_fixture()
+    usage = rollup.aggregate_usage_for_window(
+        codex_sessions=sessions,
+        claude_events=events,
+        start_exclusive=_dt(start) if start else None,
+        end_inclusive=_dt(end),
+    )
+    codex_row = usage["codex"]
+    assert (
+        codex_row["tokens_in"],
+        codex_row["tokens_in_cached"],
+        codex_row["tokens_out"],
+        codex_row["total_tokens"],
+        codex_row["sessions_with_usage"],
+        codex_row["model_tokens"],
+    ) == codex
+    claude_row = usage["claude"]
+    assert (
+        claude_row["tokens_in"],
+        claude_row["tokens_in_base"],
+        claude_row["tokens_out"],
+        claude_row["total_tokens"],
+        claude_row["files_with_usage"],
+        claude_row["model_tokens"],
+    ) == claude
+    for key, expected in timing.items():
+        row = usage["timing"][key]
+        assert (
+            row["events"],
+            row["coding_events"],
+            row["active_seconds"],
+            row["coding_seconds"],
+            row["wall_seconds"],
+        ) == expected
+
+
+def test_codex_session_index_matches_span_overlap_scan() -> None:
+    sessions = [
+        rollup.CodexSession(
+            path=Path(f"/tmp/rollout-{start}-{length}.jsonl"),
+            session_id=None,
+            cwd="/repo",
+            model=None,
+            snapshots=[],
+            event_timestamps=[
+                datetime.fromtimestamp(start, UTC),
+                datetime.fromtimestamp(start + length, UTC),
+            ],
+            coding_timestamps=[],
+        )
+        for start, length in ((0, 5), (3, 40), (10, 0), (12, 3), (30, 2), (31, 1))
+    ]
+    empty = rollup.CodexSession(Path("/tmp/empty.jsonl"), None, "/repo", None, [], [], [])
+    index = rollup.CodexSessionIndex.from_sessions([*reversed(sessions), empty])
+    assert len(index) == len(sessions) + 1
+
+    def micros(seconds: int) -> int:
+        return seconds * rollup.MICROS_PER_SECOND
+
+    for start in (None, *range(-1, 45, 2)):
+        for end in range(0, 50, 3):
+            start_us = micros(start) if start is not None else None
+            expected = {
+                session.path
+                for session in sessions
+                if session.span_micros[0] <= micros(end) and (start_us is None or session.span_micros[1] > start_us)
+            }
+            got = index.overlapping(start_exclusive=start_us, end_inclusive=micros(end))
+            assert {session.path for session in got} == expected
+
+
+def test_claude_event_columns_match_event_list_aggregation() -> None:
+    sessions, events = _usage_fixture()
+    columns = rollup.ClaudeEventColumns.from_events(list(reversed(events)))
+    assert len(columns) == len(events)
+    assert columns.timestamps == sorted(columns.timestamps)
+    assert columns.window_bounds(
+        start_exclusive=_dt("2026-01-01T00:05:00+00:00"),
+        end_inclusive=_dt("2026-01-01T12:01:00+00:00"),
+    ) == (1, 3)
+
+    kwargs = {
+        "codex_sessions": sessions,
+        "start_exclusive": _dt("2026-01-01T00:00:00+00:00"),
+        "end_inclusive": _dt("2026-01-02T00:00:00+00:00"),
+    }
+    from_columns = rollup.aggregate_usage_for_window(claude_events=columns, **kwargs)
+    from_events = rollup.aggregate_usage_for_window(claude_events=events, **kwargs)
+    assert from_columns == from_events
+    for lo, hi in [(0, 0), (0, len(columns)), (1, 3)]:
+        assert columns.window_sum("total_tokens", lo, hi) == sum(columns.total_tokens[lo:hi])
+    assert all(
+        session.span_micros is not None and session.span_micros[0] <= session.span_micros[1] for session in sessions
+    )
+
+
+def test_estimate_active_seconds_truncates_fractional_gaps_like_timedelta() -> None:
+    points = [
+        _dt("2026-01-01T00:00:00.900000+00:00"),
+        _dt("2026-01-01T00:05:01.100000+00:00"),
+        _dt("2026-01-01T00:20:00+00:00"),
+        _dt("2026-01-01T00:22:30.500000+00:00"),
+    ]
+    # gap 1 is 300.2s -> truncates to 300 (<= threshold); gap 2 splits the burst.
+    active = rollup.estimate_active_seconds_from_points(
+        points,
+        idle_threshold_seconds=300,
+        min_burst_seconds=60,
+    )
+    assert active == 300 + 150
+    micros = [rollup.epoch_micros(ts) for ts in points]
+    assert rollup.estimate_active_seconds_from_epoch_micros(
+        micros,
+        idle_threshold_seconds=300,
+        min_burst_seconds=60,
+    ) == active
+    assert rollup.estimate_active_seconds_from_epoch_micros([], idle_threshold_seconds=300, min_burst_seconds=60) == 0
+
+
+def test_merge_sorted_micros_handles_empty_disjoint_and_interleaved_runs() -> None:
+    assert rollup.merge_sorted_micros([], [1, 2]) == [1, 2]
+    assert rollup.merge_sorted_micros([1, 2], []) == [1, 2]
+    assert rollup.merge_sorted_micros([1, 2], [2, 3]) == [1, 2, 2, 3]
+    assert rollup.merge_sorted_micros([5, 6], [1, 2]) == [1, 2, 5, 6]
+    assert rollup.merge_sorted_micros([1, 4, 9], [2, 3, 10]) == [1, 2, 3, 4, 9, 10]
+
+
+def test_parse_timestamp_utc_normalizes_offsets() -> None:
+    assert rollup.parse_timestamp_utc("2026-01-01T00:00:00.5Z") == _dt("2026-01-01T00:00:00.500000+00:00")
+    shifted = rollup.parse_timestamp_utc("2026-01-01T01:00:00+01:00")
+    assert shifted.tzinfo is UTC
+    assert shifted == _dt("2026-01-01T00:00:00+00:00")
+    assert rollup.epoch_micros(shifted) == 1_767_225_600_000_000
+
+
+def test_scan_jsonl_files_matches_rglob(tmp_path: Path) -> None:
+    for rel in [
+        "2026/01/rollout-a.jsonl",
+        "2026/02/rollout-b.jsonl",
+        "2026/02/other.jsonl",
+        "rollout-top.jsonl",
+        "2026/notes.txt",
+        "2026/rollout-c.jsonl/inner.jsonl",
+    ]:
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("", encoding="utf-8")
+
+    assert rollup.scan_jsonl_files(tmp_path, prefix="rollout-") == sorted(
+        path for path in tmp_path.rglob("rollout-*.jsonl") if path.is_file()
+    )
+    assert rollup.scan_jsonl_files(tmp_path) == sorted(path for path in tmp_path.rglob("*.jsonl") if path.is_file())
+    assert rollup.scan_jsonl_files(tmp_path / "missing") == []
+
+
+def test_parse_numstat_tolerates_padding_and_two_column_rows() -> None:
+    assert rollup.parse_numstat(" 4 \t 1 \tpadded.py\n2\t3\n7\t\tmissing.py\nx1\t2\ty.py") == (6, 4)
+
+
+def test_parse_scc_cocomo_extracts_estimates() -> None:
+    text = "\n".join(
+        [
+            "Estimated Cost to Develop (organic) $1,234,567",
+            "Estimated Schedule Effort (organic) 12.5 months",
+            "Estimated People Required (organic) 3.4",
+        ]
+    )
+    assert rollup.parse_scc_cocomo(text) == {
+        "estimated_cost_usd": 1234567,
+        "estimated_schedule_months": 12.5,
+        "estimated_people": 3.4,
+    }
+    assert rollup.parse_scc_cocomo("no cocomo here") == {
+        "estimated_cost_usd": None,
+        "estimated_schedule_months": None,
+        "estimated_people": None,
+    }
+
+
+def test_tag_checkout_reuses_one_worktree_across_refs(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _init_tagged_repo(repo)
+    with rollup.TagCheckout(repo) as checkout:
+        first = checkout.checkout("v0.1.0")
+        assert sorted(path.name for path in first.iterdir() if path.name != ".git") == ["a.py"]
+        second = checkout.checkout("v0.2.0")
+        assert second == first
+        assert sorted(path.name for path in second.iterdir() if path.name != ".git") == ["a.py", "b.py"]
+        assert (second / "a.py").read_text(encoding="utf-8") == "a = 1\nb = 2\n"
+        with pytest.raises(RuntimeError, match="git checkout failed"):
+            checkout.checkout("no-such-ref")
+    assert not first.exists()
+    assert _git(repo, "worktree", "list").count("\n") == 1
+
+
+def test_tag_checkout_same_ref_is_materialized_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _init_tagged_repo(repo)
+    commands: list[list[str]] = []
+    real_run_command = rollup.run_command
+
+    def recording_run_command(cmd: list[str], **kwargs: Any) -> str:
+        commands.append(cmd)
+        return real_run_command(cmd, **kwargs)
+
+    monkeypatch.setattr(rollup, "run_command", recording_run_command)
+    with rollup.TagCheckout(repo) as checkout:
+        assert checkout.checkout("v0.2.0") == checkout.checkout("v0.2.0")
+        checkout.checkout("v0.1.0")
+        checkout.checkout("v0.2.0")
+    assert sum("checkout" in cmd for cmd in commands) == 3
+
+
+def test_tag_checkout_skips_hooks_and_lfs_smudge(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _init_tagged_repo(repo)
+    marker = tmp_path / "hook-ran"
+    hook = repo / ".git" / "hooks" / "post-checkout"
+    hook.parent.mkdir(parents=True, exist_ok=True)
+    hook.write_text(f"#!/bin/sh\ntouch '{marker}'\n", encoding="utf-8")
+    hook.chmod(0o755)
+    seen_env: list[str | None] = []
+    real_run_command = rollup.run_command
+
+    def recording_run_command(cmd: list[str], **kwargs: Any) -> str:
+        seen_env.append((kwargs.get("env") or {}).get("GIT_LFS_SKIP_SMUDGE"))
+        return real_run_command(cmd, **kwargs)
+
+    monkeypatch.setattr(rollup, "run_command", recording_run_command)
+    with rollup.TagCheckout(repo) as checkout:
+        checkout.checkout("v0.1.0")
+        checkout.checkout("v0.2.0")
+    assert not marker.exists()
+    assert seen_env == ["1", "1", "1"]
+
+
+def test_collect_git_range_stats_net_diff_churn_uses_endpoint_diff(tmp_path: Path) -> None:
+    _init_tagged_repo(tmp_path)
+    env = {
+        **os.environ,
+        "GIT_AUTHOR_NAME": "Test",
+        "GIT_AUTHOR_EMAIL": "test@example.com",
+        "GIT_COMMITTER_NAME": "Test",
+        "GIT_COMMITTER_EMAIL": "test@example.com",
+    }
+    # Add and then revert a file inside the v0.2.0..v0.3.0 range.
+    (tmp_path / "tmp.py").write_text("x = 1\n", encoding="utf-8")
+    _git(tmp_path, "add", "tmp.py", env=env)
+    _git(tmp_path, "commit", "-q", "-m", "add tmp", env=env)
+    _git(tmp_path, "rm", "-q", "tmp.py", env=env)
+    (tmp_path / "b.py").write_text("c = 4\n", encoding="utf-8")
+    _git(tmp_path, "add", "b.py", env=env)
+    _git(tmp_path, "commit", "-q", "-m", "drop tmp", env=env)
+    _git(tmp_path, "tag", "v0.3.0", env=env)
+
+    per_commit = rollup.collect_git_range_stats(tmp_path, "v0.2.0", "v0.3.0")
+    net = rollup.collect_git_range_stats(tmp_path, "v0.2.0", "v0.3.0", net_diff_churn=True)
+    assert per_commit["churn_method"] == "commit_log"
+    assert (per_commit["insertions"], per_commit["deletions"], per_commit["unique_files_touched"]) == (2, 2, 2)
+    assert net["churn_method"] == "net_diff"
+    assert (net["insertions"], net["deletions"], net["unique_files_touched"]) == (1, 1, 1)
+    assert net["commits_in_range"] == per_commit["commits_in_range"] == 2
+
+    first = rollup.collect_git_range_stats(tmp_path, None, "v0.1.0", net_diff_churn=True)
+    assert first["churn_method"] == "commit_log"
+
+
+def test_price_table_from_args_applies_prices_overrides() -> None:
+    flags = {f"price_{field.name}": 1.0 for field in dataclasses.fields(rollup.PriceTable)}
+    overrides = rollup.parse_price_overrides("gpt5-input-per-1m=2.5, opus4_output_per_1m=60,")
+    prices = rollup.PriceTable.from_args(argparse.Namespace(**flags, prices=overrides))
+    assert prices.gpt5_input_per_1m == 2.5
+    assert prices.opus4_output_per_1m == 60.0
+    assert prices.gpt5_output_per_1m == 1.0
+    defaults = rollup.PriceTable.from_args(argparse.Namespace(**flags, prices=None))
+    assert defaults == rollup.PriceTable(*[1.0] * len(flags))
+    assert prices.cost_assumptions()["codex_gpt5x"]["input_uncached"] == 2.5
+    for bad in ("gpt5-input-per-1m", "unknown=1", "gpt5-input-per-1m=cheap"):
+        with pytest.raises(argparse.ArgumentTypeError):
+            rollup.parse_price_overrides(bad)
+
+
+@pytest.mark.parametrize("sort_keys", [False, True])
+def test_json_dumps_matches_stdlib_layout(sort_keys: bool) -> None:
+    payload = {"b": [1, {"z": None, "a": "é"}], "a": 2.5}
+    expected = json.dumps(payload, indent=2, sort_keys=sort_keys, ensure_ascii=False) + "\n"
+    assert rollup.json_dumps(payload, sort_keys=sort_keys) == expected.encode("utf-8")
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_write_json_streams_json_dumps_bytes(use_orjson: bool, monkeypatch: pytest.MonkeyPatch) -> None:
+    if use_orjson and rollup.orjson is None:
+        pytest.skip("orjson not installed")
+    if not use_orjson:
+        monkeypatch.setattr(rollup, "orjson", None)
+    payload = {"b": [1, {"z": None, "a": "é"}], "a": 2.5}
+    stream = io.BytesIO()
+    rollup.write_json(payload, stream)
+    assert not stream.closed
+    assert stream.getvalue() == rollup.json_dumps(payload)
+    assert list(json.loads(stream.getvalue())) == ["b", "a"]
+    sorted_stream = io.BytesIO()
+    rollup.write_json(payload, sorted_stream, sort_keys=True)
+    assert sorted_stream.getvalue() == rollup.json_dumps(payload, sort_keys=True)
+
+
+def test_snapshot_cache_skips_recomputation_for_seen_trees(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _init_tagged_repo(repo)
+    (repo / "tests").mkdir()
+    cache = rollup.SnapshotCache(tmp_path / "cache")
+    first = rollup.collect_test_composition_snapshot(repo, "v0.2.0", cache=cache)
+    assert len(list((tmp_path / "cache").glob("*.tests.v*.json"))) == 1
+
+    def _fail(*args: Any, **kwargs: Any) -> dict[str, Any]:
+        raise AssertionError("cached tree should not be re-read")
+
+    monkeypatch.setattr(rollup, "collect_test_composition_from_git", _fail)
+    assert rollup.collect_test_composition_snapshot(repo, "v0.2.0", cache=cache) == first
+    with pytest.raises(AssertionError):
+        rollup.collect_test_composition_snapshot(repo, "v0.1.0", cache=cache)
+
+
+def test_collect_lightweight_loc_snapshot_streams_archive(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _init_tagged_repo(repo)
+    snapshot = rollup.collect_lightweight_loc_snapshot(repo, "v0.2.0")
+    assert snapshot["method"] == "lightweight"
+    assert snapshot["python"] == {"files": 2, "lines": 3, "code": 3, "comments": 0, "blanks": 0, "complexity": 0}
+    assert snapshot["totals"] == snapshot["python"]
+    assert snapshot["cocomo"]["estimated_cost_usd"] is None
+    assert rollup.count_loc_bytes(b"# c\n\nx = 1\n  # d\n", b"#") == (4, 1, 2, 1)
+    with pytest.raises(RuntimeError, match="git archive failed"):
+        rollup.collect_lightweight_loc_snapshot(repo, "no-such-ref")
+
+
+def test_map_tag_snapshots_pool_matches_inline(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _init_tagged_repo(repo)
+    refs = ["v0.1.0", "v0.2.0"]
+    inline = rollup.map_tag_snapshots(rollup.collect_lightweight_loc_snapshot, repo, refs, max_workers=1)
+    pooled = rollup.map_tag_snapshots(rollup.collect_lightweight_loc_snapshot, repo, refs, max_workers=2)
+    assert pooled == inline
+    assert [row["python"]["files"] for row in inline] == [1, 2]
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "def test_a():\n    pass\n\nasync def test_b():\n    pass\n",
+        'class TestA:\n    """Doc."""\n\n    def test_a(self):\n        text = """\ndef test_fake():\n"""\n',
+        "class TestA:\n    def test_a(self):\n        pass\n\n    class TestInner:\n        def test_b(self):\n"
+        "            pass\n\ndef helper():\n    def test_nested():\n        pass\n",
+        "class Helper:\n    def test_a(self):\n        pass\n\nclass TestB:\n  def test_b(self):\n    pass\n",
+        "class TestA(\n    Base,\n):\n    def test_a(self):\n        pass\n",
+        'class TestA:\n    def test_a(self):\n        data = (\n"""x"""\n        )\n\n'
+        "    def test_b(self):\n        pass\n",
+        "if True:\n    def test_guarded():\n        pass\n",
+        '# use """ carefully\ndef test_a(): pass\n# and """ here\ndef test_b(): pass\n',
+        'SEP = "\'\'\'"\ndef test_a(): pass\nOTHER = "\'\'\'"\ndef test_b(): pass\n',
+        'x = "a\\\ndef test_phantom(): pass"\ndef test_a(): pass\n',
+        "class TestA:\n    data = [\n1, 2]\n    def test_a(self):\n        pass\n",
+        "def test_a(:\n    pass\n",
+        "def test_a():\n    x = 'unterminated\n",
+        "class TestA:  # it's fine\n    def test_a(self):\n        pass\n",
+        "class TestA:\n    x = 1 + \\\n2\n    def test_a(self):\n        pass\n",
+    ],
+)
+def test_scan_test_count_agrees_with_ast(source: str) -> None:
+    scanned = rollup.scan_test_count(source)
+    assert scanned is None or scanned == rollup.count_tests_with_ast(source)
+    assert rollup.count_tests_in_source(source) == rollup.count_tests_with_ast(source)
+
+
+def test_scan_test_count_matches_ast_for_repo_tests() -> None:
+    for path in sorted(Path(__file__).parent.glob("test_*.py")):
+        source = path.read_text(encoding="utf-8")
+        assert rollup.scan_test_count(source) in (None, rollup.count_tests_with_ast(source)), path.name
+
+
+def test_collect_documentation_churn_single_log_pass(tmp_path: Path) -> None:
+    _init_tagged_repo(tmp_path)
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "guide.md").write_text("one\ntwo\n", encoding="utf-8")
+    (tmp_path / "docs" / "résumé notes.md").write_text("x\n", encoding="utf-8")
+    (tmp_path / "docs" / "logo.bin").write_bytes(b"\x00\x01\x02")
+    (tmp_path / "README.md").write_text("readme\n", encoding="utf-8")
+    (tmp_path / "c.py").write_text("x = 1\n", encoding="utf-8")
+    _git(tmp_path, "add", "docs", "README.md", "c.py")
+    _git(tmp_path, "-c", "user.name=t", "-c", "user.email=t@example.com", "commit", "-q", "-m", "docs")
+    _git(tmp_path, "mv", "docs/guide.md", "docs/handbook.md")
+    _git(tmp_path, "-c", "user.name=t", "-c", "user.email=t@example.com", "commit", "-q", "-m", "rename")
+
+    churn = rollup.collect_documentation_churn(tmp_path, "v0.2.0", "HEAD")
+    assert churn["commits"] == 2
+    assert churn["unique_files_touched"] == 5
+    assert (churn["insertions"], churn["deletions"], churn["net_lines"]) == (4, 0, 4)
+
+
+def test_collect_all_range_stats_matches_per_range_collectors(tmp_path: Path) -> None:
+    _init_tagged_repo(tmp_path)
+    identity = ("-c", "user.name=t", "-c", "user.email=t@example.com")
+
+    def commit(message: str, day: int) -> None:
+        stamp = f"2026-01-{day:02d}T00:00:00Z"
+        env = {**os.environ, "GIT_AUTHOR_DATE": stamp, "GIT_COMMITTER_DATE": stamp}
+        _git(tmp_path, *identity, "commit", "-q", "-m", message, env=env)
+
+    _git(tmp_path, "checkout", "-q", "-b", "maint", "v0.1.0")
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "fix.md").write_text("fix\n", encoding="utf-8")
+    _git(tmp_path, "add", "docs")
+    commit("maint fix", 4)
+    _git(tmp_path, "tag", "v0.2.1")
+    _git(tmp_path, "checkout", "-q", "-")
+    (tmp_path / "README.md").write_text("readme\n", encoding="utf-8")
+    _git(tmp_path, "add", "README.md")
+    commit("readme", 5)
+    _git(tmp_path, *identity, "merge", "-q", "--no-ff", "--no-edit", "maint")
+    (tmp_path / "a.py").write_text("a = 2\n", encoding="utf-8")
+    _git(tmp_path, "add", "a.py")
+    commit("edit", 6)
+    _git(tmp_path, "tag", "v0.3.0")
+
+    tags = rollup.list_tags(tmp_path)
+    assert [tag.name for tag in tags] == ["v0.1.0", "v0.2.0", "v0.2.1", "v0.3.0"]
+    for net_diff_churn in (False, True):
+        for start_idx in range(len(tags)):
+            git_rows, doc_rows = rollup.collect_all_range_stats(
+                tmp_path, tags, start_idx, len(tags) - 1, net_diff_churn=net_diff_churn
+            )
+            for offset, idx in enumerate(range(start_idx, len(tags))):
+                previous = tags[idx - 1].name if idx > 0 else None
+                assert git_rows[offset] == rollup.collect_git_range_stats(
+                    tmp_path, previous, tags[idx].name, net_diff_churn=net_diff_churn
+                )
+                assert doc_rows[offset] == rollup.collect_documentation_churn(tmp_path, previous, tags[idx].name)
+
+
+def test_build_report_stitches_gathered_stages_in_tag_order(tmp_path: Path) -> None:
+    _init_tagged_repo(tmp_path)
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_a.py").write_text("def test_a():\n    pass\n", encoding="utf-8")
+    _git(tmp_path, "add", "tests")
+    _git(tmp_path, "-c", "user.name=t", "-c", "user.email=t@example.com", "commit", "-q", "-m", "tests")
+    _git(tmp_path, "tag", "v0.3.0")
+    tags = rollup.list_tags(tmp_path)
+
+    report = rollup.build_report(
+        repo_root=tmp_path,
+        tags=tags,
+        start_idx=1,
+        end_idx=2,
+        codex_sessions=[],
+        claude_events=[],
+        with_scc=False,
+        with_test_composition=True,
+        prices=rollup.PriceTable(),
+    )
+
+    releases = report["releases"]
+    assert [row["tag"]["name"] for row in releases] == ["v0.2.0", "v0.3.0"]
+    assert list(releases[0]) == [field.name for field in dataclasses.fields(rollup.ReleaseRow)]
+    assert releases[0]["snapshot_delta_vs_prior_release"] is None
+    assert [row["git"]["range"] for row in releases] == ["v0.1.0..v0.2.0", "v0.2.0..v0.3.0"]
+    assert [row["tests"]["test_functions"] for row in releases] == [0, 1]
+    assert [row["scc"] for row in releases] == [{"skipped": True}, {"skipped": True}]
+    assert releases[1]["snapshot_delta_vs_prior_release"]["test_functions"]["delta"] == 1
+    assert report["totals"]["commits"] == 2
+
+
+def test_build_report_collects_snapshots_once_per_tree(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _init_tagged_repo(tmp_path)
+    _git(tmp_path, "tag", "v0.2.1", "v0.2.0")
+    tags = rollup.list_tags(tmp_path)
+    assert rollup.group_refs_by_tree(tmp_path, [tag.name for tag in tags]) == (["v0.1.0", "v0.2.0"], [0, 1, 1])
+
+    collected: list[list[str]] = []
+
+    def fake_snapshots(repo_root: Path, refs: list[str], *, cache: Any) -> list[dict[str, Any]]:
+        collected.append(list(refs))
+        return [{"test_functions": idx} for idx, _ in enumerate(refs)]
+
+    monkeypatch.setattr(rollup, "collect_test_composition_snapshots", fake_snapshots)
+    report = rollup.build_report(
+        repo_root=tmp_path,
+        tags=tags,
+        start_idx=0,
+        end_idx=2,
+        codex_sessions=[],
+        claude_events=[],
+        with_scc=False,
+        with_test_composition=True,
+        prices=rollup.PriceTable(),
+    )
+
+    assert collected == [["v0.1.0", "v0.2.0"]]
+    assert [row["tests"]["test_functions"] for row in report["releases"]] == [0, 1, 1]
+
+
+def test_markdown_table_fallback_aligns_columns(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, "tabulate", None)
+    table = rollup.markdown_table(
+        ["Metric", "N", "C"],
+        [["a", 1000, None], ["bb", 2, "x"]],
+        colalign=["left", "right", "center"],
+    )
+    assert table.splitlines() == [
+        "| Metric |    N |  C   |",
+        "| :----- | ---: | :--: |",
+        "| a      | 1000 | None |",
+        "| bb     |    2 |  x   |",
+    ]
+
+
+def test_collect_scc_snapshot_sums_language_rows(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _init_tagged_repo(repo)
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    rows = [
+        {"Name": "Python", "Count": 2, "Lines": 3, "Code": 3, "Comment": 0, "Blank": 0, "Complexity": 1},
+        {"Name": "Markdown", "Count": "1", "Lines": 5, "Code": 4, "Comment": None, "Blank": 1},
+        "not-a-row",
+    ]
+    scc = bin_dir / "scc"
+    scc.write_text(
+        "#!/bin/sh\n"
+        f"if [ \"$1\" = \"--format\" ]; then echo '{json.dumps(rows)}'; "
+        "else echo 'Estimated Cost to Develop (organic) $1,234'; fi\n",
+        encoding="utf-8",
+    )
+    scc.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+    snapshot = rollup.collect_scc_snapshot(repo, "v0.2.0")
+    assert snapshot["totals"] == {"files": 3, "lines": 8, "code": 7, "comments": 0, "blanks": 1, "complexity": 1}
+    assert snapshot["python"] == {"files": 2, "lines": 3, "code": 3, "comments": 0, "blanks": 0, "complexity": 1}
+    assert snapshot["cocomo"]["estimated_cost_usd"] == 1234
+
+
+def test_is_test_file_name_matches_discovery_patterns() -> None:
+    names = ["test_a.py", "a_test.py", "test_x_test.py", "helper.py", "test_d.txt", "conftest.py"]
+    assert [name for name in names if rollup.is_test_file_name(name)] == ["test_a.py", "a_test.py", "test_x_test.py"]
+
+
+@pytest.mark.parametrize(
+    ("path", "category"),
+    [
+        ("tests/test_Adversarial_inputs.py", "adversarial"),
+        ("tests/ADVERSARIAL/test_x.py", "adversarial"),
+        ("tests/test_e2e.py", "integration"),
+        ("tests/test_sync_Integration.py", "integration"),
+        ("tests/integration/test_plain.py", "unit"),
+        ("tests/test_db.py", "unit"),
+    ],
+)
+def test_classify_test_file(path: str, category: str) -> None:
+    assert rollup.classify_test_file(Path(path)) == category
+
+
+def test_collect_scc_snapshot_uses_single_json2_run(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _init_tagged_repo(repo)
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    summary = {
+        "languageSummary": [{"Name": "Python", "Count": 2, "Lines": 3, "Code": 3, "Comment": 0, "Blank": 0}],
+        "estimatedCost": 1234.9,
+        "estimatedScheduleMonths": 1.234,
+        "estimatedPeople": 0.456,
+    }
+    calls = tmp_path / "calls.log"
+    scc = bin_dir / "scc"
+    scc.write_text(
+        "#!/bin/sh\n"
+        f"echo \"$@\" >> '{calls}'\n"
+        f"if [ \"$2\" = \"json2\" ]; then echo '{json.dumps(summary)}'; else exit 2; fi\n",
+        encoding="utf-8",
+    )
+    scc.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+    snapshot = rollup.collect_scc_snapshot(repo, "v0.2.0")
+    assert snapshot["python"]["files"] == 2
+    assert snapshot["cocomo"] == {
+        "estimated_cost_usd": 1234,
+        "estimated_schedule_months": 1.23,
+        "estimated_people": 0.46,
+    }
+    # One probe run plus one measured run, both json2.
+    assert [line.split()[:2] for line in calls.read_text(encoding="utf-8").splitlines()] == [["--format", "json2"]] * 2
+
+
+def test_collect_test_composition_snapshot_reads_blobs_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _init_tagged_repo(repo)
+    (repo / "tests" / "e2e").mkdir(parents=True)
+    (repo / "tests" / "test_x.py").write_text("def test_a():\n    pass\n", encoding="utf-8")
+    (repo / "tests" / "e2e" / "flow_test.py").write_text("def test_b():\n    pass\n", encoding="utf-8")
+    (repo / "tests" / "test_integration_y.py").write_text("def test_b():\n    pass\n", encoding="utf-8")
+    (repo / "tests" / "helpers.py").write_text("def test_not_collected():\n    pass\n", encoding="utf-8")
+    os.symlink("test_x.py", repo / "tests" / "test_link.py")
+    _git(repo, "add", "tests")
+    _git(repo, "-c", "user.name=t", "-c", "user.email=t@example.com", "commit", "-q", "-m", "tests")
+    monkeypatch.setattr(rollup, "BLOB_TEST_COUNT_CACHE", {})
+    monkeypatch.setattr(rollup, "TREE_TEST_BLOBS_CACHE", {})
+
+    snapshot = rollup.collect_test_composition_snapshot(repo, "HEAD")
+    assert snapshot["test_files"] == 3
+    assert snapshot["test_functions"] == 3
+    assert snapshot["by_category"]["integration"] == {"test_files": 1, "test_functions": 1}
+    assert len(rollup.BLOB_TEST_COUNT_CACHE) == 2  # the two identical files share one blob
+
+    monkeypatch.setattr(rollup, "count_tests_in_source", lambda *args: pytest.fail("blob should be cached"))
+    monkeypatch.setattr(rollup, "run_command", lambda *args, **kwargs: pytest.fail("trees should come from the pipe"))
+    with rollup.GitBatch(repo) as batch:
+        assert rollup.collect_test_composition_snapshot(repo, "HEAD", batch=batch) == snapshot
+    assert rollup.collect_test_composition_snapshot(repo, "v0.1.0")["test_files"] == 0
+
+
+def test_cached_formatters_keep_int_and_float_cells_apart() -> None:
+    assert rollup.fmt_int(1234) == "1,234"
+    assert rollup.fmt_int(1234.0) == "1,234.0"
+    assert rollup.fmt_int(None) == "-"
+    assert rollup.fmt_duration(90061) == "1d 1h 1m"
+    assert rollup.fmt_duration(0) == "0m"
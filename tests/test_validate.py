@@ -7,6 +7,8 @@ Tests cover:
 - Error detection for various integrity issues
 """
 
+import json
+import pyarrow as pa
 import pytest
 from pathlib import Path
 import subprocess
@@ -23,6 +25,14 @@ from validate import (
     ALLOWED_EVIDENCE_LEVELS,
     ALLOWED_PREDICTION_STATUSES,
     ALLOWED_SOURCE_TYPES,
+    PRED_CLAIM_ID_RE,
+    _claim_field_suspects,
+    _claim_ref_suspects,
+    _invalid_probability_ids,
+    _is_json,
+    _normalize_list_fields,
+    _scan_batches,
+    _scan_rows,
 )
 from db import (
     get_db,
@@ -55,6 +65,11 @@ class TestConstants:
         expected = {"[P+]", "[P~]", "[P→]", "[P?]", "[P←]", "[P!]", "[P-]", "[P∅]"}
         assert ALLOWED_PREDICTION_STATUSES == expected
 
+    def test_pred_claim_id_pattern_extracts_ids(self):
+        """predictions.md claim IDs are extracted from bold Claim ID lines only."""
+        text = "- **Claim ID**: TECH-2026-002\n- **Claim ID**:ECON-2025-010\n- Claim ID: GOV-2026-001\n"
+        assert PRED_CLAIM_ID_RE.findall(text) == ["TECH-2026-002", "ECON-2025-010"]
+
 
 class TestDatabaseValidation:
     """Tests for database integrity validation."""
@@ -152,6 +167,107 @@ class TestDatabaseValidation:
         backlink_errors = [f for f in findings if f.code == "SOURCE_CLAIM_NOT_LISTED"]
         assert len(backlink_errors) >= 1
 
+    def test_unlisted_citing_claims_reported_once_each(self, initialized_db, temp_db_path, sample_claim, sample_source):
+        """Only the citing claims missing from claims_extracted are reported, once per claim."""
+        add_claim(sample_claim, initialized_db, generate_embedding=False)
+        second = {**sample_claim, "id": "TECH-2026-002", "source_ids": ["test-source-001", "test-source-001"]}
+        add_claim(second, initialized_db, generate_embedding=False)
+        add_source(sample_source, initialized_db, generate_embedding=False)
+
+        findings = validate_db(temp_db_path)
+
+        not_listed = [f.message for f in findings if f.code == "SOURCE_CLAIM_NOT_LISTED"]
+        assert not_listed == [
+            "test-source-001: claim TECH-2026-002 cites this source but not in claims_extracted"
+        ]
+
+    def test_extracted_claims_without_backlink_reported(self, initialized_db, temp_db_path, sample_claim, sample_source):
+        """Extracted claims that exist but don't cite the source get SOURCE_BACKLINK_MISSING."""
+        add_claim({**sample_claim, "source_ids": []}, initialized_db, generate_embedding=False)
+        add_source({**sample_source, "claims_extracted": ["TECH-2026-001", "TECH-2026-999"]},
+                   initialized_db, generate_embedding=False)
+
+        findings = validate_db(temp_db_path)
+
+        assert [(f.code, f.message) for f in findings if f.code.startswith("SOURCE_")] == [
+            ("SOURCE_BACKLINK_MISSING", "test-source-001: lists TECH-2026-001 but claim doesn't reference this source"),
+            ("SOURCE_CLAIM_MISSING", "test-source-001: claims_extracted references unknown claim 'TECH-2026-999'"),
+        ]
+
+    def test_scan_rows_projects_columns_and_skips_unknown(self, initialized_db, sample_claim):
+        """Table scans return only the requested (existing) columns for every row."""
+        add_claim(sample_claim, initialized_db, generate_embedding=False)
+        add_claim({**sample_claim, "id": "TECH-2026-002"}, initialized_db, generate_embedding=False)
+
+        rows = list(_scan_rows(initialized_db, "claims", ("id", "credence", "no_such_column")))
+
+        assert [row["id"] for row in rows] == ["TECH-2026-001", "TECH-2026-002"]
+        assert all(set(row) == {"id", "credence"} for row in rows)
+
+    def test_failed_table_scan_reports_db_read(self, monkeypatch, initialized_db, temp_db_path):
+        """An error in any of the concurrent table scans surfaces as a single DB_READ finding."""
+        import validate
+
+        def failing_scan(db, table_name, columns):
+            if table_name == "chains":
+                raise RuntimeError("chains unreadable")
+            yield from ()
+
+        monkeypatch.setattr(validate, "_scan_batches", failing_scan)
+
+        findings = validate_db(temp_db_path)
+
+        assert [f.code for f in findings] == ["DB_READ"]
+        assert "chains unreadable" in findings[0].message
+
+    def test_claim_field_suspects_flags_only_failing_claims(self, initialized_db, sample_claim):
+        """The Arrow pre-pass flags claims with bad fields and clears valid ones."""
+        add_claim(sample_claim, initialized_db, generate_embedding=False)
+        add_claim({**sample_claim, "id": "TECH-2026-002", "type": "[Z]"}, initialized_db, generate_embedding=False)
+        add_claim({**sample_claim, "id": "ECON-2026-003"}, initialized_db, generate_embedding=False)
+        good = {**sample_claim, "id": "TECH-2026-004", "embedding": [0.1] * 384}
+        add_claim(good, initialized_db, generate_embedding=False)
+
+        batches = list(_scan_batches(initialized_db, "claims", ("id", "domain", "type", "evidence_level", "embedding")))
+
+        # 001 lacks an embedding, 002 has a bad type, 003 mismatches its domain
+        assert _claim_field_suspects(batches) == {"TECH-2026-001", "TECH-2026-002", "ECON-2026-003"}
+
+    def test_claim_ref_suspects_flags_dangling_references(self, initialized_db, sample_claim):
+        """Flattened list columns map unknown sources and relation targets back to their claims."""
+        add_claim(sample_claim, initialized_db, generate_embedding=False)
+        add_claim({**sample_claim, "id": "TECH-2026-002", "supports": ["TECH-2026-001"]},
+                  initialized_db, generate_embedding=False)
+        add_claim({**sample_claim, "id": "TECH-2026-003", "depends_on": ["TECH-2026-999"]},
+                  initialized_db, generate_embedding=False)
+        add_claim({**sample_claim, "id": "TECH-2026-004", "source_ids": ["missing-source"]},
+                  initialized_db, generate_embedding=False)
+
+        batches = list(_scan_batches(initialized_db, "claims", ("id", "source_ids", "supports", "depends_on")))
+        claim_ids = frozenset({"TECH-2026-001", "TECH-2026-002", "TECH-2026-003", "TECH-2026-004"})
+
+        suspects = _claim_ref_suspects(batches, claim_ids, frozenset({"test-source-001"}))
+
+        assert suspects == {"TECH-2026-003", "TECH-2026-004"}
+
+    def test_invalid_probability_ids_flags_out_of_range_and_missing(self):
+        """Column-wise probability check flags null, NaN and out-of-range values."""
+        batch = pa.record_batch({
+            "id": ["A", "B", "C", "D", "E"],
+            "credence": [0.0, 1.0, None, float("nan"), 1.5],
+        })
+
+        assert _invalid_probability_ids([batch], "credence") == {"C", "D", "E"}
+        assert _invalid_probability_ids([batch], "reliability") == {"A", "B", "C", "D", "E"}
+
+    def test_normalize_list_fields_defaults_empty_lists(self):
+        """Missing, None and empty list fields become () and populated lists are kept."""
+        rows = [{"claims": None}, {}, {"claims": []}, {"claims": ["TECH-2026-001"]}]
+
+        _normalize_list_fields(rows, ("claims",))
+
+        assert [row["claims"] for row in rows] == [(), (), (), ["TECH-2026-001"]]
+
     def test_chain_credence_warning(self, initialized_db, temp_db_path, sample_claim, sample_source, sample_chain):
         """Chain credence exceeding MIN of claims produces warning."""
         add_source(sample_source, initialized_db, generate_embedding=False)
@@ -334,6 +450,23 @@ class TestValidateCLI:
         assert "OK:" in combined
 
 
+    def test_validate_cli_json_output_is_ascii(self, initialized_db, temp_db_path, sample_prediction):
+        """--json escapes non-ASCII finding text, so it prints on any console encoding."""
+        add_prediction({**sample_prediction, "status": "[P\u21c9]"}, initialized_db)
+
+        result = subprocess.run(
+            [sys.executable, "scripts/validate.py", "--db-path", str(temp_db_path), "--json"],
+            capture_output=True,
+            env={**os.environ, "PYTHONIOENCODING": "ascii"},
+            cwd=Path(__file__).parent.parent,
+        )
+
+        assert result.returncode == 1, result.stderr
+        assert result.stdout.isascii()
+        messages = [f["message"] for f in json.loads(result.stdout)["findings"]]
+        assert any("[P\u21c9]" in message for message in messages)
+
+
 class TestFinding:
     """Tests for Finding dataclass."""
 
@@ -427,6 +560,39 @@ class TestAnalysisLogsValidation:
         json_errors = [f for f in findings if f.code == "ANALYSIS_STAGES_INVALID_JSON"]
         assert len(json_errors) >= 1
 
+    @pytest.mark.parametrize("text", [
+        '{"a": 1}', " [1, 2]", "42", '"text"', "null", "NaN", "-Infinity",
+        "not valid json {", "   ", "{broken", "\x0b{}", "<xml/>",
+    ])
+    def test_is_json_matches_json_loads(self, text):
+        """The leading-character probe never changes the verdict of a full parse."""
+        import validate
+
+        try:
+            validate.json_loads(text)
+            expected = True
+        except json.JSONDecodeError:
+            expected = False
+
+        assert _is_json(text) is expected
+
+    def test_json_loads_keeps_stdlib_verdict_when_orjson_rejects(self, monkeypatch):
+        """Input orjson rejects is re-parsed by json.loads, so the verdict never depends on orjson."""
+        import validate
+
+        class RejectingOrjson:
+            JSONDecodeError = json.JSONDecodeError
+
+            @staticmethod
+            def loads(text):
+                raise json.JSONDecodeError("rejected", text, 0)
+
+        monkeypatch.setattr(validate, "orjson", RejectingOrjson)
+
+        assert validate.json_loads('{"a": [1, 2]}') == {"a": [1, 2]}
+        assert _is_json('{"a": NaN}') is True
+        assert _is_json("{broken") is False
+
     def test_analysis_log_negative_duration_detected(self, initialized_db, temp_db_path, sample_source, sample_analysis_log):
         """Negative duration produces error."""
         add_source(sample_source, initialized_db, generate_embedding=False)